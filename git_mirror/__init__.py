@@ -1,6 +1,24 @@
 __all__ = ["GithubRepoManager", "GitlabRepoManager", "PyPiManager", "GitManager"]
 
-from git_mirror.manage_git import GitManager
-from git_mirror.manage_github import GithubRepoManager
-from git_mirror.manage_gitlab import GitlabRepoManager
-from git_mirror.manage_pypi import PyPiManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from git_mirror.manage_git import GitManager
+    from git_mirror.manage_github import GithubRepoManager
+    from git_mirror.manage_gitlab import GitlabRepoManager
+    from git_mirror.manage_pypi import PyPiManager
+
+# Imported on first access, so the cli doesn't load every host library at startup
+_EXPORTS = {
+    "GitManager": "git_mirror.manage_git",
+    "GithubRepoManager": "git_mirror.manage_github",
+    "GitlabRepoManager": "git_mirror.manage_gitlab",
+    "PyPiManager": "git_mirror.manage_pypi",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
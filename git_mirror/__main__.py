@@ -187,6 +187,9 @@ def handle_repos(args: argparse.Namespace) -> None:
         logging_level=args.verbose,
         dry_run=args.dry_run,
         prompt_for_changes=not args.yes,
+        shallow=args.shallow,
+        partial_clone=args.partial_clone,
+        jobs=args.jobs,
     )
 
 
@@ -251,6 +254,31 @@ def pypi_specific_args(parser):
     parser.add_argument("--pypi-owner-name", help="Pypi Owner Name.")
 
 
+def positive_int(value: str) -> int:
+    """
+    Argparse type for counts that must be at least 1.
+
+    Args:
+        value (str): The command line value.
+
+    Returns:
+        int: The value as an int.
+    """
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"{value} is not a whole number") from e
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} must be at least 1")
+    return number
+
+
+def repos_specific_args(parser):
+    parser.add_argument("--shallow", action="store_true", help="Clone only the latest commit.")
+    parser.add_argument("--partial-clone", action="store_true", help="Clone without file contents, fetched on demand.")
+    parser.add_argument("--jobs", type=positive_int, help="Number of repositories to clone, pull or update at once.")
+
+
 def config_specific_args(parser):
     pass
     # config path is global
@@ -332,6 +360,7 @@ def main(
         repos_parser = subparsers.add_parser(command, help=help_text)
         # repos specific args
         host_specific_args(repos_parser, use_github, use_gitlab, use_selfhosted)
+        repos_specific_args(repos_parser)
         global_args(repos_parser)
         # router to handler
         repos_parser.set_defaults(func=handle_repos)
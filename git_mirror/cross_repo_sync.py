@@ -15,9 +15,13 @@ import difflib
 import logging
 import shutil
 import sys
+from collections import Counter
+from functools import wraps
 from pathlib import Path
+from typing import Any, Callable, Optional
 
 from rich.console import Console
+from rich.table import Table
 from rich.text import Text
 
 from git_mirror.ui import console_with_theme
@@ -25,6 +29,51 @@ from git_mirror.ui import console_with_theme
 LOGGER = logging.getLogger(__name__)
 
 
+def summary_table(summary: Counter[str]) -> Table:
+    """
+    Summarizes the differences found by a cross repo report.
+
+    Args:
+        summary (Counter[str]): Number of files for each kind of difference.
+
+    Returns:
+        Table: The summary table.
+    """
+    table = Table(title="Template differences")
+    table.add_column("Difference")
+    table.add_column("Files", justify="right")
+    for difference, count in summary.most_common():
+        table.add_row(difference, str(count))
+    return table
+
+
+def require_template_dir(fn: Callable[..., None]) -> Callable[..., None]:
+    """
+    Decorator for manager methods taking a template directory.
+
+    Reports a missing template directory instead of calling the method, otherwise makes a TemplateSync
+    available as `self._syncer`, reused while the template directory stays the same.
+
+    Args:
+        fn (Callable[..., None]): Method with signature (self, template_dir, ...).
+
+    Returns:
+        Callable[..., None]: The wrapped method.
+    """
+
+    @wraps(fn)
+    def wrapper(self: Any, template_dir: Path, *args: Any, **kwargs: Any) -> None:
+        if not template_dir or not template_dir.exists():
+            console_with_theme().print(f"Template directory {template_dir} does not exist.")
+            return None
+        syncer = getattr(self, "_syncer", None)
+        if syncer is None or syncer.templates_dir != template_dir:
+            self._syncer = TemplateSync(template_dir, use_default=True)
+        return fn(self, template_dir, *args, **kwargs)
+
+    return wrapper
+
+
 class TemplateSync:
     """
     A class to synchronize template directories across multiple target directories, with detailed file comparison.
@@ -42,6 +91,9 @@ class TemplateSync:
         self.default_template = "default"
         self.use_default = use_default
         self.console = console_with_theme()
+        # Every target repo is compared against the same few templates, so read them once.
+        self._template_files: dict[Path, list[Path]] = {}
+        self._template_lines: dict[Path, list[str]] = {}
 
     def read_template_map(self) -> dict[str, str]:
         if not self.template_map_file.exists():
@@ -64,12 +116,14 @@ class TemplateSync:
         missing_dirs = [path for path in target_dirs if path.name not in current_map]
         if not missing_dirs:
             return
+        new_map = dict(current_map)
+        for path in missing_dirs:
+            new_map[path.name] = self.default_template if self.use_default else ""
+        # rewrite the whole map, so the projects already mapped are kept
         with open(self.template_map_file, "w", encoding="utf-8", newline=None) as template_map_handle:
-            for path in missing_dirs:
-                if self.use_default:
-                    template_map_handle.write(f"{path.name}:{self.default_template}\n")
-                else:
-                    template_map_handle.write(f"{path.name}:\n")
+            for project, template in new_map.items():
+                template_map_handle.write(f"{project}:{template}\n")
+        self.template_map = self.read_template_map()
         if not self.use_default:
             self.console.print("Please fill in the template_map.txt file with the correct template for each project.")
             self.console.print(f"File is located at {self.template_map_file}")
@@ -78,6 +132,23 @@ class TemplateSync:
     def get_template_dir(self, project: str) -> Path:
         return self.templates_dir / self.template_map[project]
 
+    def template_files(self, template_dir: Path) -> list[Path]:
+        """
+        Lists the files in a template directory, only walking each template directory once.
+        """
+        if template_dir not in self._template_files:
+            self._template_files[template_dir] = [path for path in template_dir.glob("**/*") if path.is_file()]
+        return self._template_files[template_dir]
+
+    def read_template_lines(self, template: Path) -> list[str]:
+        """
+        Reads the lines of a template file, only reading each template file once.
+        """
+        if template not in self._template_lines:
+            with open(template, encoding="utf-8", newline=None) as template_handle:
+                self._template_lines[template] = template_handle.readlines()
+        return self._template_lines[template]
+
     def report_differences(self, target_dirs: list[Path]) -> None:
         """
         Reports detailed differences between the template directory and each target directory.
@@ -97,7 +168,7 @@ class TemplateSync:
         differences = {}
         for target_path in target_dirs:
             template_dir = self.get_template_dir(target_path.name)
-            LOGGER.info(f"Comparing {template_dir} to {target_path}")
+            LOGGER.info("Comparing %s to %s", template_dir, target_path)
             if target_path.is_file():
                 project_name = target_path.parent.name
             else:
@@ -106,20 +177,31 @@ class TemplateSync:
 
         return differences
 
-    def report_content_differences(self, target_dirs: list[Path]) -> None:
+    def report_content_differences(
+        self, target_dirs: list[Path], progress_callback: Optional[Callable[[], None]] = None
+    ) -> Counter[str]:
         """
         Reports detailed differences between the template directory and each target directory, displaying rich diffs for files with different contents.
+
+        Args:
+            target_dirs (list[Path]): The target directories.
+            progress_callback (Optional[Callable[[], None]]): Called after each target directory is compared.
+
+        Returns:
+            Counter[str]: Number of files for each kind of difference.
         """
         self.write_template_map(target_dirs)
+        summary: Counter[str] = Counter()
         for target_path in target_dirs:
             template_dir = self.get_template_dir(target_path.name)
             if target_path.is_file():
                 project_name = target_path.parent.name
             else:
                 project_name = target_path.name
-            LOGGER.info(f"Comparing {project_name} to {target_path.name}")
+            LOGGER.info("Comparing %s to %s", project_name, target_path.name)
             differences = self._compare_directories(target_path, project_name)
             for diff in differences:
+                summary[diff["difference"]] += 1
                 if diff.get("difference") == "different contents":
                     self._display_diff(template_dir / diff["file"], target_path / diff["file"], project_name)
                 elif diff.get("difference") == "different length":
@@ -130,15 +212,24 @@ class TemplateSync:
                     self.console.print(
                         f"File {template_dir / diff['file']} is missing in {target_path / diff['file']}."
                     )
+            if progress_callback:
+                progress_callback()
+        return summary
 
-    def sync_template(self, target_dirs: list[Path]) -> None:
+    def sync_template(self, target_dirs: list[Path], progress_callback: Optional[Callable[[], None]] = None) -> None:
         """
         Synchronizes the template directory with each target directory.
+
+        Args:
+            target_dirs (list[Path]): The target directories.
+            progress_callback (Optional[Callable[[], None]]): Called after each target directory is synchronized.
         """
         self.write_template_map(target_dirs)
         for target_dir in target_dirs:
             target_path = Path(target_dir)
             self._copy_template(target_path)
+            if progress_callback:
+                progress_callback()
 
     def _compare_directories(self, target_dir: Path, project_name: str = "") -> list[dict[str, str]]:
         """
@@ -146,16 +237,15 @@ class TemplateSync:
         """
         differences = []
         template_dir = self.get_template_dir(target_dir.name)
-        for template_file in template_dir.glob("**/*"):
-            if template_file.is_file():
-                relative_path = template_file.relative_to(template_dir)
-                target_file = target_dir / relative_path
-                if not target_file.exists():
-                    differences.append({"file": str(relative_path), "difference": "missing"})
-                else:
-                    difference = self._compare_files(template_file, target_file, project_name)
-                    if difference:
-                        differences.append({"file": str(relative_path), **difference})
+        for template_file in self.template_files(template_dir):
+            relative_path = template_file.relative_to(template_dir)
+            target_file = target_dir / relative_path
+            if not target_file.exists():
+                differences.append({"file": str(relative_path), "difference": "missing"})
+            else:
+                difference = self._compare_files(template_file, target_file, project_name)
+                if difference:
+                    differences.append({"file": str(relative_path), **difference})
 
         return differences
 
@@ -174,13 +264,10 @@ class TemplateSync:
         return {}
 
     def apply_light_templating(self, target: Path, template: Path, project_name: str) -> tuple[list[str], list[str]]:
-        with (
-            open(template, encoding="utf-8", newline=None) as template_handle,
-            open(target, encoding="utf-8", newline=None) as target_handle,
-        ):
-            template_lines = [
-                line.replace(self.project_name_token, project_name) for line in template_handle.readlines()
-            ]
+        template_lines = [
+            line.replace(self.project_name_token, project_name) for line in self.read_template_lines(template)
+        ]
+        with open(target, encoding="utf-8", newline=None) as target_handle:
             target_lines = target_handle.readlines()
         return target_lines, template_lines
 
@@ -189,13 +276,12 @@ class TemplateSync:
         Copies the template directory to a target directory.
         """
         template_dir = self.get_template_dir(target_dir.name)
-        for template_file in template_dir.glob("**/*"):
-            if template_file.is_file():
-                relative_path = template_file.relative_to(template_dir)
-                target_file = target_dir / relative_path
-                target_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(template_file, target_file)
-                LOGGER.info(f"Copied {template_file} to {target_file}")
+        for template_file in self.template_files(template_dir):
+            relative_path = template_file.relative_to(template_dir)
+            target_file = target_dir / relative_path
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(template_file, target_file)
+            LOGGER.info("Copied %s to %s", template_file, target_file)
 
     def _display_diff(self, template: Path, target: Path, project_name: str) -> None:
         """
@@ -15,6 +15,8 @@ class UpdateBranchArgs:
     github_repo_full_name: str
     prefer_rebase: bool
     lock: ContextManager[Any]
+    # looked up by the caller when it already knows it, saving a request per repo
+    default_branch: Optional[str] = None
 
 
 class SourceHost(Protocol):
@@ -0,0 +1,146 @@
+"""
+Small persistent cache for slow-changing lookups, stored as json in the user cache folder.
+"""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from platformdirs import user_cache_dir
+
+LOGGER = logging.getLogger(__name__)
+
+# Writes are read-modify-write of a whole file, serialize them for callers on worker threads
+_WRITE_LOCK = threading.Lock()
+
+
+def cache_dir() -> Path:
+    """Folder holding the cache files, created on demand."""
+    path = Path(user_cache_dir("git_mirror"))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _cache_file(name: str) -> Path:
+    return cache_dir() / f"{name}.json"
+
+
+def _load(name: str) -> dict[str, Any]:
+    try:
+        with open(_cache_file(name), encoding="utf-8") as file:
+            data = json.load(file)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(name: str, data: dict[str, Any]) -> None:
+    try:
+        with open(_cache_file(name), "w", encoding="utf-8") as file:
+            json.dump(data, file)
+    except (OSError, TypeError) as e:
+        LOGGER.debug("Could not write cache %s: %s", name, e)
+
+
+def read_cache(name: str, key: str, ttl_seconds: float) -> Optional[Any]:
+    """
+    Read a value from the cache if it is younger than the time to live.
+
+    Args:
+        name (str): Name of the cache file, without extension.
+        key (str): Key of the value in the cache.
+        ttl_seconds (float): Maximum age of the value in seconds.
+
+    Returns:
+        Optional[Any]: The cached value or None if missing or expired.
+    """
+    return _fresh_value(name, key, _load(name).get(key), ttl_seconds)
+
+
+def _fresh_value(name: str, key: str, entry: Optional[dict[str, Any]], ttl_seconds: float) -> Optional[Any]:
+    if not entry or time.time() - entry.get("time", 0) > ttl_seconds:
+        return None
+    LOGGER.debug("Cache hit for %s/%s", name, key)
+    return entry.get("value")
+
+
+def write_cache(name: str, key: str, value: Any) -> None:
+    """
+    Write a json serializable value to the cache.
+
+    Args:
+        name (str): Name of the cache file, without extension.
+        key (str): Key of the value in the cache.
+        value (Any): The value to store.
+    """
+    with _WRITE_LOCK:
+        data = _load(name)
+        data[key] = {"time": time.time(), "value": value}
+        _save(name, data)
+
+
+def invalidate_cache(name: str, key: str) -> None:
+    """
+    Remove a value from the cache.
+
+    Args:
+        name (str): Name of the cache file, without extension.
+        key (str): Key of the value in the cache.
+    """
+    with _WRITE_LOCK:
+        data = _load(name)
+        if data.pop(key, None) is not None:
+            _save(name, data)
+
+
+class CacheBatch:
+    """
+    One cache file read once and written back once, for many lookups in a row.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Args:
+            name (str): Name of the cache file, without extension.
+        """
+        self.name = name
+        self.entries = _load(name)
+        self.changes: dict[str, dict[str, Any]] = {}
+
+    def read(self, key: str, ttl_seconds: float) -> Optional[Any]:
+        """
+        Read a value if it is younger than the time to live, see read_cache.
+
+        Args:
+            key (str): Key of the value in the cache.
+            ttl_seconds (float): Maximum age of the value in seconds.
+
+        Returns:
+            Optional[Any]: The cached value or None if missing or expired.
+        """
+        return _fresh_value(self.name, key, self.entries.get(key), ttl_seconds)
+
+    def write(self, key: str, value: Any) -> None:
+        """
+        Set a json serializable value, saved on flush.
+
+        Args:
+            key (str): Key of the value in the cache.
+            value (Any): The value to store.
+        """
+        entry = {"time": time.time(), "value": value}
+        self.entries[key] = entry
+        self.changes[key] = entry
+
+    def flush(self) -> None:
+        """Save the values written since the last flush, keeping what other processes wrote meanwhile."""
+        if not self.changes:
+            return
+        with _WRITE_LOCK:
+            data = _load(self.name)
+            data.update(self.changes)
+            _save(self.name, data)
+        self.changes = {}
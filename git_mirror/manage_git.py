@@ -2,13 +2,17 @@
 Pure git actions.
 """
 
+import hashlib
 import logging
 import multiprocessing
 import os
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any, Optional
 
 import git as g
 
+from git_mirror.disk_cache import read_cache, write_cache
 from git_mirror.performance import log_duration
 from git_mirror.safe_env import load_env
 from git_mirror.ui import console_with_theme
@@ -18,27 +22,110 @@ load_env()
 # Configure logging
 LOGGER = logging.getLogger(__name__)
 
+# How long a remembered list of repositories is trusted, seconds
+REPO_CACHE_TTL = 24 * 60 * 60
 
-def find_git_repos(base_dir: Path) -> list[Path]:
+# How long the branch list of a remote is trusted, seconds
+REMOTE_BRANCH_CACHE_TTL = 60
+
+# Let git's http transport fetch in parallel while cloning
+CLONE_ENV = {"GIT_HTTP_MAX_REQUESTS": "8"}
+
+
+def clone_kwargs(shallow: bool, clone_depth: int, partial_clone: bool) -> dict[str, Any]:
     """
-    Recursively finds all Git repositories in the given base directory using two methods:
-    First, it uses `os.walk`, and then it uses `pathlib.Path.rglob` to ensure no repositories are missed.
+    Extra `git clone` arguments, a mirror rarely needs full history or every blob up front.
 
     Args:
-        base_dir (Path): The base directory to search for Git repositories.
+        shallow (bool): Whether to clone only the most recent history of the default branch.
+        clone_depth (int): Number of commits to clone when shallow.
+        partial_clone (bool): Whether to clone without file contents, fetching them as needed.
 
     Returns:
-        List[Path]: A list of Paths representing the Git repositories found.
+        dict[str, Any]: Keyword arguments for `Repo.clone_from`, empty for a plain clone.
+
+    Examples:
+        >>> clone_kwargs(False, 1, False)
+        {}
+        >>> clone_kwargs(True, 1, True)["multi_options"]
+        ['--depth=1', '--single-branch', '--filter=blob:none']
     """
-    git_repos_set = set()
+    options = []
+    if shallow:
+        options.extend([f"--depth={clone_depth}", "--single-branch"])
+    if partial_clone:
+        # blobs for the checked out commit are still fetched, so the working tree is complete
+        options.append("--filter=blob:none")
+    if not options:
+        return {}
+    return {"multi_options": options, "env": CLONE_ENV}
+
+
+def iter_git_repos(base_dir: Path) -> Iterator[Path]:
+    """
+    Lazily yields Git repositories in the given base directory as the walk finds them.
+
+    The walk does not descend into `.git` folders, which hold most of the files on disk.
+
+    Args:
+        base_dir (Path): The base directory to search for Git repositories.
 
+    Yields:
+        Path: A Git repository found under the base directory.
+    """
     # Rlgob is 2x slower
     for root, dirs, _ in os.walk(base_dir):
         if ".git" in dirs:
-            git_repos_set.add(Path(root))
+            dirs.remove(".git")
+            yield Path(root)
+
+
+def find_git_repos(base_dir: Path) -> list[Path]:
+    """
+    Recursively finds all Git repositories in the given base directory.
+
+    Args:
+        base_dir (Path): The base directory to search for Git repositories.
+
+    Returns:
+        List[Path]: A list of Paths representing the Git repositories found.
+    """
+    return list(iter_git_repos(base_dir))
+
+
+def remember_git_repos(base_dir: Path, repos: list[Path]) -> None:
+    """
+    Saves the repositories found in the base directory, for commands that run again soon after.
 
-    git_repos = list(git_repos_set)
-    return git_repos
+    Args:
+        base_dir (Path): The base directory that was searched.
+        repos (list[Path]): The Git repositories found.
+    """
+    value = {"mtime": base_dir.stat().st_mtime, "repos": [str(repo) for repo in repos]}
+    write_cache("git_repos", str(base_dir.resolve()), value)
+
+
+def find_git_repos_cached(base_dir: Path) -> list[Path]:
+    """
+    Returns the remembered repositories if the base directory hasn't changed, else searches again.
+
+    Only the base directory's own modification time is checked, which changes when a repository
+    is added or removed directly under it.
+
+    Args:
+        base_dir (Path): The base directory to search for Git repositories.
+
+    Returns:
+        List[Path]: A list of Paths representing the Git repositories found.
+    """
+    cached = read_cache("git_repos", str(base_dir.resolve()), REPO_CACHE_TTL)
+    if cached and cached["mtime"] == base_dir.stat().st_mtime:
+        repos = [Path(repo) for repo in cached["repos"]]
+        if all(repo.is_dir() for repo in repos):
+            return repos
+    repos = find_git_repos(base_dir)
+    remember_git_repos(base_dir, repos)
+    return repos
 
 
 def extract_repo_name(remote_url: str) -> str:
@@ -65,6 +152,63 @@ def extract_repo_name(remote_url: str) -> str:
     return repo_name
 
 
+def remote_branch_names(repo: g.Repo) -> Optional[frozenset[str]]:
+    """
+    Lists the branches on origin with a single `git ls-remote`, which doesn't use any API quota.
+
+    Args:
+        repo (g.Repo): The repository object.
+
+    Returns:
+        Optional[frozenset[str]]: The remote branch names, or None if origin couldn't be queried.
+    """
+    try:
+        remote_url = repo.remotes.origin.url
+    except (AttributeError, IndexError):
+        return None
+    # Keyed by a hash, remote urls can hold a token
+    cache_key = hashlib.sha256(remote_url.encode()).hexdigest()
+    cached = read_cache("remote_branches", cache_key, REMOTE_BRANCH_CACHE_TTL)
+    if cached is not None:
+        return frozenset(cached)
+    try:
+        output = repo.git.ls_remote("--heads", "origin")
+    except g.GitCommandError as e:
+        # Neither the url nor git's output is logged, either can hold a token
+        LOGGER.debug("git ls-remote failed for %s with exit status %s", repo.working_dir, e.status)
+        return None
+    prefix = "refs/heads/"
+    branches = sorted(
+        ref[len(prefix) :] for ref in (line.split("\t")[-1] for line in output.splitlines()) if ref.startswith(prefix)
+    )
+    write_cache("remote_branches", cache_key, branches)
+    return frozenset(branches)
+
+
+def delete_local_branches(repo: g.Repo, branches: list[str]) -> dict[str, str]:
+    """
+    Safely deletes local branches with a single `git branch -d` instead of one git process per branch.
+
+    Git deletes every branch it can and fails for the rest, so after a failure the branches
+    still present are the ones that could not be deleted.
+
+    Args:
+        repo (g.Repo): The repository object.
+        branches (list[str]): Names of local branches to delete.
+
+    Returns:
+        dict[str, str]: Error message for each branch that could not be deleted.
+    """
+    if not branches:
+        return {}
+    try:
+        repo.git.branch("-d", *branches)
+        return {}
+    except g.GitCommandError as e:
+        remaining = {head.name for head in repo.heads}
+        return {branch: str(e) for branch in branches if branch in remaining}
+
+
 class GitManager:
     def __init__(
         self,
@@ -95,12 +239,14 @@ class GitManager:
             List[Path]: A list of Paths to the repositories that contain the specified file in their root directory.
         """
         found_repos = []
-        for repo_dir in self.base_dir.iterdir():
-            if repo_dir.is_dir() and (repo_dir / ".git").exists():
-                target_file_path = repo_dir / file_name
-                if target_file_path.exists():
-                    LOGGER.info(f"Found {file_name} in {repo_dir}")
-                    found_repos.append(repo_dir)
+        # scandir entries know if they are folders without another stat call per entry
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git")):
+                    repo_dir = Path(entry.path)
+                    if (repo_dir / file_name).exists():
+                        LOGGER.info("Found %s in %s", file_name, repo_dir)
+                        found_repos.append(repo_dir)
         return found_repos
 
     @log_duration
@@ -137,7 +283,7 @@ class GitManager:
                     conclusion = f"{repo_dir} has uncommitted changes."
                     have_uncommitted = 1
                 else:
-                    LOGGER.debug(f"{repo_dir} has no uncommitted changes.")
+                    LOGGER.debug("%s has no uncommitted changes.", repo_dir)
 
                 if conclusion:
                     console.print(conclusion)
@@ -171,7 +317,7 @@ class GitManager:
                     if sum(1 for _ in ahead_count) > 0:
                         console.print(f"{repo_dir} has unpushed commits on branch {branch}.")
                     else:
-                        LOGGER.info(f"{repo_dir} is up to date with remote on branch {branch}.")
+                        LOGGER.info("%s is up to date with remote on branch %s.", repo_dir, branch)
                 else:
                     console.print(f"{repo_dir} branch {branch} does not track a remote.")
             except g.GitCommandError as e:
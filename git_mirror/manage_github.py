@@ -7,9 +7,16 @@ This should use manage_config, manage_git, manage_pypi for things that are not g
 import asyncio
 import logging
 import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
-from typing import Any, ContextManager, Optional, Union
+from typing import Any, ContextManager, Optional, Union, cast
 
 import git as g
 import github as gh
@@ -18,16 +25,19 @@ import github.NamedUser as ghnu
 import github.Repository as ghr
 import httpx
 import inquirer
+from rich.live import Live
 from rich.panel import Panel
+from rich.progress import Progress
 from rich.table import Table
 from rich.text import Text
 from termcolor import colored
 
 import git_mirror.manage_git as mg
-from git_mirror.cross_repo_sync import TemplateSync
+from git_mirror.cross_repo_sync import TemplateSync, require_template_dir, summary_table
 from git_mirror.custom_types import SourceHost, UpdateBranchArgs
 from git_mirror.dummies import Dummy
-from git_mirror.manage_pypi import PyPiManager, pretty_print_pypi_results
+from git_mirror.manage_pypi import PyPiManager, add_pypi_result_row, pypi_results_table
+from git_mirror.pat_common import cached_user
 from git_mirror.performance import log_duration
 from git_mirror.safe_env import load_env
 from git_mirror.ui import console_with_theme
@@ -37,6 +47,12 @@ load_env()
 # Configure logging
 LOGGER = logging.getLogger(__name__)
 
+# Clones and pulls wait on git and the network, not the CPU
+IO_WORKERS = min(16, (os.cpu_count() or 4) * 4)
+
+# Other conclusions, e.g. skipped or still running, are shown uncolored
+CONCLUSION_COLORS = {"success": "green", "failure": "red", "cancelled": "yellow"}
+
 
 class GithubRepoManager(SourceHost):
     def __init__(
@@ -49,6 +65,10 @@ class GithubRepoManager(SourceHost):
         host_domain: str = "https://github.com",
         dry_run: bool = False,
         prompt_for_changes: bool = True,
+        shallow: bool = False,
+        clone_depth: int = 1,
+        partial_clone: bool = False,
+        jobs: Optional[int] = None,
     ):
         """
         Initializes the RepoManager with a GitHub token and a base directory for cloning repositories.
@@ -62,8 +82,11 @@ class GithubRepoManager(SourceHost):
             host_domain (str): The domain of the GitHub instance.
             dry_run (bool): Whether to perform a dry run.
             prompt_for_changes (bool): Whether to prompt for changes.
+            shallow (bool): Whether to clone only the most recent history of the default branch.
+            clone_depth (int): Number of commits to clone when shallow.
+            partial_clone (bool): Whether to clone without file contents, fetching them as needed.
+            jobs (Optional[int]): Number of repositories to clone, pull or update at once, defaults to IO_WORKERS.
         """
-        # self.client() = gh.Github(token)
         self.token = token
         self.base_dir = base_dir
         # cache user
@@ -74,12 +97,42 @@ class GithubRepoManager(SourceHost):
         self.host_domain = host_domain
         self.dry_run = dry_run
         self.prompt_for_changes = prompt_for_changes
+        self.shallow = shallow
+        self.clone_depth = clone_depth
+        self.partial_clone = partial_clone
+        self.jobs = jobs or IO_WORKERS
+        # cache client, one session for all calls
+        self._client: Optional[gh.Github] = None
+        self._syncer: Optional[TemplateSync] = None
+        # the user's repositories, shared by the commands of one run
+        self._repos_cache: Optional[list[ghr.Repository]] = None
+        self._repos_cache_ts = 0.0
         LOGGER.debug(
             f"GithubRepoManager initialized with user_login: {user_login}, include_private: {include_private}, include_forks: {include_forks}"
         )
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker processes build their own client.
+        state = self.__dict__.copy()
+        state["_client"] = None
+        state["_syncer"] = None
+        state["_repos_cache"] = None
+        return state
+
     def client(self) -> gh.Github:
-        return gh.Github(self.token)
+        if self._client is None:
+            # enough pooled connections for the worker threads
+            self._client = gh.Github(self.token, pool_size=IO_WORKERS)
+        return self._client
+
+    @cached_property
+    def _local_repos(self) -> list[Path]:
+        """Local repositories in the base directory, walked once per manager."""
+        return mg.find_git_repos(self.base_dir)
+
+    def invalidate_local_repos(self) -> None:
+        """Forget the local repositories, so newly cloned ones are found."""
+        self.__dict__.pop("_local_repos", None)
 
     def _thread_safe_repos(self, data: list[ghr.Repository]) -> list[dict[str, Any]]:
         repos = []
@@ -95,29 +148,55 @@ class GithubRepoManager(SourceHost):
             )
         return repos
 
+    def _all_repos(self, max_age: float = 300) -> list[ghr.Repository]:
+        """
+        Fetches all of the user's repositories, reused until the list is older than max_age.
+
+        Args:
+            max_age (float): Seconds before the repositories are fetched again.
+
+        Returns:
+            list[Repository]: The unfiltered repositories.
+        """
+        if self._repos_cache is None or time.monotonic() - self._repos_cache_ts > max_age:
+            if not self.user:
+                self.user = self.client().get_user()
+            self._repos_cache = list(self.user.get_repos())
+            self._repos_cache_ts = time.monotonic()
+        return self._repos_cache
+
+    def _iter_user_repos(self, ignore_users_filters: bool = False) -> Iterator[ghr.Repository]:
+        """
+        Yields the user's repositories from GitHub, optionally including private repositories and forks.
+
+        Args:
+            ignore_users_filters (bool): Whether to yield every repository, e.g. when checking local folders.
+
+        Yields:
+            Repository: The Repository objects that pass the filters.
+        """
+        user_login, include_private, include_forks = self.user_login, self.include_private, self.include_forks
+        for repo in self._all_repos():
+            if ignore_users_filters or (
+                (include_private or not repo.private)
+                and (include_forks or not repo.fork)
+                and repo.owner.login == user_login
+            ):
+                yield repo
+
     def _get_user_repos(self, ignore_users_filters: bool = False) -> list[ghr.Repository]:
         """
         Fetches the user's repositories from GitHub, optionally including private repositories and forks.
 
+        Args:
+            ignore_users_filters (bool): Whether to return every repository, e.g. when checking local folders.
+
         Returns:
             list[Repository]: A list of Repository objects.
         """
         console = console_with_theme()
-        if not self.user:
-            self.user = self.client().get_user()
-
         try:
-            repos = []
-            for repo in self.user.get_repos():
-                # ignore user's filters when checking if something local isn't a remote repo.
-                if ignore_users_filters or (
-                    (self.include_private or not repo.private)
-                    and (self.include_forks or not repo.fork)
-                    and repo.owner.login == self.user_login
-                ):
-                    repos.append(repo)
-
-            return repos
+            return list(self._iter_user_repos(ignore_users_filters))
         except gh.GithubException as e:
             console.print(f"Failed to fetch repositories: {e}", style="danger")
             return []
@@ -144,13 +223,12 @@ class GithubRepoManager(SourceHost):
             for repo in self._thread_safe_repos(repos):
                 self._clone_repo((repo, Dummy()))
         else:
-            with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
-                manager = multiprocessing.Manager()
-                lock = manager.Lock()
-                results = pool.map(self._clone_repo, [(repo, lock) for repo in self._thread_safe_repos(repos)])
-                for output in results:
-                    if output:
-                        console.print(output, end="")
+            lock = threading.Lock()
+            work_load = [(repo, lock) for repo in self._thread_safe_repos(repos)]
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                # list() so exceptions from workers surface here
+                list(executor.map(self._clone_repo, work_load))
+        self.invalidate_local_repos()
 
     def _clone_repo(self, repo_args: tuple[dict[str, Any], ContextManager[Any]]) -> None:
         """
@@ -158,9 +236,6 @@ class GithubRepoManager(SourceHost):
 
         Args:
             repo_args (tuple[dict[str, Any], ContextManager[Any]]): A tuple containing the repository data and a lock.
-
-        Returns:
-        str: The captured print output.
         """
         console = console_with_theme()
         repo, lock = repo_args
@@ -170,7 +245,11 @@ class GithubRepoManager(SourceHost):
                     message = f"Cloning {repo['html_url']} into {self.base_dir}"
                     with lock:
                         console.print(message)
-                    g.Repo.clone_from(f"{repo['html_url']}.git", self.base_dir / repo["name"])
+                    g.Repo.clone_from(
+                        f"{repo['html_url']}.git",
+                        self.base_dir / repo["name"],
+                        **mg.clone_kwargs(self.shallow, self.clone_depth, self.partial_clone),
+                    )
                 else:
                     message = f"Would have cloned {repo['html_url']} into {self.base_dir}"
                     with lock:
@@ -187,19 +266,15 @@ class GithubRepoManager(SourceHost):
     @log_duration
     def pull_all(self, single_threaded: bool = False):
         console = console_with_theme()
-        directories = mg.find_git_repos(self.base_dir)
+        directories = self._local_repos
         console.print(f"Pulling {len(directories)} repositories.")
         if single_threaded or len(directories) < 4:
             for repo_dir in directories:
                 self.pull_repo((repo_dir, Dummy()))
         else:
-            with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
-                manager = multiprocessing.Manager()
-                lock = manager.Lock()
-                results = pool.map(self.pull_repo, ((repo_dir, lock) for repo_dir in directories))
-                for output in results:
-                    if output:
-                        console.print(output, end="")
+            lock = threading.Lock()
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                list(executor.map(self.pull_repo, [(repo_dir, lock) for repo_dir in directories]))
 
     @log_duration
     def pull_repo(self, args: tuple[Path, ContextManager[Any]]) -> None:
@@ -208,19 +283,16 @@ class GithubRepoManager(SourceHost):
 
         Args:
             args (tuple[Path, ContextManager[Any]]): A tuple containing the path to the repository and a lock.
-
-        Returns:
-            str: The captured print output.
         """
         console = console_with_theme()
         repo_path, lock = args
         try:
             repo = g.Repo(repo_path)
-            origin = repo.remotes.origin
             if not self.dry_run:
                 with lock:
                     console.print(f"Pulling latest changes in {repo_path}")
-                origin.pull()
+                # porcelain git, GitPython's pull would parse every fetched ref into Python objects
+                repo.git.pull("--ff-only", "--quiet", "origin")
             else:
                 with lock:
                     console.print(f"Would have pulled latest changes in {repo_path}")
@@ -243,7 +315,7 @@ class GithubRepoManager(SourceHost):
         not_found = 0
         is_fork = 0
         not_repo = 0
-        repos = mg.find_git_repos(self.base_dir)
+        repos = self._local_repos
         console.print(f"Checking {len(repos)} repositories for stray, non-repo subfolders in {self.base_dir}.")
         for repo_dir in repos:
             if repo_dir.is_dir():
@@ -255,7 +327,7 @@ class GithubRepoManager(SourceHost):
                         console.print(f"{repo_dir} has no remote repositories defined.")
                         continue
 
-                    remote_url = remotes[0].config_reader.get("url")
+                    remote_url = remotes[0].url
                     repo_name = mg.extract_repo_name(remote_url)
 
                     if repo_name not in user_repos:
@@ -287,33 +359,29 @@ class GithubRepoManager(SourceHost):
         messages = []
         repos = self._get_user_repos()
         console.print(f"Checking {len(repos)} repositories for build statuses.")
-        for repo in repos:
+        # One request per repository, so fetch concurrently and print in order afterwards
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            all_runs = list(executor.map(self._fetch_latest_runs, repos))
+        for repo, runs in zip(repos, all_runs):
             console.print(f"Repository: {repo.name}")
-            statuses = repo.get_workflow_runs()
-            messages.extend(self._loop_actions(statuses))
+            messages.extend(self._loop_actions(runs))
         return messages
 
+    def _fetch_latest_runs(self, repo: ghr.Repository) -> list[Any]:
+        # Only the first page is requested, the newest run comes first. PyGithub sets the page size
+        # client wide, so instead leave out the pull request details that aren't shown.
+        return list(islice(repo.get_workflow_runs(exclude_pull_requests=True), 1))
+
     def _loop_actions(self, statuses) -> list[tuple[str, str]]:
         console = console_with_theme()
         actions_per_repo = 1
-        status_count = 0
         messages = []
-        for action in statuses:
-            if status_count >= actions_per_repo:
-                break
-            status_count += 1
-
+        for action in islice(statuses, actions_per_repo):
             status_message = f"Date: {action.created_at} - {action.display_title} - Conclusion - {action.conclusion}  Status: {action.status} - URL: {action.html_url}"
             conclusion = (action.conclusion or "").lower()
             messages.append((conclusion, status_message))
-            if conclusion == "success":
-                console.print(colored(status_message, "green"))
-            elif conclusion == "failure":
-                console.print(colored(status_message, "red"))
-            elif conclusion == "cancelled":
-                console.print(colored(status_message, "yellow"))
-            else:
-                console.print(status_message)  # Default, no color
+            color = CONCLUSION_COLORS.get(conclusion)
+            console.print(colored(status_message, color) if color else status_message)
         return messages
 
     @log_duration
@@ -326,22 +394,24 @@ class GithubRepoManager(SourceHost):
         if pypi_owner_name:
             pypi_owner_name = pypi_owner_name.strip().lower()
 
-        async def get_infos_async(package_names):
-            pypi_manager = PyPiManager()
-            return await pypi_manager.get_infos(package_names)
-
-        package_names = [path.name for path in mg.find_git_repos(self.base_dir)]
-        package_infos = asyncio.run(get_infos_async(package_names))
-
-        repos = mg.find_git_repos(self.base_dir)
+        repos = self._local_repos
         console.print(f"Checking {len(repos)} repositories for PyPI publish status.")
+        # One pass over the local repos, so each is opened once and only git repos are looked up on pypi
+        entries = {}
         for repo_dir in repos:
             if repo_dir.is_dir():
                 try:
-                    repo = g.Repo(repo_dir)
-                    package_name = repo_dir.name  # Assuming the repo name is the package name
+                    entries[repo_dir.name] = (repo_dir, g.Repo(repo_dir))
+                except g.InvalidGitRepositoryError:
+                    LOGGER.warning(f"{repo_dir} is not a valid Git repository.")
+        table = pypi_results_table()
 
-                    pypi_data, status_code = package_infos[package_name]
+        async def stream_results() -> None:
+            pypi_manager = PyPiManager()
+            # Assuming the repo name is the package name
+            async for package_name, (pypi_data, status_code) in pypi_manager.iter_infos(list(entries)):
+                repo_dir, repo = entries[package_name]
+                try:
                     any_owner_is_fine = pypi_owner_name is None
                     i_am_owner = pypi_owner_name == pypi_data.get("info", {}).get("author", "").strip().lower()
 
@@ -351,22 +421,25 @@ class GithubRepoManager(SourceHost):
                         repo_last_commit_date = self._get_latest_commit_date(repo)
                         days_difference = (pypi_release_date - repo_last_commit_date).days
 
-                        results.append(
-                            {
-                                "Package": package_name,
-                                "On PyPI": "Yes",
-                                "Pypi Owner": pypi_data.get("info", {}).get("author"),
-                                "Repo last change date": repo_last_commit_date.date(),
-                                "PyPI last change date": pypi_release_date.date(),
-                                "Days difference": days_difference,
-                            }
-                        )
-                except g.InvalidGitRepositoryError:
-                    LOGGER.warning(f"{repo_dir} is not a valid Git repository.")
+                        result = {
+                            "Package": package_name,
+                            "On PyPI": "Yes",
+                            "Pypi Owner": pypi_data.get("info", {}).get("author"),
+                            "Repo last change date": repo_last_commit_date.date(),
+                            "PyPI last change date": pypi_release_date.date(),
+                            "Days difference": days_difference,
+                        }
+                        results.append(result)
+                        add_pypi_result_row(table, result)
                 except Exception as e:
                     LOGGER.error(f"Error checking {repo_dir}: {e}")
-        print()
-        console.print(pretty_print_pypi_results(results))
+                finally:
+                    # don't keep a git cat-file process alive for every repo until the end
+                    repo.close()
+
+        # rows show up as PyPI answers, instead of all at once after the slowest lookup
+        with Live(table, console=console, refresh_per_second=8):
+            asyncio.run(stream_results())
         return results
 
     @classmethod
@@ -380,8 +453,8 @@ class GithubRepoManager(SourceHost):
         Returns:
             datetime: The datetime of the latest commit.
         """
-        last_commit = next(repo.iter_commits())
-        return datetime.fromtimestamp(last_commit.committed_date)
+        # Just HEAD's commit time from git, no Commit object and no persistent cat-file process
+        return datetime.fromtimestamp(int(repo.git.log("-1", "--format=%ct")))
 
     @log_duration
     def list_repo_names(self) -> list[str]:
@@ -433,26 +506,29 @@ class GithubRepoManager(SourceHost):
         """
         console = console_with_theme()
         try:
-            user = self.client().get_user(self.user_login)
+            # A token checked during setup a moment ago already fetched its own profile
+            user = cached_user("github", self.token)
+            if not user or user.get("login") != self.user_login:
+                user = self.client().get_user(self.user_login).raw_data
             summary = Text.assemble(
                 ("Username: ", "bold cyan"),
-                f"{user.login}\n",
+                f"{user.get('login')}\n",
                 ("Name: ", "bold cyan"),
-                f"{user.name}\n",
+                f"{user.get('name')}\n",
                 ("Bio: ", "bold cyan"),
-                f"{user.bio or 'No bio available'}\n",
+                f"{user.get('bio') or 'No bio available'}\n",
                 ("Public Repositories: ", "bold cyan"),
-                f"{user.public_repos}\n",
+                f"{user.get('public_repos')}\n",
                 ("Followers: ", "bold cyan"),
-                f"{user.followers}\n",
+                f"{user.get('followers')}\n",
                 ("Following: ", "bold cyan"),
-                f"{user.following}\n",
+                f"{user.get('following')}\n",
                 ("Location: ", "bold cyan"),
-                f"{user.location or 'Not specified'}\n",
+                f"{user.get('location') or 'Not specified'}\n",
                 ("Company: ", "bold cyan"),
-                f"{user.company or 'Not specified'}",
+                f"{user.get('company') or 'Not specified'}",
             )
-            console.print(Panel(summary, title="GitHub User Summary", subtitle=user.login))
+            console.print(Panel(summary, title="GitHub User Summary", subtitle=user.get("login")))
         except gh.GithubException as e:
             console.print(f"An error occurred: {e}", style="bold red")
 
@@ -466,23 +542,28 @@ class GithubRepoManager(SourceHost):
             prefer_rebase (bool): Whether to prefer rebasing instead of merging.
         """
         console = console_with_theme()
-        directories = mg.find_git_repos(self.base_dir)
+        directories = self._local_repos
         console.print(f"Merging/rebasing {len(directories)} main to local repositories.")
+        # The repository listing already has the default branches, one request per page instead of one per repo
+        default_branches = {repo.name: repo.default_branch for repo in self._get_user_repos(ignore_users_filters=True)}
         if single_threaded or len(directories) < 4:
             for repo_dir in directories:
-                self._update_local_branches(UpdateBranchArgs(repo_dir, repo_dir.name, prefer_rebase, Dummy()))
+                default_branch = default_branches.get(repo_dir.name)
+                args = UpdateBranchArgs(repo_dir, repo_dir.name, prefer_rebase, Dummy(), default_branch)
+                self._update_local_branches(args)
         else:
             with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
                 manager = multiprocessing.Manager()
                 lock = manager.Lock()
-                results = pool.map(
+                pool.map(
                     self._update_local_branches,
-                    (UpdateBranchArgs(repo_dir, repo_dir.name, prefer_rebase, lock) for repo_dir in directories),
+                    [
+                        UpdateBranchArgs(
+                            repo_dir, repo_dir.name, prefer_rebase, lock, default_branches.get(repo_dir.name)
+                        )
+                        for repo_dir in directories
+                    ],
                 )
-                for output in results:
-                    if output:
-                        if output:
-                            console.print(output, end="")
 
     # def _update_local_branches(self, repo_path: Path, github_repo_full_name: str, prefer_rebase: bool = False):
     def _update_local_branches(self, args: UpdateBranchArgs):
@@ -496,13 +577,17 @@ class GithubRepoManager(SourceHost):
         repo_path, github_repo_full_name, prefer_rebase = args.repo_path, args.github_repo_full_name, args.prefer_rebase
         github_repo_full_name = self.user_login + "/" + github_repo_full_name
         repo = g.Repo(str(repo_path))
-        try:
-            github_repo = self.client().get_repo(github_repo_full_name)
-        except gh.GithubException as e:
-            console.print(f"Failed to retrieve info on GitHub repository {github_repo_full_name}: {e}", style="danger")
-            return
-        # Get the default branch name from GitHub
-        default_branch = github_repo.default_branch
+        # Get the default branch name from GitHub, unless the caller already looked it up
+        default_branch = args.default_branch
+        if default_branch is None:
+            try:
+                github_repo = self.client().get_repo(github_repo_full_name)
+            except gh.GithubException as e:
+                console.print(
+                    f"Failed to retrieve info on GitHub repository {github_repo_full_name}: {e}", style="danger"
+                )
+                return
+            default_branch = github_repo.default_branch
 
         # Fetch all changes from remote
         origin = repo.remotes.origin
@@ -539,7 +624,7 @@ class GithubRepoManager(SourceHost):
         Prunes all local branches that have been deleted on GitHub.
         """
         console = console_with_theme()
-        repos = mg.find_git_repos(self.base_dir)
+        repos = self._local_repos
         console.print(f"Ready to Pruning {len(repos)} repositories of branches no longer on remote.")
         if self.prompt_for_changes:
             answer = inquirer.prompt(
@@ -567,14 +652,17 @@ class GithubRepoManager(SourceHost):
         except g.InvalidGitRepositoryError:
             console.print(f"{repo_path} is not a valid Git repository.", style="danger")
             return
-        try:
-            github_repo = self.client().get_repo(github_repo_full_name)
-        except gh.GithubException as e:
-            console.print(f"Failed to retrieve info on GitHub repository {github_repo_full_name}: {e}", style="danger")
-            return
-
-        # Get a list of all branch names on GitHub
-        remote_branches = [branch.name for branch in github_repo.get_branches()]
+        # Get a list of all branch names on GitHub, the API is only needed if git can't reach origin
+        remote_branches = mg.remote_branch_names(repo)
+        if remote_branches is None:
+            try:
+                github_repo = self.client().get_repo(github_repo_full_name)
+            except gh.GithubException as e:
+                console.print(
+                    f"Failed to retrieve info on GitHub repository {github_repo_full_name}: {e}", style="danger"
+                )
+                return
+            remote_branches = frozenset(branch.name for branch in github_repo.get_branches())
 
         # Get a list of all local branch names
         local_branches = [branch.name for branch in repo.heads]  # alias to branches
@@ -586,32 +674,39 @@ class GithubRepoManager(SourceHost):
             console.print(f"For {github_repo_full_name}, no local branches exist that are missing on GitHub.")
             return
 
-        # Prompt user for each branch that doesn't exist on GitHub
-        for branch in branches_to_consider:
-            if self.prompt_for_changes:
-                question = [
-                    inquirer.Confirm(
-                        "delete",
-                        message=f"The branch '{branch}' does not exist on GitHub. Delete locally?",
-                        default=False,
+        # One checkbox prompt for all the branches that don't exist on GitHub
+        branches_to_delete = branches_to_consider
+        if self.prompt_for_changes:
+            answer = inquirer.prompt(
+                [
+                    inquirer.Checkbox(
+                        "to_delete",
+                        message=f"Select branches in {github_repo_full_name} missing on GitHub to delete locally",
+                        choices=branches_to_consider,
                     )
                 ]
-                answer = inquirer.prompt(question)
-
-                if not answer["delete"]:
+            )
+            selected = set(answer["to_delete"]) if answer else set()
+            branches_to_delete = [branch for branch in branches_to_consider if branch in selected]
+            for branch in branches_to_consider:
+                if branch not in selected:
                     console.print(f"Skipped deletion of branch '{branch}'.")
-                    continue
-            try:
-                if not self.dry_run:
-                    # Safely delete the branch
-                    repo.git.branch("-d", branch)
-                    console.print(f"Deleted branch '{branch}' locally.")
-                else:
-                    console.print(f"Would have deleted branch '{branch}' locally.")
-            except g.exc.GitCommandError as e:
+
+        if self.dry_run:
+            for branch in branches_to_delete:
+                console.print(f"Would have deleted branch '{branch}' locally.")
+            return
+
+        # Safely delete the branches
+        errors = mg.delete_local_branches(repo, branches_to_delete)
+        for branch in branches_to_delete:
+            if branch in errors:
                 console.print(
-                    f"Could not delete branch '{branch}'. It may not be fully merged. Error: {e}", style="danger"
+                    f"Could not delete branch '{branch}'. It may not be fully merged. Error: {errors[branch]}",
+                    style="danger",
                 )
+            else:
+                console.print(f"Deleted branch '{branch}' locally.")
 
     @log_duration
     def version_info(self) -> dict[str, Any]:
@@ -626,41 +721,38 @@ class GithubRepoManager(SourceHost):
         return {"version": versions_supported}
 
     @log_duration
+    @require_template_dir
     def cross_repo_sync_report(self, template_dir: Path) -> None:
         """
         Reports differences between the template directory and the target directories.
         """
         console = console_with_theme()
-        if not template_dir or not template_dir.exists():
-            console.print(f"Template directory {template_dir} does not exist.")
-            return
         # right now just the easy case of all repos need to match 1 template_dir
         console.print("Reporting differences between the template directory and the target directories.")
-        syncer = TemplateSync(template_dir)
-        directories = mg.find_git_repos(self.base_dir)
-        console.print(f"Found {len(directories)} repositories.")
-        syncer.report_content_differences(directories)
+        syncer = cast(TemplateSync, self._syncer)
+        directories = self._local_repos
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task(f"Comparing {len(directories)} repositories", total=len(directories))
+            summary = syncer.report_content_differences(directories, lambda: progress.advance(task))
+        console.print(summary_table(summary))
 
     @log_duration
+    @require_template_dir
     def cross_repo_init(self, template_dir: Path) -> None:
         console = console_with_theme()
-        if not template_dir or not template_dir.exists():
-            console.print(f"Template directory {template_dir} does not exist.")
-            return
-        syncer = TemplateSync(template_dir, use_default=True)
-        directories = mg.find_git_repos(self.base_dir)
+        syncer = cast(TemplateSync, self._syncer)
+        directories = self._local_repos
         console.print(f"Found {len(directories)} repositories.")
         syncer.write_template_map(directories)
+        mg.remember_git_repos(self.base_dir, directories)
         console.print(f"Initialized template map for {len(directories)} repositories.")
 
     @log_duration
+    @require_template_dir
     def cross_repo_sync(self, template_dir: Path) -> None:
         console = console_with_theme()
-        if not template_dir or not template_dir.exists():
-            console.print(f"Template directory {template_dir} does not exist.")
-            return
-        syncer = TemplateSync(template_dir, use_default=True)
-        directories = mg.find_git_repos(self.base_dir)
+        syncer = cast(TemplateSync, self._syncer)
+        directories = mg.find_git_repos_cached(self.base_dir)
         console.print(f"Found {len(directories)} repositories.")
         if self.prompt_for_changes:
             answer = inquirer.prompt(
@@ -669,7 +761,9 @@ class GithubRepoManager(SourceHost):
             if not answer["sync"]:
                 console.print("Sync cancelled.")
                 return
-        syncer.sync_template(directories)
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task(f"Synchronizing {len(directories)} repositories", total=len(directories))
+            syncer.sync_template(directories, lambda: progress.advance(task))
         console.print(f"Synchronized {len(directories)} repositories with the template directory.")
 
     @log_duration
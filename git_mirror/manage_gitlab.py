@@ -6,28 +6,39 @@ This should use manage_config, manage_git, manage_pypi for things that are not g
 
 import asyncio
 import logging
-import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
 from typing import Any, ContextManager, Optional, Union, cast
 
 import git as g
 import gitlab
 import inquirer
-from gitlab.base import RESTObject, RESTObjectList
+import requests
+from gitlab.base import RESTObject
 from gitlab.v4.objects import Project
+from requests.adapters import HTTPAdapter, Retry
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress
 from rich.table import Table
 from rich.text import Text
 from termcolor import colored
 
 import git_mirror.manage_git as mg
-from git_mirror.cross_repo_sync import TemplateSync
+from git_mirror.cross_repo_sync import TemplateSync, require_template_dir, summary_table
 from git_mirror.custom_types import SourceHost, UpdateBranchArgs
+from git_mirror.disk_cache import invalidate_cache, read_cache, write_cache
 from git_mirror.dummies import Dummy
 from git_mirror.manage_pypi import PyPiManager
 from git_mirror.performance import log_duration
+from git_mirror.rate_limit import bucket_for
 from git_mirror.safe_env import load_env
 from git_mirror.ui import console_with_theme
 
@@ -37,6 +48,57 @@ load_env()
 # Configure logging
 LOGGER = logging.getLogger(__name__)
 
+# Version and project metadata rarely change, seconds
+VERSION_CACHE_TTL = 24 * 60 * 60
+PROJECT_CACHE_TTL = 60 * 60
+
+# Largest page size the Gitlab API allows, to keep pagination round trips down
+PER_PAGE = 100
+# Keyset pagination stays cheap on the server for deep pages, /projects supports it when ordered by id
+KEYSET_PAGINATION: dict[str, Union[str, int]] = {
+    "pagination": "keyset",
+    "order_by": "id",
+    "sort": "asc",
+    "per_page": PER_PAGE,
+}
+
+# Offset pages ordered by id, so pages fetched concurrently don't shift under each other
+OFFSET_PAGINATION: dict[str, Union[str, int]] = {"order_by": "id", "sort": "asc", "per_page": PER_PAGE}
+# Offset pages cost the server more the deeper they are, past this many switch to keyset pagination
+MAX_OFFSET_PAGES = 20
+
+# Clones, pulls and merges wait on git and the network, not the CPU
+IO_WORKERS = min(16, (os.cpu_count() or 4) * 4)
+
+# Kept connections per host, the default of 10 would make IO_WORKERS threads queue for a socket
+HTTP_POOL_SIZE = 32
+# Connection errors and gateway hiccups are retried with backoff. 429s are left to python-gitlab, which honors
+# Retry-After, and the last response is returned so python-gitlab raises its usual errors.
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+
+# Both spellings of cancelled, to be safe
+PIPELINE_STATUS_COLORS = {
+    "passed": "green",
+    "success": "green",
+    "failed": "red",
+    "canceled": "yellow",
+    "cancelled": "yellow",
+    "running": "blue",
+    "pending": "blue",
+}
+
+
+class RateLimitedGitlab(gitlab.Gitlab):
+    """
+    Gitlab client that takes a token from the host's bucket before each API request.
+
+    Retry-After on 429 responses is already handled by python-gitlab.
+    """
+
+    def http_request(self, *args: Any, **kwargs: Any) -> requests.Response:
+        bucket_for(self.url).acquire()
+        return super().http_request(*args, **kwargs)
+
 
 class GitlabRepoManager(SourceHost):
     def __init__(
@@ -51,6 +113,10 @@ class GitlabRepoManager(SourceHost):
         logging_level: int = 1,
         dry_run: bool = False,
         prompt_for_changes: bool = True,
+        shallow: bool = False,
+        clone_depth: int = 1,
+        partial_clone: bool = False,
+        jobs: Optional[int] = None,
     ):
         """
         Initializes the RepoManager with a GitLab token and a base directory for cloning repositories.
@@ -66,6 +132,10 @@ class GitlabRepoManager(SourceHost):
             logging_level (int): The logging level.
             dry_run (bool): Whether the operation should be a dry run.
             prompt_for_changes (bool): Whether to prompt for confirmation before making changes.
+            shallow (bool): Whether to clone only the most recent history of the default branch.
+            clone_depth (int): Number of commits to clone when shallow.
+            partial_clone (bool): Whether to clone without file contents, fetching them as needed.
+            jobs (Optional[int]): Number of repositories to clone, pull or update at once, defaults to IO_WORKERS.
         """
         self.token = token
         self.host_domain = host_domain
@@ -78,9 +148,51 @@ class GitlabRepoManager(SourceHost):
         self.verbose_logging = logging_level
         self.dry_run = dry_run
         self.prompt_for_changes = prompt_for_changes
+        self.shallow = shallow
+        self.clone_depth = clone_depth
+        self.partial_clone = partial_clone
+        self.jobs = jobs or IO_WORKERS
+        # cache client, one session for all calls
+        self._client: Optional[gitlab.Gitlab] = None
+        self._syncer: Optional[TemplateSync] = None
+        # owned projects by path, shared by every lookup in one command
+        self._projects_cache: Optional[dict[str, Project]] = None
+        self._projects_cache_ts = 0.0
+        # worker threads that miss the cache at the same time wait for one listing instead of each starting one
+        self._projects_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker processes build their own client.
+        state = self.__dict__.copy()
+        state["_client"] = None
+        state["_syncer"] = None
+        del state["_projects_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._projects_lock = threading.Lock()
 
     def client(self) -> gitlab.Gitlab:
-        the_client = gitlab.Gitlab(self.host_domain, private_token=self.token)
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    @cached_property
+    def _local_repos(self) -> list[Path]:
+        """Local repositories in the base directory, walked once per manager."""
+        return mg.find_git_repos(self.base_dir)
+
+    def invalidate_local_repos(self) -> None:
+        """Forget the local repositories, so newly cloned ones are found."""
+        self.__dict__.pop("_local_repos", None)
+
+    def _build_client(self) -> gitlab.Gitlab:
+        the_client = RateLimitedGitlab(self.host_domain, private_token=self.token)
+        # requests already asks for gzip and keeps connections alive, the pool just needs to be big enough
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+        the_client.session.mount("https://", adapter)
+        the_client.session.mount("http://", adapter)
         if self.verbose_logging >= 2:
             the_client.enable_debug()
         return the_client
@@ -98,6 +210,69 @@ class GitlabRepoManager(SourceHost):
             )
         return repos
 
+    def _all_projects(self, max_age: float = 300) -> dict[str, Project]:
+        """
+        Fetches all projects owned by the user in one paginated list, reused until it is older than max_age.
+
+        Args:
+            max_age (float): Seconds before the projects are fetched again.
+
+        Returns:
+            dict[str, Project]: The projects keyed by path.
+        """
+        with self._projects_lock:
+            if self._projects_cache is None or time.monotonic() - self._projects_cache_ts > max_age:
+                # The list payload already has namespace and forked_from_project, no need to get each project.
+                # The namespace, visibility and fork filters stay client side, not_repo and prune need the
+                # unfiltered list and one shared listing is cheaper than one narrowed listing per command.
+                projects = self._list_projects(owned=True)
+                self._projects_cache = {project.path: project for project in projects}
+                self._projects_cache_ts = time.monotonic()
+            return self._projects_cache
+
+    def _list_projects(self, **kwargs: Any) -> list[Project]:
+        """
+        Lists projects, fetching the pages after the first one concurrently.
+
+        Args:
+            **kwargs: Filters passed on to the projects API.
+
+        Returns:
+            list[Project]: The projects from every page.
+        """
+        manager = self.client().projects
+        first_page = manager.list(iterator=True, **OFFSET_PAGINATION, **kwargs)
+        total_pages = first_page.total_pages
+        if total_pages is None or total_pages > MAX_OFFSET_PAGES:
+            # Gitlab leaves out the page count for very large results, keyset pagination stays cheap there
+            return cast(list[Project], list(manager.list(iterator=True, **KEYSET_PAGINATION, **kwargs)))
+        projects = cast(list[Project], list(islice(first_page, PER_PAGE)))
+        if total_pages > 1:
+
+            def get_page(page: int) -> list[Project]:
+                return cast(list[Project], manager.list(page=page, get_all=False, **OFFSET_PAGINATION, **kwargs))
+
+            with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+                for page_projects in executor.map(get_page, range(2, total_pages + 1)):
+                    projects.extend(page_projects)
+        return projects
+
+    def _iter_user_repos(self) -> Iterator[Project]:
+        """
+        Yields the user's repositories from GitLab, optionally including private repositories and forks.
+
+        Yields:
+            gitlab.v4.objects.Project: The Project objects that pass the filters.
+        """
+        user_login, include_private, include_forks = self.user_login, self.include_private, self.include_forks
+        for project in self._all_projects().values():
+            if (
+                (include_private or project.visibility == "public")
+                and (include_forks or not getattr(project, "forked_from_project", None))
+                and project.namespace["path"] == user_login
+            ):
+                yield project
+
     def _get_user_repos(self) -> list[Project]:
         """
         Fetches the user's repositories from GitLab, optionally including private repositories and forks.
@@ -107,23 +282,7 @@ class GitlabRepoManager(SourceHost):
         """
         console = console_with_theme()
         try:
-            kwargs: dict[str, Union[bool, str]] = {"owned": True}
-            if not self.include_private:
-                kwargs["visibility"] = "public"
-            projects = self.client().projects.list(**kwargs, get_all=True)
-            projects = [self.client().projects.get(id=project.id) for project in projects]
-
-            filtered_projects = []
-            for project in projects:
-
-                if hasattr(project, "forked_from_project") and project.forked_from_project:
-                    forked = True
-                else:
-                    forked = False
-                if (self.include_forks or not forked) and project.namespace["path"] == self.user_login:
-                    filtered_projects.append(project)
-
-            return filtered_projects  # type: ignore
+            return list(self._iter_user_repos())
         except gitlab.exceptions.GitlabError as e:
             console.print(f"Failed to fetch repositories: {e}", style="danger")
             return []
@@ -152,14 +311,12 @@ class GitlabRepoManager(SourceHost):
             for repo in self._thread_safe_repos(repos):
                 self._clone_repo((repo, Dummy()))
         else:
-            with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
-                manager = multiprocessing.Manager()
-                lock = manager.Lock()
-                work_load = [(repo, lock) for repo in self._thread_safe_repos(repos)]
-                results = pool.map(self._clone_repo, work_load)
-                for output in results:
-                    if output:
-                        console.print(output, end="")
+            lock = threading.Lock()
+            work_load = [(repo, lock) for repo in self._thread_safe_repos(repos)]
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                # list() so exceptions from workers surface here
+                list(executor.map(self._clone_repo, work_load))
+        self.invalidate_local_repos()
 
     @log_duration
     def clone_group(self, group_id: int):
@@ -183,37 +340,78 @@ class GitlabRepoManager(SourceHost):
         if group_id == 0:
             raise ValueError("Group ID cannot be 0.")
         console = console_with_theme()
-        groups_to_process = [group_id]
-
-        while groups_to_process:
-            current_group_id = groups_to_process.pop(0)
-            group = self._get_group_by_id(current_group_id)
-            # subgroups = self._get_subgroups(group)
-            if not group:
-                console.print(f"Group with ID {current_group_id} not found. Skipping.")
-            repos = self._get_repos(group)
-
-            if self.prompt_for_changes:
-                answer = inquirer.prompt(
-                    [
-                        inquirer.Confirm(
-                            "clone-all",
-                            message=f"Are you sure you want to clone {len(repos)} repositories?",
-                            default=False,
-                        )
-                    ]
-                )
-                if not answer["clone-all"]:
-                    console.print("Cloning cancelled.")
-                    return
-            console.print(f"Cloning all {len(repos)} repositories for group with ID {group_id}")
+        if not self._get_group_by_id(group_id):
+            console.print(f"Group with ID {group_id} not found. Skipping.")
+            return
+        repos = self._drop_name_collisions(self._get_group_projects(group_id))
 
-            for repo in self._thread_safe_repos(repos):
-                console.print(".", end="")
-                self._clone_repo((repo, Dummy()))  # , extra_path=group.full_path)
+        if self.prompt_for_changes:
+            answer = inquirer.prompt(
+                [
+                    inquirer.Confirm(
+                        "clone-all",
+                        message=f"Are you sure you want to clone {len(repos)} repositories?",
+                        default=False,
+                    )
+                ]
+            )
+            if not answer["clone-all"]:
+                console.print("Cloning cancelled.")
+                return
+        console.print(f"Cloning all {len(repos)} repositories for group with ID {group_id}")
+
+        lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            list(executor.map(self._clone_repo, [(repo, lock) for repo in self._thread_safe_repos(repos)]))
+        self.invalidate_local_repos()
+
+    def _get_group_projects(self, group_id: int) -> list[Project]:
+        """
+        Walks a group and its subgroups breadth first, fetching the projects and subgroups
+        of every group in a level concurrently, so the walk takes one round trip per level.
 
-            # for subgroup in subgroups:
-            #     groups_to_process.append(subgroup.id)
+        Args:
+            group_id (int): The ID of the top group.
+
+        Returns:
+            list[Project]: The projects of the group and all its subgroups.
+        """
+        projects: list[Project] = []
+        level = [group_id]
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            while level:
+                # lazy, only the id is needed to list a group's projects and subgroups
+                groups = [self.client().groups.get(current_group_id, lazy=True) for current_group_id in level]
+                project_futures = [executor.submit(self._get_repos, group) for group in groups]
+                subgroup_futures = [executor.submit(self._get_subgroups, group) for group in groups]
+                for project_future in project_futures:
+                    projects.extend(project_future.result())
+                level = [subgroup.id for future in subgroup_futures for subgroup in future.result()]
+        return projects
+
+    def _drop_name_collisions(self, projects: list[Project]) -> list[Project]:
+        """
+        Keeps the first project of each name, clones go flat into the base directory so
+        projects with the same name in different subgroups would clone into the same folder.
+
+        Args:
+            projects (list[Project]): The projects of a group and its subgroups.
+
+        Returns:
+            list[Project]: The projects that can be cloned side by side.
+        """
+        console = console_with_theme()
+        by_path: dict[str, Project] = {}
+        for project in projects:
+            kept = by_path.setdefault(project.path, project)
+            if kept is not project:
+                message = (
+                    f"{project.path_with_namespace} is not cloned, "
+                    f"it would clone into the same folder as {kept.path_with_namespace}."
+                )
+                LOGGER.warning(message)
+                console.print(message, style="warning")
+        return list(by_path.values())
 
     def _clone_repo(self, repo_args: tuple[dict[str, Any], ContextManager[Any]]) -> None:
         """
@@ -235,10 +433,14 @@ class GitlabRepoManager(SourceHost):
                     with lock:
                         console.print(f"Cloning {project['web_url']} into {repo_path}")
                     repo_path.parent.mkdir(parents=True, exist_ok=True)
-                    g.Repo.clone_from(project["http_url_to_repo"], repo_path)
+                    g.Repo.clone_from(
+                        project["http_url_to_repo"],
+                        repo_path,
+                        **mg.clone_kwargs(self.shallow, self.clone_depth, self.partial_clone),
+                    )
             else:
-                with lock:
-                    console.print(f"Project {project['path']} already exists locally. Skipping clone.")
+                # the common case when re-running against a mirror, only worth a log line
+                LOGGER.info("Project %s already exists locally. Skipping clone.", project["path"])
         except g.GitCommandError as e:
             with lock:
                 console.print(f"Failed to clone {project['path']}: {e}", style="danger")
@@ -274,7 +476,7 @@ class GitlabRepoManager(SourceHost):
         """
         console = console_with_theme()
         try:
-            subgroups = group.projects.list(all=True, include_subgroups=True)
+            subgroups = group.subgroups.list(all=True, per_page=PER_PAGE)
             return subgroups
         except gitlab.exceptions.GitlabListError as e:
             console.print(f"Failed to list subgroups for group {group.id}: {e}", style="danger")
@@ -282,7 +484,7 @@ class GitlabRepoManager(SourceHost):
 
     def _get_repos(self, group: gitlab.v4.objects.Group) -> list[gitlab.v4.objects.Project]:
         """
-        Fetches all repositories (projects) for a given GitLab group, including those in its subgroups.
+        Fetches the repositories (projects) directly in a given GitLab group, subgroups are walked separately.
 
         Args:
             group (gitlab.v4.objects.Group): The GitLab Group object.
@@ -292,8 +494,7 @@ class GitlabRepoManager(SourceHost):
         """
         console = console_with_theme()
         try:
-            # Retrieve all projects for the group, including those in subgroups
-            projects = group.projects.list(include_subgroups=True, all=True)
+            projects = group.projects.list(all=True, per_page=PER_PAGE)
             return projects  # type: ignore
         except gitlab.exceptions.GitlabListError as e:
             console.print(f"Failed to list projects for group {group.id}: {e}", style="danger")
@@ -302,19 +503,15 @@ class GitlabRepoManager(SourceHost):
     @log_duration
     def pull_all(self, single_threaded: bool = False) -> None:
         console = console_with_theme()
-        directories = mg.find_git_repos(self.base_dir)
+        directories = self._local_repos
         console.print(f"Pulling {len(directories)} repositories.")
         if single_threaded or len(directories) < 4:
             for repo_dir in directories:
                 self.pull_repo((repo_dir, Dummy()))
         else:
-            with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
-                manager = multiprocessing.Manager()
-                lock = manager.Lock()
-                results = pool.map(self.pull_repo, ((repo_dir, lock) for repo_dir in directories))
-                for output in results:
-                    if output:
-                        console.print(output, end="")
+            lock = threading.Lock()
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                list(executor.map(self.pull_repo, [(repo_dir, lock) for repo_dir in directories]))
 
     @log_duration
     def pull_repo(self, args: tuple[Path, ContextManager[Any]]) -> None:
@@ -332,22 +529,23 @@ class GitlabRepoManager(SourceHost):
             # Get the current branch
             current_branch = repo.active_branch.name
 
-            # Fetch the latest info from the remote
-            origin = repo.remotes.origin
-            origin.fetch()
+            # Fetch the latest info from the remote, porcelain git skips GitPython parsing every fetched ref
+            repo.git.fetch("--prune", "--quiet", "origin")
             commits_behind = repo.iter_commits(f"{current_branch}..origin/{current_branch}")
 
             count = sum(1 for _ in commits_behind)
             if count <= 0:
-                with lock:
-                    console.print(f"{repo_path} is up to date.")
+                LOGGER.info("%s is up to date.", repo_path)
                 return
 
-            origin = repo.remotes.origin
             if not self.dry_run:
                 with lock:
                     console.print(f"Pulling latest changes in {repo_path}")
-                origin.pull()
+                try:
+                    # Already fetched, so the usual case needs no second round trip or three way merge
+                    repo.git.merge("--ff-only", f"origin/{current_branch}")
+                except g.GitCommandError:
+                    repo.git.pull("--quiet", "origin", current_branch)
                 # confusing mess.
                 # for info in infos:
                 #     with lock:
@@ -371,16 +569,16 @@ class GitlabRepoManager(SourceHost):
             tuple: Counts of no_remote, not_found, is_fork, not_repo scenarios.
         """
         console = console_with_theme()
-        # Get all the user's repos broadly, without filtering by visibility or forking
-        user_projects = {
-            project.path: self.client().projects.get(id=project.id) for project in self.client().projects.list()
+        # Every project of the user, unfiltered, reduced to whether it is a fork
+        project_is_fork = {
+            path: bool(getattr(project, "forked_from_project", None)) for path, project in self._all_projects().items()
         }
 
         no_remote = 0
         not_found = 0
         is_fork = 0
         not_repo = 0
-        repos = mg.find_git_repos(self.base_dir)
+        repos = self._local_repos
         console.print(f"Checking {len(repos)} repositories for stray, non-repo subfolders in {self.base_dir}.")
         for repo_dir in repos:
             if repo_dir.is_dir():
@@ -392,19 +590,15 @@ class GitlabRepoManager(SourceHost):
                         console.print(f"{repo_dir} has no remote repositories defined.")
                         continue
 
-                    remote_url = remotes[0].config_reader.get("url")
+                    remote_url = remotes[0].url
                     repo_name = mg.extract_repo_name(remote_url)
 
-                    if repo_name not in user_projects:
+                    forked = project_is_fork.get(repo_name)
+                    if forked is None:
                         not_found += 1
                         console.print(f"{repo_dir} is not found in your GitLab account.")
                         continue
 
-                    gitlab_project = user_projects[repo_name]
-                    if hasattr(gitlab_project, "forked_from_project") and gitlab_project.forked_from_project:
-                        forked = True
-                    else:
-                        forked = False
                     if not forked:
                         is_fork += 1
                         console.print(f"{repo_dir} is a fork of another repository.")
@@ -423,34 +617,33 @@ class GitlabRepoManager(SourceHost):
         """
         console = console_with_theme()
         messages = []
-        for project in self._get_user_repos():
+        projects = self._get_user_repos()
+        # One request per project, so fetch concurrently and print in order afterwards
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            all_pipelines = list(executor.map(self._fetch_latest_pipelines, projects))
+        for project, pipelines in zip(projects, all_pipelines):
             console.print(f"Project: {project.name}")
-            pipelines = cast(
-                RESTObjectList, project.pipelines.list(order_by="updated_at", sort="desc", per_page=1, iterator=True)
-            )  # Get the most recent pipeline
             messages.extend(self._loop_pipelines(pipelines))
         return messages
 
-    def _loop_pipelines(self, pipelines: RESTObjectList, count: int = 1) -> list[tuple[str, str]]:
+    def _fetch_latest_pipelines(self, project: Project) -> list[RESTObject]:
+        # Just the most recent pipeline, as a plain list of at most one
+        return cast(
+            list[RESTObject],
+            project.pipelines.list(order_by="updated_at", sort="desc", per_page=1, get_all=False),
+        )
+
+    def _loop_pipelines(self, pipelines: list[RESTObject], count: int = 1) -> list[tuple[str, str]]:
         console = console_with_theme()
         messages = []
-        seen = 0
-        for pipeline in pipelines:
-            seen += 1
-            if seen > count:
-                break
+        for pipeline in islice(pipelines, count):
             status_message = f"Date: {pipeline.updated_at} - Pipeline #{pipeline.id} - Status: {pipeline.status} - URL: {pipeline.web_url}"
             status = pipeline.status.lower()
             messages.append((status, status_message))
 
-            if status in ["passed", "success"]:
-                console.print(colored(status_message, "green"))
-            elif status in ["failed"]:
-                console.print(colored(status_message, "red"))
-            elif status in ["canceled", "cancelled"]:  # Checking both spellings to be safe
-                console.print(colored(status_message, "yellow"))
-            else:
-                raise ValueError(f"Unknown status: {status}")
+            # Unlisted statuses, e.g. skipped or manual, are shown uncolored rather than failing the listing
+            color = PIPELINE_STATUS_COLORS.get(status)
+            console.print(colored(status_message, color) if color else status_message)
         return messages
 
     def _get_latest_commit_date(self, repo: g.Repo) -> datetime:
@@ -463,8 +656,8 @@ class GitlabRepoManager(SourceHost):
         Returns:
             datetime: The datetime of the latest commit.
         """
-        last_commit = next(repo.iter_commits())
-        return datetime.fromtimestamp(last_commit.committed_date)
+        # Just HEAD's commit time from git, no Commit object and no persistent cat-file process
+        return datetime.fromtimestamp(int(repo.git.log("-1", "--format=%ct")))
 
     @log_duration
     def check_pypi_publish_status(self, pypi_owner_name: Optional[str] = None) -> list[dict[str, Any]]:
@@ -475,48 +668,58 @@ class GitlabRepoManager(SourceHost):
         console.print("Checking if your gitlab repos have been published to pypi.")
         results = []
 
-        async def get_infos_async(package_names):
+        async def get_infos_async(package_names, progress_callback):
             pypi_manager = PyPiManager()
-            return await pypi_manager.get_infos(package_names)
-
-        package_names = [path.name for path in mg.find_git_repos(self.base_dir)]
-        package_infos = asyncio.run(get_infos_async(package_names))
+            return await pypi_manager.get_infos(package_names, progress_callback)
 
-        found = 0
-        for repo_dir in mg.find_git_repos(self.base_dir):
-            LOGGER.debug(f"Checking {repo_dir}")
+        # One pass over the local repos, so each is opened once and only git repos are looked up on pypi
+        entries = []
+        for repo_dir in self._local_repos:
             if repo_dir.is_dir():
                 try:
-                    repo = g.Repo(repo_dir)
-                    package_name = repo_dir.name  # Assuming the repo name is the package name
-
-                    pypi_data, status_code = package_infos[package_name]
-                    if status_code == 200:
-                        pypi_owner = pypi_data.get("info", {}).get("author", "").strip().lower()
-                        any_owner_is_fine = pypi_owner_name is None
-                        i_am_owner = pypi_owner_name == pypi_owner if pypi_owner_name else True
-
-                        if any_owner_is_fine or i_am_owner:
-                            pypi_release_date = PyPiManager._get_latest_pypi_release_date(pypi_data)
-                            repo_last_commit_date = self._get_latest_commit_date(repo)
-                            days_difference = (pypi_release_date - repo_last_commit_date).days
-                            found += 1
-                            results.append(
-                                {
-                                    "Package": package_name,
-                                    "On PyPI": "Yes",
-                                    "Pypi Owner": pypi_data.get("info", {}).get("author"),
-                                    "Repo last change date": repo_last_commit_date.date(),
-                                    "PyPI last change date": pypi_release_date.date(),
-                                    "Days difference": days_difference,
-                                }
-                            )
-                    # else:
-                    #     LOGGER.debug(f"{package_name} is not a pypi package name.")
+                    entries.append((repo_dir, g.Repo(repo_dir)))
                 except g.InvalidGitRepositoryError:
                     console.print(f"{repo_dir} is not a valid Git repository.", style="danger")
-                except Exception as e:
-                    console.print(f"Error checking {repo_dir}: {e}", style="danger")
+        # Assuming the repo name is the package name
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task(f"Looking up {len(entries)} packages", total=len(entries))
+            package_infos = asyncio.run(
+                get_infos_async([repo_dir.name for repo_dir, _ in entries], lambda: progress.advance(task))
+            )
+
+        found = 0
+        for repo_dir, repo in entries:
+            LOGGER.debug("Checking %s", repo_dir)
+            package_name = repo_dir.name
+            try:
+                pypi_data, status_code = package_infos[package_name]
+                if status_code == 200:
+                    pypi_owner = pypi_data.get("info", {}).get("author", "").strip().lower()
+                    any_owner_is_fine = pypi_owner_name is None
+                    i_am_owner = pypi_owner_name == pypi_owner if pypi_owner_name else True
+
+                    if any_owner_is_fine or i_am_owner:
+                        pypi_release_date = PyPiManager._get_latest_pypi_release_date(pypi_data)
+                        repo_last_commit_date = self._get_latest_commit_date(repo)
+                        days_difference = (pypi_release_date - repo_last_commit_date).days
+                        found += 1
+                        results.append(
+                            {
+                                "Package": package_name,
+                                "On PyPI": "Yes",
+                                "Pypi Owner": pypi_data.get("info", {}).get("author"),
+                                "Repo last change date": repo_last_commit_date.date(),
+                                "PyPI last change date": pypi_release_date.date(),
+                                "Days difference": days_difference,
+                            }
+                        )
+                # else:
+                #     LOGGER.debug(f"{package_name} is not a pypi package name.")
+            except Exception as e:
+                console.print(f"Error checking {repo_dir}: {e}", style="danger")
+            finally:
+                # don't keep a git cat-file process alive for every repo until the end
+                repo.close()
         if found == 0:
             console.print(
                 "None of your repositories are published on PyPI under the project name and "
@@ -532,7 +735,11 @@ class GitlabRepoManager(SourceHost):
         Returns:
             List[str]: A list of repository names.
         """
-        return [project.name for project in self._get_user_repos()]
+        try:
+            return [project.name for project in self._iter_user_repos()]
+        except gitlab.exceptions.GitlabError as e:
+            console_with_theme().print(f"Failed to fetch repositories: {e}", style="danger")
+            return []
 
     @log_duration
     def list_repos(self) -> Optional[Table]:
@@ -549,19 +756,13 @@ class GitlabRepoManager(SourceHost):
             table.add_column("Private", style="red")
             table.add_column("Fork", style="blue")
 
-            kwargs: dict[str, Union[bool, str]] = {"owned": True, "get_all": True}
+            kwargs: dict[str, Union[bool, str]] = {"owned": True}
             if not self.include_private:
                 kwargs["visibility"] = "public"
-            projects = self.client().projects.list(**kwargs)
-            projects = [self.client().projects.get(id=project.id) for project in projects]
+            projects = self._list_projects(**kwargs)
 
             for project in projects:
-
-                if hasattr(project, "forked_from_project") and project.forked_from_project:
-                    forked = True
-                else:
-                    forked = False
-
+                forked = bool(getattr(project, "forked_from_project", None))
                 if (self.include_private or project.visibility == "public") and (self.include_forks or not forked):
                     table.add_row(
                         project.name,
@@ -607,11 +808,14 @@ class GitlabRepoManager(SourceHost):
             console.print(f"Failed to fetch GitLab user info: {e}", style="danger")
 
     def load_user(self) -> RESTObject:
-        list_info = self.client().users.list(username=self.user_login, get_all=True)[0]  # type: ignore
+        list_info = self._load_user_by_name(self.user_login)
         user = self.client().users.get(list_info.id)
         # to make mypy happy
         return user
 
+    def _load_user_by_name(self, username: str) -> RESTObject:
+        return self.client().users.list(username=username, get_all=True)[0]  # type: ignore
+
     @log_duration
     def update_all_branches(self, single_threaded: bool = False, prefer_rebase: bool = False):
         """
@@ -622,22 +826,22 @@ class GitlabRepoManager(SourceHost):
             prefer_rebase (bool): Whether to prefer rebasing instead of merging.
         """
         console = console_with_theme()
-        directories = mg.find_git_repos(self.base_dir)
+        directories = self._local_repos
         console.print(f"Merging/rebasing {len(directories)} main to local repositories.")
-        if single_threaded or len(directories) < 4:
-            for repo_dir in directories:
-                self._update_local_branches(UpdateBranchArgs(repo_dir, repo_dir.name, prefer_rebase, Dummy()))
+        # One project list for all repos, so the workers only talk to git
+        default_branches = {path: project.default_branch for path, project in self._all_projects().items()}
+        threaded = not single_threaded and len(directories) >= 4
+        lock: ContextManager[Any] = threading.Lock() if threaded else Dummy()
+        work_load = [
+            UpdateBranchArgs(repo_dir, repo_dir.name, prefer_rebase, lock, default_branches.get(repo_dir.name))
+            for repo_dir in directories
+        ]
+        if threaded:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                list(executor.map(self._update_local_branches, work_load))
         else:
-            with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
-                manager = multiprocessing.Manager()
-                lock = manager.Lock()
-                results = pool.map(
-                    self._update_local_branches,
-                    (UpdateBranchArgs(repo_dir, repo_dir.name, prefer_rebase, lock) for repo_dir in directories),
-                )
-                for output in results:
-                    if output:
-                        console.print(output, end="")
+            for args in work_load:
+                self._update_local_branches(args)
 
     def _update_local_branches(self, args: UpdateBranchArgs):
         """
@@ -650,14 +854,15 @@ class GitlabRepoManager(SourceHost):
         repo_path, project_name, prefer_rebase = args.repo_path, args.github_repo_full_name, args.prefer_rebase
         repo = g.Repo(str(repo_path))
 
-        # Search for the project using the namespace and project name
-        projects = self.client().projects.list(search=project_name, owned=True)[0]  # type: ignore
-        # for project in projects:
-        #     if project.path_with_namespace == f"{self.user_login}/{project_name}":
-        #         return project.default_branch
-
         # Get the default branch name from Gitlab
-        default_branch = projects.default_branch
+        default_branch = args.default_branch
+        if default_branch is None:
+            project = self._all_projects().get(project_name)
+            if project is None:
+                with args.lock:
+                    console.print(f"{project_name} is not found in your Gitlab account.", style="danger")
+                return
+            default_branch = project.default_branch
 
         # Fetch all changes from remote
         origin = repo.remotes.origin
@@ -672,15 +877,20 @@ class GitlabRepoManager(SourceHost):
                 if not self.dry_run:
                     # Checkout the branch
                     repo.git.checkout(branch)
-                    # Ensure the branch is up to date with its upstream
-                    repo.git.pull()
-
-                if prefer_rebase:
-                    # Perform rebase
-                    repo.git.rebase(f"origin/{default_branch}")
-                else:
-                    # Perform merge
-                    repo.git.merge(f"origin/{default_branch}")
+                    # Ensure the branch is up to date with its upstream, already fetched above
+                    if branch.tracking_branch() is not None:
+                        repo.git.merge("--ff-only", "@{upstream}")
+
+                    try:
+                        # Nothing of its own on the branch yet, so no merge commit or rebase needed
+                        repo.git.merge("--ff-only", f"origin/{default_branch}")
+                    except g.GitCommandError:
+                        if prefer_rebase:
+                            # Perform rebase
+                            repo.git.rebase(f"origin/{default_branch}")
+                        else:
+                            # Perform merge
+                            repo.git.merge(f"origin/{default_branch}")
                 if not self.dry_run:
                     with args.lock:
                         console.print(f"Updated branch '{branch}' with latest changes from '{default_branch}'.")
@@ -696,7 +906,7 @@ class GitlabRepoManager(SourceHost):
     @log_duration
     def prune_all(self):
         console = console_with_theme()
-        repos = mg.find_git_repos(self.base_dir)
+        repos = self._local_repos
         console.print(f"Checking {len(repos)} repositories for uncommitted changes and unpushed commits.")
         if self.prompt_for_changes:
             answer = inquirer.confirm("Do you want to prune all repositories?", default=False).execute()
@@ -704,28 +914,89 @@ class GitlabRepoManager(SourceHost):
                 console.print("Aborted.")
                 return
 
+        # Each repo is opened once, for the branch lookup and the pruning
+        entries = []
         for repo_dir in repos:
             if repo_dir.is_dir():
-                self._delete_local_branches_if_not_on_host(repo_dir, f"{self.user_login}/{repo_dir.name}")
+                try:
+                    entries.append((repo_dir, g.Repo(str(repo_dir))))
+                except g.InvalidGitRepositoryError:
+                    console.print(f"{repo_dir} is not a valid Git repository.", style="danger")
+        # Look up every remote's branches concurrently, the prompts below are one repo at a time
+        lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            all_remote_branches = list(
+                executor.map(lambda entry: self._remote_branches(entry[0], entry[1], lock), entries)
+            )
+        for (repo_dir, repo), remote_branches in zip(entries, all_remote_branches):
+            if remote_branches is not None:
+                self._delete_local_branches_if_not_on_host(
+                    repo_dir, f"{self.user_login}/{repo_dir.name}", remote_branches, repo
+                )
+
+    def _remote_branches(
+        self, repo_path: Path, repo: Optional[g.Repo] = None, lock: ContextManager[Any] = Dummy()
+    ) -> Optional[frozenset[str]]:
+        """
+        Gets the names of the branches on Gitlab for a local repository.
 
-    def _delete_local_branches_if_not_on_host(self, repo_path: Path, project_name: str):
+        Args:
+            repo_path (Path): The file system path to the local git repository.
+            repo (Optional[g.Repo]): The repository, if the caller already opened it.
+            lock (ContextManager[Any]): Held while printing, when called from worker threads.
+
+        Returns:
+            Optional[frozenset[str]]: The branch names, or None if the repository or project wasn't found.
+        """
+        console = console_with_theme()
+        if repo is None:
+            try:
+                repo = g.Repo(str(repo_path))
+            except g.InvalidGitRepositoryError:
+                with lock:
+                    console.print(f"{repo_path} is not a valid Git repository.", style="danger")
+                return None
+        # The API is only needed if git can't reach origin
+        remote_branches = mg.remote_branch_names(repo)
+        if remote_branches is None:
+            project = self._all_projects().get(repo_path.name)
+            if project is None:
+                with lock:
+                    console.print(
+                        f"{self.user_login}/{repo_path.name} is not found in your Gitlab account.", style="danger"
+                    )
+                return None
+            branches = project.branches.list(get_all=True, per_page=PER_PAGE)
+            remote_branches = frozenset(branch.name for branch in branches)
+        return remote_branches
+
+    def _delete_local_branches_if_not_on_host(
+        self,
+        repo_path: Path,
+        project_name: str,
+        remote_branches: Optional[frozenset[str]] = None,
+        repo: Optional[g.Repo] = None,
+    ):
         """
         Loops through all local branches, checks if they exist on Gitlab, and prompts the user for deletion if they don't.
 
         Args:
             repo_path (Path): The file system path to the local git repository.
             project_name (str): The name of the project on Gitlab.
+            remote_branches (Optional[frozenset[str]]): The branch names on Gitlab, if already known.
+            repo (Optional[g.Repo]): The repository, if the caller already opened it.
         """
         console = console_with_theme()
-        try:
-            repo = g.Repo(str(repo_path))
-        except g.InvalidGitRepositoryError:
-            console.print(f"{repo_path} is not a valid Git repository.", style="danger")
-            return
-        project = self.client().projects.list(search=project_name, owned=True)[0]  # type: ignore
-
-        # Get a list of all branch names on Gitlab
-        remote_branches = [branch.name for branch in project.get_branches()]
+        if repo is None:
+            try:
+                repo = g.Repo(str(repo_path))
+            except g.InvalidGitRepositoryError:
+                console.print(f"{repo_path} is not a valid Git repository.", style="danger")
+                return
+        if remote_branches is None:
+            remote_branches = self._remote_branches(repo_path, repo)
+            if remote_branches is None:
+                return
 
         # Get a list of all local branch names
         local_branches = [branch.name for branch in repo.heads]  # alias to branches
@@ -737,77 +1008,106 @@ class GitlabRepoManager(SourceHost):
             console.print("No local branches exist that are missing on Gitlab.")
             return
 
-        # Prompt user for each branch that doesn't exist on Gitlab
-        for branch in branches_to_consider:
-            if self.prompt_for_changes:
-                question = [
-                    inquirer.Confirm(
-                        "delete",
-                        message=f"The branch '{branch}' does not exist on Gitlab. Delete locally?",
-                        default=False,
+        # One checkbox prompt for all the branches that don't exist on Gitlab
+        branches_to_delete = branches_to_consider
+        if self.prompt_for_changes:
+            answer = inquirer.prompt(
+                [
+                    inquirer.Checkbox(
+                        "to_delete",
+                        message=f"Select branches in {project_name} missing on Gitlab to delete locally",
+                        choices=branches_to_consider,
                     )
                 ]
-                answer = inquirer.prompt(question)
-
-                if not answer["delete"]:
+            )
+            selected = set(answer["to_delete"]) if answer else set()
+            branches_to_delete = [branch for branch in branches_to_consider if branch in selected]
+            for branch in branches_to_consider:
+                if branch not in selected:
                     console.print(f"Skipped deletion of branch '{branch}'.")
-                    continue
-            try:
-                if not self.dry_run:
-                    # Safely delete the branch
-                    repo.git.branch("-d", branch)
-                    console.print(f"Deleted branch '{branch}' locally.")
-                else:
-                    console.print(f"Would have deleted branch '{branch}' locally.")
-            except g.exc.GitCommandError as e:
+
+        if self.dry_run:
+            for branch in branches_to_delete:
+                console.print(f"Would have deleted branch '{branch}' locally.")
+            return
+
+        # Safely delete the branches
+        errors = mg.delete_local_branches(repo, branches_to_delete)
+        for branch in branches_to_delete:
+            if branch in errors:
                 console.print(
-                    f"Could not delete branch '{branch}'. It may not be fully merged. Error: {e}", style="danger"
+                    f"Could not delete branch '{branch}'. It may not be fully merged. Error: {errors[branch]}",
+                    style="danger",
                 )
+            else:
+                console.print(f"Deleted branch '{branch}' locally.")
 
     @log_duration
     def version_info(self) -> dict[str, Any]:
         """
         Return API version information.
         """
+        cache_key = self.host_domain
+        cached = read_cache("gitlab_version", cache_key, VERSION_CACHE_TTL)
+        if cached:
+            return cast(dict[str, Any], cached)
         version, revision = self.client().version()
-        return {"version": version, "revision": revision}
+        info = {"version": version, "revision": revision}
+        write_cache("gitlab_version", cache_key, info)
+        return info
+
+    def _get_project(self, project_id: int) -> Project:
+        """
+        Fetches a project, using the disk cache for recently seen projects.
+
+        Args:
+            project_id (int): The ID of the GitLab project.
+
+        Returns:
+            Project: The GitLab Project object.
+        """
+        client = self.client()
+        cache_key = f"{self.host_domain}/{project_id}"
+        cached = read_cache("gitlab_projects", cache_key, PROJECT_CACHE_TTL)
+        if cached:
+            return Project(client.projects, cached)
+        project = client.projects.get(project_id)
+        write_cache("gitlab_projects", cache_key, project.attributes)
+        return project
 
     @log_duration
+    @require_template_dir
     def cross_repo_sync_report(self, template_dir: Path) -> None:
         """
         Reports differences between the template directory and the target directories.
         """
         console = console_with_theme()
-        if not template_dir or not template_dir.exists():
-            console.print(f"Template directory {template_dir} does not exist.")
-            return
         # right now just the easy case of all repos need to match 1 template_dir
         console.print("Reporting differences between the template directory and the target directories.")
-        syncer = TemplateSync(template_dir)
-        directories = mg.find_git_repos(self.base_dir)
-        console.print(f"Found {len(directories)} repositories.")
-        syncer.report_content_differences(directories)
+        syncer = cast(TemplateSync, self._syncer)
+        directories = self._local_repos
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task(f"Comparing {len(directories)} repositories", total=len(directories))
+            summary = syncer.report_content_differences(directories, lambda: progress.advance(task))
+        console.print(summary_table(summary))
 
     @log_duration
+    @require_template_dir
     def cross_repo_init(self, template_dir: Path):
         console = console_with_theme()
-        if not template_dir or not template_dir.exists():
-            console.print(f"Template directory {template_dir} does not exist.")
-            return
-        syncer = TemplateSync(template_dir, use_default=True)
-        directories = mg.find_git_repos(self.base_dir)
+        syncer = cast(TemplateSync, self._syncer)
+        directories = self._local_repos
         console.print(f"Found {len(directories)} repositories.")
         syncer.write_template_map(directories)
+        mg.remember_git_repos(self.base_dir, directories)
         console.print(f"Initialized template map for {len(directories)} repositories.")
 
     @log_duration
+    @require_template_dir
     def cross_repo_sync(self, template_dir: Path):
         console = console_with_theme()
-        if not template_dir or not template_dir.exists():
-            console.print(f"Template directory {template_dir} does not exist.")
-            return
-        syncer = TemplateSync(template_dir, use_default=True)
-        directories = mg.find_git_repos(self.base_dir)
+        syncer = cast(TemplateSync, self._syncer)
+        directories = mg.find_git_repos_cached(self.base_dir)
         console.print(f"Found {len(directories)} repositories.")
         answer = inquirer.confirm(
             "Do you want to synchronize all repositories with the template directory?", default=False
@@ -815,24 +1115,48 @@ class GitlabRepoManager(SourceHost):
         if not answer:
             console.print("Aborted.")
             return
-        syncer.sync_template(directories)
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task(f"Synchronizing {len(directories)} repositories", total=len(directories))
+            syncer.sync_template(directories, lambda: progress.advance(task))
         console.print(f"Synchronized {len(directories)} repositories with the template directory.")
 
     @log_duration
     def merge_request(
         self, source_branch: str, target_branch: str, title: str, reviewer: str, project_id: int, repo_name: str
     ):
-        user = self.load_user()
-        project = self.client().projects.get(project_id)
-        reviewer_object = self.client().users.list(username=reviewer, get_all=True)[0]  # type: ignore
-        mr = project.mergerequests.create(
-            {
-                "source_branch": source_branch,
-                "target_branch": target_branch,
-                "title": title,
-                "remove_source_branch": True,
-                "assignee_ids": [user.id],
-                "reviewer_ids": [reviewer_object.id],
-            }
-        )
+        """
+        Create a merge request on Gitlab, assign it to the user and request a review.
+
+        Args:
+            source_branch: The name of the source branch for the merge request.
+            target_branch: The name of the target branch for the merge request.
+            title: The title of the merge request.
+            reviewer: Gitlab username of the reviewer.
+            project_id: The ID of the GitLab project.
+            repo_name: The name of the repository (unused here).
+        """
+        # These lookups don't depend on each other, so don't pay for them one after another.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            user_future = executor.submit(self.load_user)
+            project_future = executor.submit(self._get_project, project_id)
+            reviewer_future = executor.submit(self._load_user_by_name, reviewer)
+            user, project, reviewer_object = user_future.result(), project_future.result(), reviewer_future.result()
+        try:
+            mr = project.mergerequests.create(
+                {
+                    "source_branch": source_branch,
+                    "target_branch": target_branch,
+                    "title": title,
+                    "remove_source_branch": True,
+                    "squash": True,
+                    "assignee_ids": [user.id],
+                    "reviewer_ids": [reviewer_object.id],
+                }
+            )
+        except gitlab.exceptions.GitlabError as e:
+            if e.response_code == 404:
+                # Cached project may have been moved or deleted.
+                invalidate_cache("gitlab_projects", f"{self.host_domain}/{project_id}")
+            raise
+        # The create endpoint can't turn on auto-merge, only the merge endpoint can.
         mr.merge(merge_when_pipeline_succeeds=True, should_remove_source_branch=True, squash=True)
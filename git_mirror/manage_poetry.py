@@ -1,15 +1,62 @@
+import asyncio
+import hashlib
 import logging
 import os
+import shutil
 import subprocess  # nosec
-from contextlib import contextmanager
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
 
 import git
 
 from git_mirror.custom_types import SourceHost
+from git_mirror.disk_cache import cache_dir
 from git_mirror.performance import log_duration
 
 logger = logging.getLogger(__name__)
 
+# Repos updated at once, each spends most of its time waiting on the network or poetry's resolver
+MAX_WORKERS = max(1, min(8, 3 * (os.cpu_count() or 4) // 4))
+
+# Repos with the same pyproject.toml share a lock file for this long before poetry resolves again
+LOCK_CACHE_TTL = 24 * 60 * 60
+
+
+def poetry_env() -> dict[str, str]:
+    """Environment for poetry, with its installer's parallelism matched to the CPUs unless already configured.
+
+    Returns:
+        A copy of the environment with poetry's installer settings added.
+    """
+    cpus = os.cpu_count() or 1
+    env = dict(os.environ)
+    # Set through the environment so neither the repo's poetry.toml nor the user's global config is touched
+    env.setdefault("POETRY_INSTALLER_PARALLEL", "true" if cpus > 1 else "false")
+    if cpus > 1:
+        env.setdefault("POETRY_INSTALLER_MAX_WORKERS", str(min(10, cpus)))
+    return env
+
+
+def cached_lock_file(repo_folder: str) -> Optional[Path]:
+    """Where the lock file for the repository's pyproject.toml is cached, keyed by a hash of its contents.
+
+    Args:
+        repo_folder: The folder of the repository.
+
+    Returns:
+        The cache file path, which may not exist yet, or None if the repository has no pyproject.toml.
+    """
+    try:
+        digest = hashlib.blake2b(Path(repo_folder, "pyproject.toml").read_bytes()).hexdigest()
+    except OSError:
+        return None
+    folder = cache_dir() / "poetry_locks"
+    folder.mkdir(exist_ok=True)
+    return folder / f"{digest}.lock"
+
 
 def clean_gone_branches(repo: git.Repo) -> None:
     """Clean branches that are gone from remote.
@@ -17,24 +64,14 @@ def clean_gone_branches(repo: git.Repo) -> None:
     Args:
         repo: The Git repository object.
     """
+    # Ref names can't contain spaces, so the first space ends the branch name
+    refs = repo.git.for_each_ref("--format=%(refname:short) %(upstream:track)", "refs/heads")
     gone_branches = [
-        ref.split()[0]
-        for ref in repo.git.for_each_ref("--format=%(refname:short) %(upstream:track)").split("\n")
-        if "[gone]" in ref
+        name for name, _, track in (line.partition(" ") for line in refs.splitlines()) if "[gone]" in track
     ]
-    for branch in gone_branches:
-        repo.git.branch("-D", branch)
-
-
-@contextmanager
-def working_directory(repo_folder: str):
-    """Changes to the working directory and returns to the original directory when done."""
-    original_directory = os.getcwd()
-    os.chdir(repo_folder)
-    try:
-        yield
-    finally:
-        os.chdir(original_directory)
+    if gone_branches:
+        # one git process for all of them
+        repo.git.branch("-D", *gone_branches)
 
 
 class PoetryManager:
@@ -48,19 +85,62 @@ class PoetryManager:
         self.host = host
         self.dry_run = dry_run
         self.prompt_for_changes = prompt_for_changes
+        # The host's API client is shared by the worker threads
+        self._host_lock = threading.Lock()
+
+    async def _run_poetry(self, repo_folder: str, *args: str) -> None:
+        """Run a poetry command in the repository without blocking the event loop.
+
+        Args:
+            repo_folder: The folder of the repository.
+            *args: The poetry subcommand and its arguments.
+
+        Raises:
+            subprocess.CalledProcessError: If poetry exits with an error.
+        """
+        command = ["poetry", *args]
+        # stdout is only read for debug logging, otherwise poetry's progress output is discarded
+        capture = logger.isEnabledFor(logging.DEBUG)
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=repo_folder,
+            env=poetry_env(),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+        if capture:
+            logger.debug("%s in %s: %s", " ".join(command), repo_folder, stdout.decode(errors="replace"))
+
+    async def install_async(self, repo_folder: str) -> None:
+        """Lock and install project dependencies.
+
+        Args:
+            repo_folder: The folder of the repository.
+        """
+        lock_file = Path(repo_folder, "poetry.lock")
+        cached = cached_lock_file(repo_folder)
+        if cached and cached.exists() and time.time() - cached.stat().st_mtime < LOCK_CACHE_TTL:
+            logger.debug("Reusing cached lock file %s for %s", cached, repo_folder)
+            shutil.copyfile(cached, lock_file)
+        else:
+            await self._run_poetry(repo_folder, "lock")
+            if cached and lock_file.exists():
+                shutil.copyfile(lock_file, cached)
+        # TODO: make group config driven.
+        await self._run_poetry(repo_folder, "install", "--with", "dev")
 
     @log_duration
     def install(self, repo_folder: str) -> None:
-        """Update project dependencies and create a merge request if changes are made.
+        """Lock and install project dependencies.
 
         Args:
             repo_folder: The folder of the repository.
         """
-        with working_directory(repo_folder):
-            # Update dependencies using Poetry
-            subprocess.run(["poetry", "lock"], check=True, shell=True)  # nosec
-            # TODO: make group config driven.
-            subprocess.run(["poetry", "install", "--with", "dev"], check=True, shell=True)  # nosec
+        asyncio.run(self.install_async(repo_folder))
 
     @log_duration
     def update_dependencies(
@@ -84,52 +164,123 @@ class PoetryManager:
             user: Username for assigning the merge request.
             reviewer: Username for reviewing the merge request.
         """
-        with working_directory(repo_folder):
-            # Setup
-            repo = git.Repo(repo_folder)
-            origin = repo.remotes.origin
+        asyncio.run(
+            self.update_dependencies_async(
+                repo_folder, main_branch, dependency_update_branch, project_id, repo_name, user, reviewer
+            )
+        )
 
-            # Checkout and pull main branch
-            repo.git.checkout(main_branch)
-            origin.pull()
+    @log_duration
+    def update_dependencies_many(
+        self,
+        repo_folders: list[Path],
+        main_branch: str,
+        dependency_update_branch: str,
+        project_id: int,
+        user: str,
+        reviewer: str,
+        max_workers: int = MAX_WORKERS,
+    ) -> list[Path]:
+        """Update dependencies of several repositories concurrently, one worker thread per repository.
+
+        Args:
+            repo_folders: The folders of the repositories, the folder name is the repository name.
+            main_branch: The main branch name.
+            dependency_update_branch: The dependency update branch name.
+            project_id: The ID of the GitLab project.
+            user: Username for assigning the merge request.
+            reviewer: Username for reviewing the merge request.
+            max_workers: Number of repositories updated at once.
 
-            # Clean gone branches (Should this really be here?)
-            # clean_gone_branches(repo)
+        Returns:
+            The folders of the repositories that failed to update.
+        """
 
-            logger.info("Updating dependencies")
+        def update(repo_folder: Path) -> bool:
             try:
-                repo.git.checkout("-b", dependency_update_branch)
-            except git.exc.GitCommandError:
-                repo.git.branch("-D", dependency_update_branch)
-                repo.git.checkout("-b", dependency_update_branch)
-
-            # Update dependencies using Poetry
-            subprocess.run(["poetry", "install"], check=True, shell=True)  # nosec
-            subprocess.run(["poetry", "update"], check=True, shell=True)  # nosec
-            repo.git.add("poetry.lock")
-            repo.index.commit("Update dependencies")
-
-            # get rid of local branches that are gone from remote
-            # prune should be a separate step
-            origin.fetch(prune=False)
-
-            # Check if there are changes
-            if repo.git.diff("--quiet", "--exit-code", f"origin/{main_branch}"):
-                # no changes, nevermind.
-                repo.git.checkout(main_branch)
-                repo.git.branch("-D", dependency_update_branch)
-            else:
-                # origin.push('-f', f'{dependency_update_branch}:{dependency_update_branch}', set_upstream=True)
-                push_info = origin.push(
-                    refspec=f"{dependency_update_branch}:{dependency_update_branch}", force=True, set_upstream=True
+                self.update_dependencies(
+                    str(repo_folder),
+                    main_branch,
+                    dependency_update_branch,
+                    project_id,
+                    repo_folder.name,
+                    user,
+                    reviewer,
                 )
-                logger.debug(push_info)
+                return True
+            except (subprocess.CalledProcessError, git.exc.GitError) as e:
+                logger.error("Failed to update dependencies in %s: %s", repo_folder, e)
+                return False
 
-                self.host.merge_request(
-                    dependency_update_branch, main_branch, "Update Poetry lock file", reviewer, project_id, repo_name
-                )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            succeeded = list(executor.map(update, repo_folders))
+        return [repo_folder for repo_folder, ok in zip(repo_folders, succeeded) if not ok]
+
+    async def update_dependencies_async(
+        self,
+        repo_folder: str,
+        main_branch: str,
+        dependency_update_branch: str,
+        project_id: int,
+        repo_name: str,
+        user: str,
+        reviewer: str,
+    ) -> None:
+        """Update project dependencies and create a merge request if changes are made.
 
+        Args:
+            repo_folder: The folder of the repository.
+            main_branch: The main branch name.
+            dependency_update_branch: The dependency update branch name.
+            project_id: The ID of the GitLab project.
+            repo_name: The name of the Github repository.
+            user: Username for assigning the merge request.
+            reviewer: Username for reviewing the merge request.
+        """
+        # Setup, git commands run in the repository folder, no chdir needed
+        repo = git.Repo(repo_folder)
+        origin = repo.remotes.origin
+
+        # Checkout and pull main branch, unless it already is where the remote's is
+        repo.git.checkout(main_branch)
+        remote_head = repo.git.ls_remote("--heads", "origin", main_branch).partition("\t")[0]
+        if remote_head != repo.head.commit.hexsha:
+            origin.pull()
+
+        # Clean gone branches (Should this really be here?)
+        # clean_gone_branches(repo)
+
+        logger.info("Updating dependencies")
+        # -B resets a leftover branch from an earlier run in the same git call
+        repo.git.checkout("-B", dependency_update_branch)
+
+        # Update dependencies using Poetry
+        await self._run_poetry(repo_folder, "install")
+        await self._run_poetry(repo_folder, "update")
+
+        # The branch starts at the freshly pulled main branch, so a changed or new lock file is the whole diff
+        if not repo.is_dirty(untracked_files=True, path="poetry.lock"):
+            # no changes, nevermind.
             repo.git.checkout(main_branch)
+            repo.git.branch("-D", dependency_update_branch)
+            return
+
+        # staged and committed in process, no git subprocess
+        repo.index.add(["poetry.lock"])
+        repo.index.commit("Update dependencies")
+
+        # origin.push('-f', f'{dependency_update_branch}:{dependency_update_branch}', set_upstream=True)
+        push_info = origin.push(
+            refspec=f"{dependency_update_branch}:{dependency_update_branch}", force=True, set_upstream=True
+        )
+        logger.debug(push_info)
+
+        with self._host_lock:
+            self.host.merge_request(
+                dependency_update_branch, main_branch, "Update Poetry lock file", reviewer, project_id, repo_name
+            )
+
+        repo.git.checkout(main_branch)
 
 
 # if __name__ == "__main__":
@@ -3,27 +3,54 @@ Pure pypi actions.
 """
 
 import asyncio
+import json
 import logging
+import weakref
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from typing import Any, Optional
 
 import httpx
 from rich.table import Table
 
+from git_mirror.disk_cache import CacheBatch
 from git_mirror.safe_env import load_env
 
+try:
+    # httpx only speaks HTTP/2 with the h2 package, then all requests share one connection to pypi.org
+    import h2  # noqa: F401 # pylint: disable=unused-import
+
+    HTTP2 = True
+except ImportError:  # pragma: no cover
+    HTTP2 = False
+
 load_env()
 
 # Configure logging
 LOGGER = logging.getLogger(__name__)
 
+# PyPI requests in flight at once, all sharing the client's connection pool. More than this gets throttled.
+MAX_CONCURRENT_REQUESTS = 16
+REQUEST_TIMEOUT = 10.0
 
-def pretty_print_pypi_results(results: list[dict[str, Any]]) -> Table:
+# Throttled or failed requests are tried this many times in all, waiting 0.5, 1, 2... seconds in between
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Cached PyPI metadata is used as is for a while, then revalidated with its ETag until it is this old
+PYPI_FRESH_TTL = 60 * 60
+PYPI_CACHE_TTL = 30 * 24 * 60 * 60
+# Most repos are never published, so a 404 is remembered for a while instead of asked again every run
+PYPI_MISSING_TTL = 60 * 60
+
+
+def pypi_results_table() -> Table:
     """
-    Pretty prints the results of the PyPI audit using the rich library.
+    An empty table for PyPI audit results, with the columns filled by add_pypi_result_row.
 
-    Args:
-        results (List[dict[str, Any]]): A list of dictionaries containing the audit results.
+    Returns:
+        Table: The table.
     """
     table = Table()
 
@@ -33,75 +60,241 @@ def pretty_print_pypi_results(results: list[dict[str, Any]]) -> Table:
     table.add_column("Repo last change date")
     table.add_column("PyPI last change date")
     table.add_column("Days difference")
+    return table
+
 
+def add_pypi_result_row(table: Table, result: dict[str, Any]) -> None:
+    """
+    Add one PyPI audit result to the table, in red if PyPI is more than 60 days behind the repo.
+
+    Args:
+        table (Table): A table from pypi_results_table.
+        result (dict[str, Any]): The audit result.
+    """
+    days_difference = int(result.get("Days difference", "0"))
+    style = "red" if days_difference < -60 else ""
+
+    row_data = [
+        result["Package"],
+        result["On PyPI"],
+        result["Pypi Owner"],
+        str(result["Repo last change date"]),
+        str(result["PyPI last change date"]),
+        str(result["Days difference"]),
+    ]
+
+    # Apply style to the entire row if needed
+    table.add_row(*row_data, style=style)
+
+
+def pretty_print_pypi_results(results: list[dict[str, Any]]) -> Table:
+    """
+    Pretty prints the results of the PyPI audit using the rich library.
+
+    Args:
+        results (List[dict[str, Any]]): A list of dictionaries containing the audit results.
+    """
+    table = pypi_results_table()
     for result in results:
-        days_difference = int(result.get("Days difference", "0"))
-        style = "red" if days_difference * -1 > 60 else ""
-
-        row_data = [
-            result["Package"],
-            result["On PyPI"],
-            result["Pypi Owner"],
-            str(result["Repo last change date"]),
-            str(result["PyPI last change date"]),
-            str(result["Days difference"]),
-        ]
-
-        # Apply style to the entire row if needed
-        table.add_row(*row_data, style=style)
+        add_pypi_result_row(table, result)
     return table
 
 
-if __name__ == "__main__":
-    # Example usage
-    results = [
-        {
-            "Package": "ExamplePackage",
-            "On PyPI": "Yes",
-            "Pypi Owner": "OwnerName",
-            "Repo last change date": "2023-01-01",
-            "PyPI last change date": "2023-02-01",
-            "Days difference": "-30",
-        }
-    ]
-    pretty_print_pypi_results(results)
+def _summarize_pypi_data(pypi_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Keep just the parts of the PyPI metadata that are read, the full json lists every file of every release.
+
+    Args:
+        pypi_data (dict[str, Any]): The package data from PyPI.
+
+    Returns:
+        dict[str, Any]: The author, latest version and that version's files.
+
+    Examples:
+        >>> data = {"info": {"author": "me", "version": "1.0", "summary": "x"}, "releases": {"0.9": [], "1.0": [{}]}}
+        >>> _summarize_pypi_data(data)
+        {'info': {'author': 'me', 'version': '1.0'}, 'releases': {'1.0': [{}]}}
+    """
+    info = pypi_data.get("info", {})
+    version = info.get("version", "")
+    releases = pypi_data.get("releases", {})
+    return {
+        "info": {"author": info.get("author", ""), "version": version},
+        "releases": {version: releases[version]} if version in releases else {},
+    }
+
+
+# One client per event loop, pooled connections belong to the loop that opened them
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def shared_client() -> httpx.AsyncClient:
+    """
+    Get the PyPI client shared by all PyPiManagers on the running event loop.
+
+    Returns:
+        httpx.AsyncClient: The client, created on first use.
+    """
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        limits = httpx.Limits(
+            max_connections=MAX_CONCURRENT_REQUESTS, max_keepalive_connections=MAX_CONCURRENT_REQUESTS
+        )
+        client = httpx.AsyncClient(limits=limits, http2=HTTP2, timeout=httpx.Timeout(REQUEST_TIMEOUT))  # nosec
+        _CLIENTS[loop] = client
+    return client
 
 
 class PyPiManager:
 
     def __init__(self, pypi_owner_name: Optional[str] = None):
         self.pypi_owner_name = pypi_owner_name
-        self.client = httpx.AsyncClient()  # nosec
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The client set on this manager, else the one shared on the running event loop."""
+        return self._client or shared_client()
 
-    async def get_info(self, package_name: str) -> tuple[dict[str, Any], int]:
+    @client.setter
+    def client(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    async def get_info(
+        self,
+        package_name: str,
+        cache: Optional[CacheBatch] = None,
+        missing_cache: Optional[CacheBatch] = None,
+    ) -> tuple[dict[str, Any], int]:
         """
         Asynchronously get package information from PyPI.
 
         Args:
             package_name (str): The name of the package to retrieve information for.
+            cache (Optional[CacheBatch]): The PyPI metadata cache, read and saved by this call if not given.
+            missing_cache (Optional[CacheBatch]): The cache of packages not on PyPI, likewise.
 
         Returns:
-            Tuple[Dict[str, Any], int]: A tuple containing the package information and the HTTP status code.
+            Tuple[Dict[str, Any], int]: A tuple containing the summarized package information and the HTTP status code.
         """
+        if cache is None or missing_cache is None:
+            cache, missing_cache = CacheBatch("pypi"), CacheBatch("pypi_missing")
+            try:
+                return await self.get_info(package_name, cache, missing_cache)
+            finally:
+                cache.flush()
+                missing_cache.flush()
+
+        missing = missing_cache.read(package_name, PYPI_MISSING_TTL)
+        if missing is not None:
+            return missing, 404
+        fresh = cache.read(package_name, PYPI_FRESH_TTL)
+        if fresh is not None:
+            return fresh["data"], 200
         pypi_url = f"https://pypi.org/pypi/{package_name}/json"
-        response = await self.client.get(pypi_url)
-        data = response.json()
-        print(".", end="", flush=True)
-        return data, response.status_code
+        cached = cache.read(package_name, PYPI_CACHE_TTL)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        response = await self._get_with_retries(pypi_url, headers)
+        if response.status_code == 304 and cached:
+            # restart the fresh period
+            cache.write(package_name, cached)
+            return cached["data"], 200
+        if response.status_code == 200:
+            data = _summarize_pypi_data(json.loads(response.content))
+            etag = response.headers.get("ETag")
+            if etag:
+                cache.write(package_name, {"etag": etag, "data": data})
+            return data, 200
+        if response.status_code == 404:
+            # Nothing reads the body, which might not even be json if a proxy answered
+            missing_cache.write(package_name, {})
+            return {}, 404
+        return {}, response.status_code
 
-    async def get_infos(self, package_names: list[str]) -> dict[str, tuple[dict[str, Any], int]]:
+    async def _get_with_retries(self, url: str, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+        """
+        GET a url, backing off exponentially on transport errors and throttled or failed responses.
+
+        Args:
+            url (str): The url to get.
+            headers (Optional[dict[str, str]]): Extra request headers.
+
+        Returns:
+            httpx.Response: The last response, which may still be an error.
+        """
+        attempt = 0
+        while True:
+            last_attempt = attempt == MAX_RETRIES - 1
+            delay = RETRY_BACKOFF * 2**attempt
+            try:
+                response = await self.client.get(url, headers=headers)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                LOGGER.debug("Request to %s failed: %s, retrying in %s seconds.", url, e, delay)
+            else:
+                if last_attempt or response.status_code not in RETRY_STATUS_CODES:
+                    return response
+                LOGGER.debug("%s returned %s, retrying in %s seconds.", url, response.status_code, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get_infos(
+        self, package_names: list[str], progress_callback: Optional[Callable[[], None]] = None
+    ) -> dict[str, tuple[dict[str, Any], int]]:
         """
         Asynchronously get information for multiple packages from PyPI.
 
         Args:
             package_names (List[str]): A list of package names to retrieve information for.
+            progress_callback (Optional[Callable[[], None]]): Called after each package is looked up.
 
         Returns:
             Dict[str, Tuple[Dict[str, Any], int]]: A dictionary where keys are package names and values are tuples containing the package information and the HTTP status code.
         """
-        tasks = [self.get_info(package_name) for package_name in package_names]
-        results = await asyncio.gather(*tasks)
-        return {package_names[i]: result for i, result in enumerate(results)}
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Each cache file is read once before and saved once after the batch, not once per package
+        cache, missing_cache = CacheBatch("pypi"), CacheBatch("pypi_missing")
+
+        async def bounded_get_info(package_name: str) -> tuple[dict[str, Any], int]:
+            async with semaphore:
+                info = await self.get_info(package_name, cache, missing_cache)
+            if progress_callback:
+                progress_callback()
+            return info
+
+        tasks = [bounded_get_info(package_name) for package_name in package_names]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            await asyncio.to_thread(cache.flush)
+            await asyncio.to_thread(missing_cache.flush)
+        return dict(zip(package_names, results))
+
+    async def iter_infos(self, package_names: list[str]) -> AsyncIterator[tuple[str, tuple[dict[str, Any], int]]]:
+        """
+        Asynchronously get information for multiple packages from PyPI, yielding each as soon as it arrives.
+
+        Args:
+            package_names (List[str]): A list of package names to retrieve information for.
+
+        Yields:
+            Tuple[str, Tuple[Dict[str, Any], int]]: The package name, with its information and the HTTP status code.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        cache, missing_cache = CacheBatch("pypi"), CacheBatch("pypi_missing")
+
+        async def bounded_get_info(package_name: str) -> tuple[str, tuple[dict[str, Any], int]]:
+            async with semaphore:
+                return package_name, await self.get_info(package_name, cache, missing_cache)
+
+        try:
+            for next_done in asyncio.as_completed([bounded_get_info(package_name) for package_name in package_names]):
+                yield await next_done
+        finally:
+            await asyncio.to_thread(cache.flush)
+            await asyncio.to_thread(missing_cache.flush)
 
     @classmethod
     def _get_latest_pypi_release_date(self, pypi_data: dict) -> datetime:
@@ -119,10 +312,27 @@ class PyPiManager:
             >>> PyPiManager._get_latest_pypi_release_date(data)
             datetime.datetime(2021, 9, 10, 18, 48, 49)
         """
+        # Not memoized, get_info already caches the summarized data on disk and a cache read costs more than parsing
         releases = pypi_data.get("releases", {})
         latest_version = pypi_data.get("info", {}).get("version", "")
-        if latest_version in releases:
-            latest_release = releases[latest_version][-1]  # Get the latest release
-            release_date = datetime.strptime(latest_release["upload_time"], "%Y-%m-%dT%H:%M:%S")
-            return release_date
+        latest_files = releases.get(latest_version)
+        if latest_files:
+            latest_release = latest_files[-1]  # Get the latest release
+            # upload_time is always YYYY-MM-DDTHH:MM:SS, which fromisoformat parses in C
+            return datetime.fromisoformat(latest_release["upload_time"])
         return datetime.now()  # Fallback if no release found
+
+
+if __name__ == "__main__":
+    # Example usage
+    results = [
+        {
+            "Package": "ExamplePackage",
+            "On PyPI": "Yes",
+            "Pypi Owner": "OwnerName",
+            "Repo last change date": "2023-01-01",
+            "PyPI last change date": "2023-02-01",
+            "Days difference": "-30",
+        }
+    ]
+    pretty_print_pypi_results(results)
@@ -28,62 +28,65 @@ class CommandInfo:
     args: list[str] = field(default_factory=list)
 
 
-def get_command_info(args: argparse.Namespace) -> Optional[str]:
-    commands: list[tuple[str, str]] = [
-        ("Initialize Configuration", "init"),
-        ("Show Account Info", "show-account"),
-        ("List repositories", "list-repos"),
-        ("Clone all repositories", "clone-all"),
-        ("Run pull for all repositories", "pull-all"),
-        ("Report uncommitted/unpushed changes", "local-changes"),
-        ("Report non-repo folders in target folder", "not-repo"),
-        ("Report all build statuses", "build-status"),
-        ("Sync repo list in config with source control host", "sync-config"),
-        ("Report current configuration", "list-config"),
-        ("Report unpublished pypi packages", "pypi-status"),
-        ("Update all branches from main", "update-from-main"),
-        ("Prune all branches", "prune-all"),
-        ("Cross-repo report", "cross-repo-report"),
-        ("Cross-repo sync", "cross-repo-sync"),
-        ("Cross-repo Template Initialization", "cross-repo-init"),
-        ("Poetry ", "cross-repo-init"),
-        ("Main Menu", "Main Menu"),
-    ]
+COMMANDS: tuple[tuple[str, str], ...] = (
+    ("Initialize Configuration", "init"),
+    ("Show Account Info", "show-account"),
+    ("List repositories", "list-repos"),
+    ("Clone all repositories", "clone-all"),
+    ("Run pull for all repositories", "pull-all"),
+    ("Report uncommitted/unpushed changes", "local-changes"),
+    ("Report non-repo folders in target folder", "not-repo"),
+    ("Report all build statuses", "build-status"),
+    ("Sync repo list in config with source control host", "sync-config"),
+    ("Report current configuration", "list-config"),
+    ("Report unpublished pypi packages", "pypi-status"),
+    ("Update all branches from main", "update-from-main"),
+    ("Prune all branches", "prune-all"),
+    ("Cross-repo report", "cross-repo-report"),
+    ("Cross-repo sync", "cross-repo-sync"),
+    ("Cross-repo Template Initialization", "cross-repo-init"),
+    ("Update poetry lock files", "poetry-relock"),
+    ("Main Menu", "Main Menu"),
+)
+
+CATEGORIES: dict[str, frozenset[str]] = {
+    "Repository Commands": frozenset({"list-repos", "clone-all", "pull-all", "local-changes", "not-repo", "Main Menu"}),
+    "Branch Commands": frozenset({"update-from-main", "prune-all", "Main Menu"}),
+    "Configuration Commands": frozenset({"init", "sync-config", "list-config", "Main Menu"}),
+    "PyPI Commands": frozenset({"pypi-status", "Main Menu"}),
+    "Source Control Host Commands": frozenset({"show-account", "Main Menu"}),
+    "Template Sync": frozenset({"cross-repo-report", "cross-repo-sync", "cross-repo-init", "Main Menu"}),
+    "Poetry Commands": frozenset({"poetry-relock", "Main Menu"}),
+    "Exit": frozenset(),
+}
+
+# Menu choices of each category, built once instead of on every trip back to the main menu
+CATEGORY_COMMANDS: dict[str, tuple[tuple[str, str], ...]] = {
+    category: tuple(cmd for cmd in COMMANDS if cmd[1] in names) for category, names in CATEGORIES.items()
+}
 
-    categories: dict[str, list[str]] = {
-        "Repository Commands": ["list-repos", "clone-all", "pull-all", "local-changes", "not-repo", "Main Menu"],
-        "Branch Commands": ["update-from-main", "prune-all", "Main Menu"],
-        "Configuration Commands": ["init", "sync-config", "list-config", "Main Menu"],
-        "PyPI Commands": ["pypi-status", "Main Menu"],
-        "Source Control Host Commands": ["show-account", "Main Menu"],
-        "Template Sync": ["cross-repo-report", "cross-repo-sync", "cross-repo-init", "Main Menu"],
-        "Poetry Commands": ["poetry-relock", "Main Menu"],
-        "Exit": [],
-    }
 
+def get_command_info(args: argparse.Namespace) -> Optional[str]:
     # Convert commands list to a dictionary for easier lookup
     # command_lookup = {description: cmd for description, cmd in commands}
 
-    # Category selection
-    category_questions = [inquirer.List("category", message="Choose a category", choices=list(categories.keys()))]
+    # Category and command asked in one prompt, the command choices depend on the category answer
+    questions = [
+        inquirer.List("category", message="Choose a category", choices=list(CATEGORIES)),
+        inquirer.List(
+            "command",
+            message="Choose a command",
+            choices=lambda answers: CATEGORY_COMMANDS[answers["category"]],
+            ignore=lambda answers: answers["category"] == "Exit",
+        ),
+    ]
     while True:
-        category_answer = inquirer.prompt(category_questions)
-        handle_control_c(category_answer)
-        selected_category = category_answer["category"]
-        if selected_category == "Exit":
+        answers = inquirer.prompt(questions)
+        handle_control_c(answers)
+        if answers["category"] == "Exit":
             sys.exit()
 
-        # Command selection within the chosen category
-        command_questions = [
-            inquirer.List(
-                "command",
-                message="Choose a command",
-                choices=[cmd for cmd in commands if cmd[1] in categories[selected_category]],
-            )
-        ]
-        command_answer = inquirer.prompt(command_questions)
-        handle_control_c(command_answer)
-        selected_command = command_answer["command"]
+        selected_command = answers["command"]
         if selected_command == "Main Menu":
             continue
         args.command = selected_command
@@ -111,8 +114,10 @@ def ask_for_host(config_manager: ConfigManager) -> str:
     Main function to run the UI that queries configuration statuses and asks the user for further actions.
     """
     config_status = config_manager.load_config_objects()
-    configured_options = [service for service, is_configured in config_status.items() if is_configured]
-    unconfigured_options = [service for service, is_configured in config_status.items() if not is_configured]
+    configured_options: list[str] = []
+    unconfigured_options: list[str] = []
+    for service, is_configured in config_status.items():
+        (configured_options if is_configured else unconfigured_options).append(service)
 
     if len(configured_options) == 3:
         message = "Select a source host"
@@ -0,0 +1,161 @@
+"""
+Personal Access Token (PAT) checks and setup, shared by the GitHub and GitLab commands.
+"""
+
+import atexit
+import functools
+import getpass
+import hashlib
+import logging
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+from dotenv import set_key
+
+from git_mirror.disk_cache import read_cache, write_cache
+from git_mirror.safe_env import env_info, loaded_dotenv_path
+from git_mirror.ui import console_with_theme
+
+LOGGER = logging.getLogger(__name__)
+
+console = console_with_theme()
+
+# Setup checks the same token again on back to back runs, a recent answer from the host is reused
+PAT_CACHE_TTL = 300
+# Just the profile fields show-account prints, plus the ids, are cached
+PROFILE_FIELDS = (
+    "id",
+    "login",
+    "username",
+    "name",
+    "bio",
+    "public_repos",
+    "followers",
+    "following",
+    "location",
+    "company",
+)
+
+# Setup blocks on the check, a dead network gets a short deadline and one quick retry instead of a long wait
+PAT_TIMEOUT = httpx.Timeout(3.0, connect=2.0)
+PAT_ATTEMPTS = 2
+PAT_RETRY_DELAY = 0.2
+
+
+@functools.lru_cache(maxsize=None)
+def _client() -> httpx.Client:
+    """One pooled client for all checks, so checking the new token reuses the connection of the old one."""
+    client = httpx.Client(timeout=PAT_TIMEOUT, limits=httpx.Limits(max_keepalive_connections=4))
+    atexit.register(client.close)
+    return client
+
+
+def _cache_key(host: str, token: str) -> str:
+    # Keyed by a hash, the token itself is never written to the cache
+    return f"{host}:" + hashlib.sha256(token.encode()).hexdigest()
+
+
+def check_pat_validity(host: str, user_url: str, token: str, scheme: str) -> Optional[dict[str, Any]]:
+    """
+    Check if a Personal Access Token (PAT) is still valid by fetching the current user.
+
+    Args:
+        host (str): Name of the source host, part of the cache key.
+        user_url (str): The host's API url for the current user.
+        token (str): The Personal Access Token.
+        scheme (str): The authorization scheme the host expects before the token.
+
+    Returns:
+        Optional[dict[str, Any]]: The user the token belongs to, PROFILE_FIELDS only, if it is valid, None otherwise.
+    """
+    cache_key = _cache_key(host, token)
+    cached = read_cache("pat_validity", cache_key, PAT_CACHE_TTL)
+    if cached is not None:
+        return cached or None
+    for attempt in range(1, PAT_ATTEMPTS + 1):
+        try:
+            response = _client().get(user_url, headers={"Authorization": f"{scheme} {token}"})
+            break
+        except httpx.RequestError as e:
+            if attempt == PAT_ATTEMPTS:
+                console.print(f"An error occurred while checking PAT validity: {e}", style="danger")
+                return None
+            LOGGER.debug("PAT check failed, retrying: %s", e)
+            time.sleep(PAT_RETRY_DELAY * attempt)
+    if response.status_code in (401, 403):
+        write_cache("pat_validity", cache_key, False)
+        return None
+    if response.status_code != 200:
+        # throttled or a server error says nothing about the token, so it is not remembered
+        LOGGER.debug("PAT check got status %s", response.status_code)
+        return None
+    # the profile is kept too, so showing the account right after setup doesn't fetch it again
+    profile = response.json()
+    user = {field: profile.get(field) for field in PROFILE_FIELDS}
+    write_cache("pat_validity", cache_key, user)
+    return user
+
+
+def cached_user(host: str, token: str) -> Optional[dict[str, Any]]:
+    """
+    The user a token belongs to, if it was checked in the last few minutes.
+
+    Args:
+        host (str): Name of the source host.
+        token (str): The Personal Access Token.
+
+    Returns:
+        Optional[dict[str, Any]]: The user as returned by the host's API, or None.
+    """
+    return read_cache("pat_validity", _cache_key(host, token), PAT_CACHE_TTL) or None
+
+
+def setup_pat(provider: str, env_var: str, docs_url: str, check: Callable[[str], Optional[dict[str, Any]]]) -> None:
+    """
+    Setup a Personal Access Token (PAT) either globally or locally.
+    Checks if it exists and is valid, then asks the user for their preference
+    on storing the PAT.
+
+    Args:
+        provider (str): Display name of the source host.
+        env_var (str): Environment variable holding the PAT.
+        docs_url (str): The host's documentation for creating a PAT.
+        check (Callable[[str], Optional[dict[str, Any]]]): Gets the PAT's user, None if the PAT isn't valid.
+    """
+    console.print("Checking environment...")
+    env_info()
+    console.print()
+    # Attempt to load existing .env and check for existing PAT
+    loaded_dotenv_path()
+    existing_pat = os.getenv(env_var)
+
+    # Check validity of an existing PAT
+    if existing_pat and check(existing_pat):
+        console.print("Existing PAT is valid.")
+        return
+    console.print("No valid PAT found.")
+
+    console.print(docs_url)
+    console.print("Next we will create a local or global .env file to store the PAT.")
+    # Ask for new PAT
+    new_pat = getpass.getpass(f"Enter your new {provider} PAT: ")
+
+    # Validate the new PAT
+    if not check(new_pat):
+        console.print("The provided PAT is invalid.")
+        return
+
+    # Ask user for global or local setup
+    choice = input("Do you want to save the PAT globally or locally? [G/L]. If you don't know, select globally. ")
+    env_files = {"g": (Path.home() / ".env", "globally"), "l": (Path(".env"), "locally")}
+    env_file = env_files.get(choice.strip().lower())
+    if env_file is None:
+        console.print("Invalid option selected. PAT setup aborted.")
+        return
+    path, where = env_file
+    set_key(path, env_var, new_pat)
+    console.print(f"PAT saved {where} in {path}")
@@ -20,15 +20,16 @@ def log_duration(func: Callable) -> Callable:
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+        # Checked per call, logging is configured after the decorated modules are imported.
+        # isEnabledFor is cached by the logging module, so a disabled logger costs one lookup.
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+        # monotonic, so a clock adjustment mid-call can't produce a negative or inflated duration
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        duration = end_time - start_time
-        minutes, sec = divmod(duration, 60)
-        sec, ms = divmod(sec, 1)
-        LOGGER.info(
-            f"Function {func.__name__} took {int(minutes)} minutes, {int(sec)} seconds, and {int(ms * 1000)} ms to execute."
-        )
+        minutes, ms = divmod((time.perf_counter_ns() - start_ns) // 1_000_000, 60_000)
+        sec, ms = divmod(ms, 1000)
+        LOGGER.info("Function %s took %d minutes, %d seconds, and %d ms to execute.", func.__name__, minutes, sec, ms)
         return result
 
     return wrapper
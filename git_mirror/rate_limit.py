@@ -0,0 +1,79 @@
+"""
+Client side rate limiting, so bulk commands don't run into the host's 429s.
+"""
+
+import logging
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+# Gitlab's default limit for authenticated API traffic is a few hundred requests a minute.
+REQUESTS_PER_MINUTE = 600
+BURST = 60
+
+
+class TokenBucket:
+    """
+    Token bucket, refilled continuously at a fixed rate up to a maximum capacity.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float) -> None:
+        """
+        Args:
+            rate_per_second (float): Tokens added per second.
+            capacity (float): Maximum number of tokens, i.e. the allowed burst.
+        """
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_second)
+        self.last_refill = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket, sleeping until enough are available.
+
+        Args:
+            tokens (float): Number of tokens to take.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        with self.lock:
+            self._refill()
+            while self.tokens < tokens:
+                wait = (tokens - self.tokens) / self.rate_per_second
+                LOGGER.debug("Rate limit reached, waiting %.2f seconds.", wait)
+                time.sleep(wait)
+                waited += wait
+                self._refill()
+            self.tokens -= tokens
+        return waited
+
+
+_BUCKETS: dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def bucket_for(host: str) -> TokenBucket:
+    """
+    Get the bucket shared by all clients talking to a host in this process.
+
+    Args:
+        host (str): The host url.
+
+    Returns:
+        TokenBucket: The shared bucket.
+    """
+    with _BUCKETS_LOCK:
+        if host not in _BUCKETS:
+            _BUCKETS[host] = TokenBucket(REQUESTS_PER_MINUTE / 60, BURST)
+        return _BUCKETS[host]
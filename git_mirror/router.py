@@ -4,15 +4,11 @@ Sends the cli commands to the right method
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import git_mirror.manage_config as mc
-import git_mirror.manage_git as mg
-import git_mirror.manage_github as mgh
-import git_mirror.manage_gitlab as mgl
 from git_mirror.check_cli_deps import check_tool_availability
 from git_mirror.custom_types import SourceHost
-from git_mirror.manage_poetry import PoetryManager
 from git_mirror.safe_env import load_env
 from git_mirror.ui import console_with_theme
 
@@ -23,6 +19,9 @@ LOGGER = logging.getLogger(__name__)
 
 console = console_with_theme()
 
+# The host and git modules pull in PyGithub, python-gitlab and GitPython, so they are imported by the
+# routes that use them, and config-only commands start without them.
+
 
 def route_simple(
     command: str,
@@ -85,6 +84,9 @@ def route_repos(
     dry_run: bool = False,
     template_dir: Optional[Path] = None,
     prompt_for_changes: bool = True,
+    shallow: bool = False,
+    partial_clone: bool = False,
+    jobs: Optional[int] = None,
 ):
     """
     Main function to handle clone-all or pull-all operations, with an option to include forks.
@@ -104,17 +106,23 @@ def route_repos(
         dry_run (bool): Flag to determine whether the operation should be a dry run.
         template_dir (Path): The directory containing the templates to sync.
         prompt_for_changes (bool): Flag to determine whether to prompt for changes.
+        shallow (bool): Flag to clone only recent history.
+        partial_clone (bool): Flag to clone without file contents up front.
+        jobs (Optional[int]): Number of repositories to work on at once, the manager's default if not set.
     """
     if config_path is None:
         config_path = mc.default_config_path()
+    base_path = Path(target_dir).expanduser()
 
     if command == "local-changes":
-        base_path = Path(target_dir).expanduser()
+        import git_mirror.manage_git as mg
+
         git_manager = mg.GitManager(base_path, dry_run, prompt_for_changes=prompt_for_changes)
         git_manager.check_for_uncommitted_or_unpushed_changes()
     elif host in ("github", "gitlab", "selfhosted"):
         if host == "github":
-            base_path = Path(target_dir).expanduser()
+            import git_mirror.manage_github as mgh
+
             manager: SourceHost = mgh.GithubRepoManager(
                 token,
                 base_path,
@@ -123,9 +131,13 @@ def route_repos(
                 include_forks=include_forks,
                 dry_run=dry_run,
                 prompt_for_changes=prompt_for_changes,
+                shallow=shallow,
+                partial_clone=partial_clone,
+                jobs=jobs,
             )
         elif host in ("gitlab", "selfhosted"):
-            base_path = Path(target_dir).expanduser()
+            import git_mirror.manage_gitlab as mgl
+
             manager = mgl.GitlabRepoManager(
                 token,
                 base_path,
@@ -136,10 +148,34 @@ def route_repos(
                 logging_level=logging_level,
                 dry_run=dry_run,
                 prompt_for_changes=prompt_for_changes,
+                shallow=shallow,
+                partial_clone=partial_clone,
+                jobs=jobs,
             )
         else:
             raise ValueError(f"Unknown host: {host}")
 
+        # Commands looked up by name instead of compared one after another
+        commands: dict[str, Callable[[], Any]] = {
+            "clone-all": manager.clone_all,
+            "pull-all": manager.pull_all,
+            "not-repo": manager.not_repo,
+            "build-status": manager.list_repo_builds,
+            "list-repos": manager.list_repos,
+            "update-from-main": manager.update_all_branches,
+            "prune-all": manager.prune_all,
+            "show-account": manager.print_user_summary,
+            "sync-config": lambda: mc.ConfigManager(config_path=config_path).load_and_sync_config(
+                host, manager.list_repo_names()
+            ),
+            "poetry-relock": lambda: relock_poetry(manager, base_path, dry_run, prompt_for_changes, jobs),
+        }
+        template_commands: dict[str, Callable[[Path], Any]] = {
+            "cross-repo-report": manager.cross_repo_sync_report,
+            "cross-repo-sync": manager.cross_repo_sync,
+            "cross-repo-init": manager.cross_repo_init,
+        }
+
         if command == "clone-all" and host in ("gitlab", "selfhosted") and group_id is not None and group_id != 0:
             # TODO: confusion with clone all by user name and by group id.
             # If they are both filled in, then what does the user want?
@@ -154,60 +190,53 @@ def route_repos(
                 logging_level=logging_level,
                 dry_run=dry_run,
                 prompt_for_changes=prompt_for_changes,
+                shallow=shallow,
+                partial_clone=partial_clone,
+                jobs=jobs,
             )
             gl_manager.clone_group(group_id)
-        elif command == "clone-all":
-            manager.clone_all()
-        elif command == "pull-all":
-            manager.pull_all()
-        elif command == "not-repo":
-            manager.not_repo()
-        elif command == "build-status":
-            manager.list_repo_builds()
-        elif command == "list-repos":
-            manager.list_repos()
-        elif command == "update-from-main":
-            manager.update_all_branches()
-        elif command == "prune-all":
-            manager.prune_all()
-        elif command == "show-account":
-            manager.print_user_summary()
-        elif command == "sync-config":
-            config_manager = mc.ConfigManager(config_path=config_path)
-            config_manager.load_and_sync_config(host, manager.list_repo_names())
-        elif command == "cross-repo-report":
-            if not template_dir:
-                console.print("Template directory is required for cross-repo-report")
-                return
-            manager.cross_repo_sync_report(template_dir)
-        elif command == "cross-repo-sync":
+        elif command in template_commands:
             if not template_dir:
-                console.print("Template directory is required for cross-repo-sync")
+                console.print(f"Template directory is required for {command}")
                 return
-            manager.cross_repo_sync(template_dir)
-        elif command == "cross-repo-init":
-            if not template_dir:
-                console.print("Template directory is required for cross-repo-init")
-                return
-            manager.cross_repo_init(template_dir)
-        elif command == "poetry-relock":
-            git_manager = mg.GitManager(base_path, dry_run, prompt_for_changes=prompt_for_changes)
-            poetry_manager = PoetryManager(manager)
-            for repo in git_manager.local_repos_with_file_in_root("pyproject.toml"):
-                poetry_manager.update_dependencies(
-                    main_branch="TODO-lookup",
-                    dependency_update_branch="poetry-update",
-                    reviewer="TODO-config",
-                    project_id=0,  # TODO- config
-                    repo_name=repo.name,  # Github only
-                    user="TODO-lookup",
-                )
+            template_commands[command](template_dir)
+        elif command in commands:
+            commands[command]()
         else:
             console.print(f"Unknown command: {command}")
     else:
         console.print(f"Unknown host: {host}")
 
 
+def relock_poetry(
+    manager: SourceHost, base_path: Path, dry_run: bool, prompt_for_changes: bool, jobs: Optional[int] = None
+) -> None:
+    """
+    Update the poetry lock file of every local repo with a pyproject.toml and open merge requests for the changes.
+
+    Args:
+        manager (SourceHost): The source host manager.
+        base_path (Path): The directory holding the repositories.
+        dry_run (bool): Flag to determine whether the operation should be a dry run.
+        prompt_for_changes (bool): Flag to determine whether to prompt for changes.
+        jobs (Optional[int]): Number of repositories to update at once.
+    """
+    import git_mirror.manage_git as mg
+    from git_mirror.manage_poetry import MAX_WORKERS, PoetryManager
+
+    git_manager = mg.GitManager(base_path, dry_run, prompt_for_changes=prompt_for_changes)
+    poetry_manager = PoetryManager(manager)
+    poetry_manager.update_dependencies_many(
+        git_manager.local_repos_with_file_in_root("pyproject.toml"),
+        main_branch="TODO-lookup",
+        dependency_update_branch="poetry-update",
+        reviewer="TODO-config",
+        project_id=0,  # TODO- config
+        user="TODO-lookup",
+        max_workers=jobs or MAX_WORKERS,
+    )
+
+
 def route_cross_repo(
     command: str,
     user_name: str,
@@ -241,9 +270,11 @@ def route_cross_repo(
         template_dir (Path): The directory containing the templates to sync.
         prompt_for_changes (bool): Flag to determine whether to prompt for changes.
     """
+    base_path = Path(target_dir).expanduser()
     if host in ("github", "gitlab", "selfhosted"):
         if host == "github":
-            base_path = Path(target_dir).expanduser()
+            import git_mirror.manage_github as mgh
+
             manager: SourceHost = mgh.GithubRepoManager(
                 token,
                 base_path,
@@ -254,7 +285,8 @@ def route_cross_repo(
                 prompt_for_changes=prompt_for_changes,
             )
         elif host in ("gitlab", "selfhosted"):
-            base_path = Path(target_dir).expanduser()
+            import git_mirror.manage_gitlab as mgl
+
             manager = mgl.GitlabRepoManager(
                 token,
                 base_path,
@@ -269,24 +301,18 @@ def route_cross_repo(
         else:
             raise ValueError(f"Unknown host: {host}")
 
-        if not template_dir:
-            console.print("Template directory is required for cross-repo-report")
-            return
-
-        if command == "cross-repo-report":
-            manager.cross_repo_sync_report(template_dir)
-        elif command == "cross-repo-sync":
-            if not template_dir:
-                console.print("Template directory is required for cross-repo-sync")
-                return
-            manager.cross_repo_sync(template_dir)
-        elif command == "cross-repo-init":
-            if not template_dir:
-                console.print("Template directory is required for cross-repo-init")
-                return
-            manager.cross_repo_init(template_dir)
-        else:
+        template_commands: dict[str, Callable[[Path], Any]] = {
+            "cross-repo-report": manager.cross_repo_sync_report,
+            "cross-repo-sync": manager.cross_repo_sync,
+            "cross-repo-init": manager.cross_repo_init,
+        }
+        template_command = template_commands.get(command)
+        if template_command is None:
             console.print(f"Unknown command: {command}")
+        elif not template_dir:
+            console.print(f"Template directory is required for {command}")
+        else:
+            template_command(template_dir)
     else:
         console.print(f"Unknown host: {host}")
 
@@ -320,9 +346,11 @@ def route_pypi(
         logging_level (int): The logging level.
         dry_run (bool): Flag to determine whether the operation should be a dry run.
     """
+    base_path = Path(target_dir).expanduser()
     if host in ("github", "gitlab", "selfhosted"):
         if host == "github":
-            base_path = Path(target_dir).expanduser()
+            import git_mirror.manage_github as mgh
+
             manager: SourceHost = mgh.GithubRepoManager(
                 token,
                 base_path,
@@ -332,7 +360,8 @@ def route_pypi(
                 dry_run=dry_run,
             )
         elif host in ("gitlab", "selfhosted"):
-            base_path = Path(target_dir).expanduser()
+            import git_mirror.manage_gitlab as mgl
+
             manager = mgl.GitlabRepoManager(
                 token,
                 base_path,
@@ -346,8 +375,11 @@ def route_pypi(
         else:
             raise ValueError(f"Unknown host: {host}")
 
-        if command == "pypi-status":
-            manager.check_pypi_publish_status(pypi_owner_name=pypi_owner_name)
+        commands: dict[str, Callable[[], Any]] = {
+            "pypi-status": lambda: manager.check_pypi_publish_status(pypi_owner_name=pypi_owner_name),
+        }
+        if command in commands:
+            commands[command]()
         else:
             console.print(f"Unknown command: {command}")
     else:
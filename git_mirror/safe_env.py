@@ -1,8 +1,9 @@
+import functools
 import logging
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv, load_dotenv
 
 from git_mirror.ui import console_with_theme
 
@@ -11,6 +12,8 @@ LOGGER = logging.getLogger(__name__)
 
 LOADED = False
 
+TOKEN_NAMES = ("GITHUB_ACCESS_TOKEN", "GITLAB_ACCESS_TOKEN", "SELFHOSTED_ACCESS_TOKEN")
+
 console = console_with_theme()
 
 
@@ -22,19 +25,15 @@ def load_env() -> None:
         # check if .env file exists in root of home directory and if has any of the 3 expected
         # GITHUB_ACCESS_TOKEN, GITLAB_ACCESS_TOKEN, SELFHOSTED_ACCESS_TOKEN
         global_env = Path.home() / ".env"
-        if global_env.exists() and global_env.is_file():
-            found = 0
-            with open(global_env, encoding="utf-8") as f:
-                for line in f:
-                    if "GITHUB_ACCESS_TOKEN" in line:
-                        found += 1
-                    if "GITLAB_ACCESS_TOKEN" in line:
-                        found += 1
-                    if "SELFHOSTED_ACCESS_TOKEN" in line:
-                        found += 1
-            if found > 0:
+        if global_env.is_file():
+            # Parsed once, the same values decide whether to use this file and are then loaded
+            values = dotenv_values(global_env)
+            if any(token in values for token in TOKEN_NAMES):
                 LOGGER.info(f"Found .env file with expected tokens in {global_env}")
-                load_dotenv(global_env)
+                for key, value in values.items():
+                    # like load_dotenv, variables already set win
+                    if value is not None:
+                        os.environ.setdefault(key, value)
                 LOADED = True
                 return
 
@@ -45,6 +44,34 @@ def load_env() -> None:
         console.print("Continuing without .env file.", style="danger")
 
 
+@functools.lru_cache(maxsize=1)
+def _find_dotenv() -> Path:
+    # find_dotenv walks up the folders looking for a .env, the answer doesn't change during a run
+    return Path(find_dotenv())
+
+
+# modification time of each .env file when it was last loaded
+_LOADED_MTIMES: dict[Path, float] = {}
+
+
+def loaded_dotenv_path() -> Path:
+    """
+    Find the nearest .env file and load it, again only if it changed since the last load.
+
+    Returns:
+        Path: The .env file found, or the current folder if there is none.
+    """
+    dotenv_path = _find_dotenv()
+    if not dotenv_path.is_file():
+        return dotenv_path
+    mtime = dotenv_path.stat().st_mtime
+    if _LOADED_MTIMES.get(dotenv_path) != mtime:
+        # values from an edited file replace the ones loaded from it before
+        load_dotenv(dotenv_path, override=dotenv_path in _LOADED_MTIMES)
+        _LOADED_MTIMES[dotenv_path] = mtime
+    return dotenv_path
+
+
 def env_info() -> None:
     console.print(f".env file in current folder exists: {(Path.cwd() / '.env').exists()}")
     console.print(f".env file in home folder exists: {(Path.home() / '.env').exists()}")
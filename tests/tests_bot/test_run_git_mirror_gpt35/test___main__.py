@@ -57,6 +57,9 @@ def test_handle_repos(tmp_path):
     mock_args.dry_run = False
     mock_args.verbose = 1
     mock_args.yes = False
+    mock_args.shallow = False
+    mock_args.partial_clone = False
+    mock_args.jobs = None
 
     with (
         patch("git_mirror.__main__.validate_host_token") as mock_validate_host_token,
@@ -84,6 +87,9 @@ def test_handle_repos(tmp_path):
             logging_level=1,
             dry_run=False,
             prompt_for_changes=True,
+            shallow=False,
+            partial_clone=False,
+            jobs=None,
         )
 
 
@@ -3,7 +3,7 @@ from unittest.mock import ANY, Mock, patch
 
 import pytest
 
-from git_mirror.manage_github import GithubRepoManager
+from git_mirror.manage_github import IO_WORKERS, GithubRepoManager
 
 # To test the `GitRepoManager` class, we can write the following unit tests:
 #
@@ -123,7 +123,7 @@ def test_client_method(mock_repo):
     mock_gh = Mock()
     with patch("git_mirror.manage_github.gh.Github", return_value=mock_gh) as mock_github:
         client = mock_repo.client()
-    mock_github.assert_called_once_with("dummy_token")
+    mock_github.assert_called_once_with("dummy_token", pool_size=IO_WORKERS)
     assert client == mock_gh
 
 
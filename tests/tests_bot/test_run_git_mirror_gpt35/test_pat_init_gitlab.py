@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import pytest
 
+import git_mirror.disk_cache as disk_cache
 from git_mirror.pat_init_gitlab import check_pat_validity, setup_gitlab_pat
 
 # I'll start by looking for potential issues in the provided code snippet:
@@ -19,9 +20,10 @@ from git_mirror.pat_init_gitlab import check_pat_validity, setup_gitlab_pat
 
 
 @pytest.fixture
-def mock_httpx_get():
-    with patch("git_mirror.pat_init_gitlab.httpx.get") as mock_get:
-        yield mock_get
+def mock_httpx_get(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    with patch("git_mirror.pat_common._client") as mock_client:
+        yield mock_client.return_value.get
 
 
 def test_check_pat_validity_valid(mock_httpx_get):
@@ -41,7 +43,7 @@ def test_check_pat_validity_invalid(mock_httpx_get):
 @patch("getpass.getpass", return_value="invalid_token")
 @patch("builtins.input", return_value="g")
 def test_setup_gitlab_pat_invalid_pat(mock_input, mock_getpass):
-    with patch("git_mirror.pat_init_gitlab.console.print") as mock_print:
+    with patch("git_mirror.pat_common.console.print") as mock_print:
         setup_gitlab_pat()
         mock_print.assert_called_with("The provided PAT is invalid.")
 
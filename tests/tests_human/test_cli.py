@@ -46,9 +46,20 @@ def test_cli_clone_all(mock_main_github, cli_args):
         dry_run=False,
         group_id=0,
         prompt_for_changes=True,
+        shallow=False,
+        partial_clone=False,
+        jobs=None,
     )
 
 
+@pytest.mark.parametrize("jobs", ["0", "-2", "many"])
+def test_cli_rejects_bad_jobs(cli_args, jobs):
+    argv = ["git_mirror", "clone-all", "--jobs", jobs] + cli_args
+    with patch("sys.argv", argv), pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 2
+
+
 # Test missing GitHub token
 @patch("git_mirror.router.route_repos")
 @patch("git_mirror.pat_init.setup_github_pat")
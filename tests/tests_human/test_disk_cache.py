@@ -0,0 +1,43 @@
+import pytest
+
+import git_mirror.disk_cache as disk_cache
+
+
+@pytest.fixture(autouse=True)
+def temp_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+
+
+def test_round_trip():
+    disk_cache.write_cache("things", "key", {"a": 1})
+    assert disk_cache.read_cache("things", "key", 60) == {"a": 1}
+
+
+def test_expired_value_is_missing():
+    disk_cache.write_cache("things", "key", "value")
+    assert disk_cache.read_cache("things", "key", -1) is None
+
+
+def test_invalidate():
+    disk_cache.write_cache("things", "key", "value")
+    disk_cache.invalidate_cache("things", "key")
+    assert disk_cache.read_cache("things", "key", 60) is None
+
+
+def test_missing_file_is_missing():
+    assert disk_cache.read_cache("nothing", "key", 60) is None
+
+
+def test_cache_batch_saves_on_flush():
+    disk_cache.write_cache("things", "old", 1)
+    batch = disk_cache.CacheBatch("things")
+    batch.write("new", 2)
+
+    assert batch.read("old", 60) == 1
+    assert batch.read("new", 60) == 2
+    assert disk_cache.read_cache("things", "new", 60) is None
+
+    batch.flush()
+
+    assert disk_cache.read_cache("things", "new", 60) == 2
+    assert disk_cache.read_cache("things", "old", 60) == 1
@@ -0,0 +1,33 @@
+import git as g
+
+from git_mirror.manage_git import delete_local_branches
+
+
+def init_repo(tmp_path):
+    repo = g.Repo.init(tmp_path / "repo")
+    (tmp_path / "repo" / "README.md").write_text("# Test Repository\n")
+    repo.index.add(["README.md"])
+    repo.index.commit("Initial commit")
+    return repo
+
+
+def test_delete_local_branches_reports_unmerged(tmp_path):
+    repo = init_repo(tmp_path)
+    main = repo.active_branch
+    repo.create_head("merged")
+    unmerged = repo.create_head("unmerged")
+    unmerged.checkout()
+    (tmp_path / "repo" / "other.txt").write_text("not on main")
+    repo.index.add(["other.txt"])
+    repo.index.commit("Unmerged work")
+    main.checkout()
+
+    errors = delete_local_branches(repo, ["merged", "unmerged"])
+
+    assert list(errors) == ["unmerged"]
+    assert {head.name for head in repo.heads} == {main.name, "unmerged"}
+
+
+def test_delete_local_branches_nothing_to_do(tmp_path):
+    repo = init_repo(tmp_path)
+    assert delete_local_branches(repo, []) == {}
@@ -0,0 +1,16 @@
+from git_mirror.manage_git import find_git_repos, iter_git_repos
+
+
+def test_iter_git_repos_skips_git_internals(tmp_path):
+    repo = tmp_path / "repo"
+    # something that looks like a repo, but is inside git's own folder
+    (repo / ".git" / "modules" / "sub" / ".git").mkdir(parents=True)
+
+    assert list(iter_git_repos(tmp_path)) == [repo]
+
+
+def test_find_git_repos_matches_iter(tmp_path):
+    for name in ("a", "b", "nested/c"):
+        (tmp_path / name / ".git").mkdir(parents=True)
+
+    assert sorted(find_git_repos(tmp_path)) == sorted(iter_git_repos(tmp_path))
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+import git_mirror.disk_cache as disk_cache
+import git_mirror.manage_git as mg
+
+
+@pytest.fixture(autouse=True)
+def temp_cache_dir(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: cache)
+
+
+def test_cached_repos_skip_walk(tmp_path, monkeypatch):
+    base_dir = tmp_path / "repos"
+    (base_dir / "one" / ".git").mkdir(parents=True)
+    mg.remember_git_repos(base_dir, mg.find_git_repos(base_dir))
+
+    monkeypatch.setattr(mg, "find_git_repos", lambda _: pytest.fail("should use cache"))
+
+    assert mg.find_git_repos_cached(base_dir) == [base_dir / "one"]
+
+
+def test_new_repo_invalidates_cache(tmp_path):
+    base_dir = tmp_path / "repos"
+    (base_dir / "one" / ".git").mkdir(parents=True)
+    mg.remember_git_repos(base_dir, mg.find_git_repos(base_dir))
+    # make sure mtime moves even on coarse filesystems
+    (base_dir / "two" / ".git").mkdir(parents=True)
+    stat = base_dir.stat()
+    os.utime(base_dir, (stat.st_atime, stat.st_mtime + 10))
+
+    assert sorted(mg.find_git_repos_cached(base_dir)) == [base_dir / "one", base_dir / "two"]
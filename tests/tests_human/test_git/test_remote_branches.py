@@ -0,0 +1,46 @@
+import git as g
+import pytest
+
+import git_mirror.disk_cache as disk_cache
+from git_mirror.manage_git import remote_branch_names
+
+
+@pytest.fixture(autouse=True)
+def cache_in_tmp(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: cache)
+
+
+def test_remote_branch_names_from_ls_remote(tmp_path):
+    origin = g.Repo.init(tmp_path / "origin")
+    (tmp_path / "origin" / "README.md").write_text("# Test Repository\n")
+    origin.index.add(["README.md"])
+    origin.index.commit("Initial commit")
+    origin.create_head("feature/nested")
+    clone = origin.clone(tmp_path / "clone")
+
+    assert remote_branch_names(clone) == {origin.active_branch.name, "feature/nested"}
+
+    # Served from the cache while fresh
+    origin.create_head("later")
+    assert "later" not in remote_branch_names(clone)
+
+
+def test_remote_branch_names_without_origin(tmp_path):
+    repo = g.Repo.init(tmp_path / "repo")
+    assert remote_branch_names(repo) is None
+
+
+def test_remote_branch_names_does_not_cache_the_url(tmp_path):
+    origin = g.Repo.init(tmp_path / "origin")
+    (tmp_path / "origin" / "README.md").write_text("# Test Repository\n")
+    origin.index.add(["README.md"])
+    origin.index.commit("Initial commit")
+    clone = origin.clone(tmp_path / "clone")
+    remote_url = clone.remotes.origin.url
+
+    assert remote_branch_names(clone)
+
+    cached = "".join(path.read_text() for path in (tmp_path / "cache").iterdir())
+    assert remote_url not in cached
@@ -110,3 +110,19 @@ def list_list_repo_actions(github_repo_manager):
     # Assert
     assert messages == expected_messages
     assert len(expected_messages) == 3
+
+
+def test_list_repo_builds_keeps_repo_order(github_repo_manager):
+    repos = []
+    for index in range(5):
+        repo = MagicMock()
+        repo.name = f"repo{index}"
+        run = MagicMock(conclusion="success", display_title=f"run{index}")
+        repo.get_workflow_runs.return_value = iter([run, MagicMock()])
+        repos.append(repo)
+    github_repo_manager.user = MagicMock()
+    github_repo_manager._get_user_repos = lambda: repos
+
+    messages = github_repo_manager.list_repo_builds()
+
+    assert [f"run{index}" in message for index, (_, message) in enumerate(messages)] == [True] * 5
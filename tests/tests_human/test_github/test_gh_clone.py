@@ -59,6 +59,25 @@ def test_clone_all(mock_get_user_repos, mock_clone_from, github_repo_manager, mo
     mock_clone_from.assert_called_once_with(f"{mock_repo.html_url}.git", github_repo_manager.base_dir / mock_repo.name)
 
 
+@patch("git.Repo.clone_from")
+@patch("git_mirror.manage_github.GithubRepoManager._get_user_repos")
+def test_clone_all_threaded(mock_get_user_repos, mock_clone_from, github_repo_manager):
+    repos = []
+    for index in range(6):
+        repo = MagicMock(spec=ghRepository)
+        repo.name = f"repo{index}"
+        repo.html_url = f"https://github.com/fake-user/repo{index}"
+        repo.description = ""
+        repo.private = False
+        repo.fork = False
+        repos.append(repo)
+    mock_get_user_repos.return_value = repos
+
+    github_repo_manager.clone_all()
+
+    assert sorted(call.args[1].name for call in mock_clone_from.call_args_list) == [f"repo{i}" for i in range(6)]
+
+
 @patch("git.Repo.clone_from")
 def test_clone_repo_already_exists(mock_clone_from, github_repo_manager, mock_github_repo, tmp_path):
     # Setup: Create a directory with the same name as the repo to simulate its existence
@@ -97,5 +116,28 @@ def test_clone_repo_clone_failure(mock_clone_from, github_repo_manager, mock_rep
     # Optionally, assert on logging if desired, but requires additional setup to capture log output
 
 
+@patch("git.Repo.clone_from")
+def test_clone_repo_shallow_partial(mock_clone_from, tmp_path, mock_repo):
+    manager = GithubRepoManager("token", tmp_path, "fake-user", shallow=True, partial_clone=True)
+    repo = manager._thread_safe_repos([mock_repo])[0]
+
+    manager._clone_repo((repo, Dummy()))
+
+    options = mock_clone_from.call_args.kwargs["multi_options"]
+    assert options == ["--depth=1", "--single-branch", "--filter=blob:none"]
+
+
+@patch("git.Repo.clone_from")
+@patch("git_mirror.manage_github.ThreadPoolExecutor")
+@patch("git_mirror.manage_github.GithubRepoManager._get_user_repos")
+def test_clone_all_uses_jobs(mock_get_user_repos, mock_executor, mock_clone_from, tmp_path, mock_repo):
+    manager = GithubRepoManager("fake-token", tmp_path, "fake-user", prompt_for_changes=False, jobs=3)
+    mock_get_user_repos.return_value = [mock_repo] * 4
+
+    manager.clone_all()
+
+    mock_executor.assert_called_once_with(max_workers=3)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -43,12 +43,12 @@ def test_not_repo(mock_iterdir, mock_git_repo, tmp_path):
             mock = MagicMock(spec=Repo)
             if path.name == "repo1":
                 remote = MagicMock(spec=Remote)
-                remote.config_reader.get.return_value = "https://github.com/user_login/repo1.git"
+                remote.url = "https://github.com/user_login/repo1.git"
                 mock.remotes = [remote]
 
             elif path.name == "fork_repo":
                 remote = MagicMock(spec=Remote)
-                remote.config_reader.get.return_value = "https://github.com/user_login/fork_repo.git"
+                remote.url = "https://github.com/user_login/fork_repo.git"
                 mock.remotes = [remote]
 
             return mock
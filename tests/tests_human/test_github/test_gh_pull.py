@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from git import GitCommandError
@@ -34,7 +34,7 @@ def test_pull_repo_success(mock_repo_class, github_repo_manager, tmp_path):
     github_repo_manager.pull_repo((repo_path, Dummy()))
 
     mock_repo_class.assert_called_once_with(repo_path)
-    mock_repo_class.return_value.remotes.origin.pull.assert_called_once()
+    mock_repo_class.return_value.git.pull.assert_called_once_with("--ff-only", "--quiet", "origin")
 
 
 @patch("git.Repo")
@@ -44,12 +44,12 @@ def test_pull_repo_failure(mock_repo_class, github_repo_manager, tmp_path):
     create_fake_repo(tmp_path, repo_name)
 
     # Simulate a GitCommandError on pull
-    mock_repo_class.return_value.remotes.origin.pull.side_effect = GitCommandError("pull", "error")
+    mock_repo_class.return_value.git.pull.side_effect = GitCommandError("pull", "error")
 
     github_repo_manager.pull_repo((repo_path, Dummy()))
 
     mock_repo_class.assert_called_once_with(repo_path)
-    mock_repo_class.return_value.remotes.origin.pull.assert_called_once()
+    mock_repo_class.return_value.git.pull.assert_called_once()
 
 
 @patch("git_mirror.manage_github.GithubRepoManager.pull_repo")
@@ -65,3 +65,32 @@ def test_pull_all(mock_pull_repo, github_repo_manager, tmp_path):
     assert mock_pull_repo.call_count == len(repo_names)
     for name in repo_names:
         mock_pull_repo.assert_any_call((tmp_path / name, ANY))
+
+
+@patch("git_mirror.manage_github.GithubRepoManager.pull_repo")
+def test_pull_all_threaded_shares_one_lock(mock_pull_repo, github_repo_manager, tmp_path):
+    repo_names = [f"repo{index}" for index in range(5)]
+    for name in repo_names:
+        create_fake_repo(tmp_path, name)
+
+    github_repo_manager.pull_all()
+
+    assert sorted(call.args[0][0].name for call in mock_pull_repo.call_args_list) == repo_names
+    assert len({id(call.args[0][1]) for call in mock_pull_repo.call_args_list}) == 1
+
+
+def test_update_all_branches_reads_default_branch_from_listing(github_repo_manager, tmp_path):
+    create_fake_repo(tmp_path, "repo1")
+    listed = MagicMock()
+    listed.name = "repo1"
+    listed.default_branch = "trunk"
+    client = MagicMock()
+    github_repo_manager.client = lambda: client
+
+    with patch.object(github_repo_manager, "_get_user_repos", return_value=[listed]), patch.object(
+        github_repo_manager, "_update_local_branches"
+    ) as update:
+        github_repo_manager.update_all_branches(single_threaded=True)
+
+    assert update.call_args.args[0].default_branch == "trunk"
+    client.get_repo.assert_not_called()
@@ -5,7 +5,10 @@ from unittest.mock import MagicMock, patch
 import github as gh
 import pytest
 
+import git_mirror.disk_cache as disk_cache
+from git_mirror.disk_cache import write_cache
 from git_mirror.manage_github import GithubRepoManager
+from git_mirror.pat_common import _cache_key
 
 # Assuming LOGGER is defined in the module where GithubRepoManager is defined
 LOGGER = logging.getLogger(__name__)
@@ -57,6 +60,10 @@ def test_get_user_repos_includes_correct_repos(github_repo_manager, mock_github,
     assert repos[0] == mock_github_repo
     mock_user.get_repos.assert_called_once()
 
+    # The repository list is reused within the same command
+    github_repo_manager._get_user_repos(ignore_users_filters=True)
+    mock_user.get_repos.assert_called_once()
+
 
 def test_get_user_repos_handles_github_exception(github_repo_manager, mock_github):
     # Setup to raise exception
@@ -73,5 +80,17 @@ def test_get_user_repos_handles_github_exception(github_repo_manager, mock_githu
     mock_user.get_repos.assert_called_once_with()
 
 
+def test_print_user_summary_uses_profile_from_pat_check(github_repo_manager, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    write_cache("pat_validity", _cache_key("github", "fake-token"), {"login": "fake-user", "name": "Fake Name"})
+    client = MagicMock()
+    github_repo_manager.client = lambda: client
+
+    github_repo_manager.print_user_summary()
+
+    client.get_user.assert_not_called()
+    assert "Fake Name" in capsys.readouterr().out
+
+
 if __name__ == "__main__":
     pytest.main()
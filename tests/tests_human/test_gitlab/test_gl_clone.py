@@ -97,5 +97,49 @@ def test_clone_repo_clone_failure(mock_clone_from, gitlab_repo_manager, mock_git
     # Optionally, assert on logging if desired, but requires additional setup to capture log output
 
 
+@patch("git.Repo.clone_from")
+def test_clone_repo_shallow_partial(mock_clone_from, gitlab_repo_manager, mock_gitlab_repo):
+    gitlab_repo_manager.shallow = True
+    gitlab_repo_manager.partial_clone = True
+    mock_gitlab_repo = gitlab_repo_manager._thread_safe_repos([mock_gitlab_repo])[0]
+
+    gitlab_repo_manager._clone_repo((mock_gitlab_repo, Dummy()))
+
+    options = mock_clone_from.call_args.kwargs["multi_options"]
+    assert options == ["--depth=1", "--single-branch", "--filter=blob:none"]
+
+
+def test_get_group_projects_walks_subgroups(gitlab_repo_manager):
+    # group 1 has subgroups 2 and 3, group 2 has subgroup 4
+    tree = {1: [2, 3], 2: [4], 3: [], 4: []}
+
+    def get_group(group_id, lazy):
+        group = MagicMock(id=group_id)
+        group.projects.list.return_value = [f"project{group_id}"]
+        group.subgroups.list.return_value = [MagicMock(id=child) for child in tree[group_id]]
+        return group
+
+    mgl = MagicMock()
+    mgl.groups.get.side_effect = get_group
+    gitlab_repo_manager.client = lambda: mgl
+
+    projects = gitlab_repo_manager._get_group_projects(1)
+
+    assert projects == ["project1", "project2", "project3", "project4"]
+
+
+def test_clone_group_skips_name_collisions_with_warning(gitlab_repo_manager, caplog):
+    first = MagicMock(path="api", path_with_namespace="group/team-a/api")
+    second = MagicMock(path="api", path_with_namespace="group/team-b/api")
+    other = MagicMock(path="web", path_with_namespace="group/web")
+
+    with caplog.at_level("WARNING", logger="git_mirror.manage_gitlab"):
+        projects = gitlab_repo_manager._drop_name_collisions([first, second, other])
+
+    assert projects == [first, other]
+    assert "group/team-a/api" in caplog.text
+    assert "group/team-b/api" in caplog.text
+
+
 if __name__ == "__main__":
     pytest.main()
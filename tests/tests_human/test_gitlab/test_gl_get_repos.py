@@ -1,16 +1,23 @@
 import logging
+import pickle
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from gitlab.v4.objects import Project
 
-from git_mirror.manage_gitlab import GitlabRepoManager
+from git_mirror.manage_gitlab import HTTP_POOL_SIZE, HTTP_RETRY, IO_WORKERS, GitlabRepoManager
 
 # Assuming LOGGER is defined in the module where GitlabRepoManager is defined
 LOGGER = logging.getLogger(__name__)
 
 
+class ProjectPages(list):
+    """One page of projects, like the RESTObjectList python-gitlab returns with iterator=True."""
+
+    total_pages = 1
+
+
 @pytest.fixture
 def gitlab_repo_manager():
     token = "fake-token"
@@ -39,6 +46,8 @@ def mock_gitlab_repo():
     mock.namespace = {"path": "fake-user"}
     mock.forked_from_project = False
     mock.http_url_to_repo = "http://example.com"
+    mock.path = "repo"
+    mock.visibility = "public"
     return mock
 
 
@@ -49,7 +58,7 @@ def test_get_user_repos_includes_correct_repos(gitlab_repo_manager, mock_gitlab,
     mgl.projects = MagicMock()
     mock_gitlab_repo.id = 1
     mock_gitlab_repo.namespace = {"path": "fake-user"}
-    mgl.projects.list.return_value = [mock_gitlab_repo]
+    mgl.projects.list.return_value = ProjectPages([mock_gitlab_repo])
     mgl.projects.get.return_value = mock_gitlab_repo
 
     gitlab_repo_manager.client = lambda: mgl
@@ -59,6 +68,41 @@ def test_get_user_repos_includes_correct_repos(gitlab_repo_manager, mock_gitlab,
     # Assertions
     assert len(repos) == 1
     assert repos[0] == mock_gitlab_repo
+    mgl.projects.get.assert_not_called()
+    assert mgl.projects.list.call_args.kwargs["per_page"] == 100
+    assert mgl.projects.list.call_args.kwargs["order_by"] == "id"
+
+    # The project list is reused within the same command
+    gitlab_repo_manager._get_user_repos()
+    mgl.projects.list.assert_called_once()
+
+
+def test_list_projects_fetches_remaining_pages(gitlab_repo_manager):
+    def list_projects(**kwargs):
+        if kwargs.get("iterator"):
+            first_page = ProjectPages(["p1", "p2"])
+            first_page.total_pages = 3
+            return first_page
+        return [f"page{kwargs['page']}"]
+
+    mgl = MagicMock()
+    mgl.projects.list.side_effect = list_projects
+    gitlab_repo_manager.client = lambda: mgl
+
+    assert gitlab_repo_manager._list_projects(owned=True) == ["p1", "p2", "page2", "page3"]
+    assert all(call.kwargs["owned"] for call in mgl.projects.list.call_args_list)
+
+
+@pytest.mark.parametrize("total_pages", [None, 21])
+def test_list_projects_falls_back_to_keyset(gitlab_repo_manager, total_pages):
+    first_page = ProjectPages(["p1"])
+    first_page.total_pages = total_pages
+    mgl = MagicMock()
+    mgl.projects.list.side_effect = [first_page, iter(["p1", "p2"])]
+    gitlab_repo_manager.client = lambda: mgl
+
+    assert gitlab_repo_manager._list_projects(owned=True) == ["p1", "p2"]
+    assert mgl.projects.list.call_args.kwargs["pagination"] == "keyset"
 
 
 def test_get_user_repos_handles_gitlab_exception(gitlab_repo_manager, mock_gitlab, mock_gitlab_repo):
@@ -78,5 +122,32 @@ def test_get_user_repos_handles_gitlab_exception(gitlab_repo_manager, mock_gitla
     assert repos == []
 
 
+def test_client_is_reused_and_not_pickled(gitlab_repo_manager):
+    client = gitlab_repo_manager.client()
+
+    assert gitlab_repo_manager.client() is client
+    copy = pickle.loads(pickle.dumps(gitlab_repo_manager))
+    assert copy._client is None
+
+
+def test_client_pools_connections_for_worker_threads(tmp_path):
+    manager = GitlabRepoManager("token", tmp_path, "user_login")
+    with patch("git_mirror.manage_gitlab.HTTPAdapter") as adapter_class:
+        client = manager.client()
+
+    adapter_class.assert_called_once_with(
+        pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY
+    )
+    assert client.session.get_adapter("https://gitlab.com/api/v4/projects") is adapter_class.return_value
+    assert HTTP_POOL_SIZE >= IO_WORKERS
+
+
+def test_client_retries_server_errors(tmp_path):
+    manager = GitlabRepoManager("token", tmp_path, "user_login")
+    retries = manager.client().session.get_adapter("https://gitlab.com/api/v4/projects").max_retries
+    assert 503 in retries.status_forcelist
+    assert 429 not in retries.status_forcelist
+
+
 if __name__ == "__main__":
     pytest.main()
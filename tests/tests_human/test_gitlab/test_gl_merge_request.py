@@ -0,0 +1,45 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import git_mirror.disk_cache as disk_cache
+from git_mirror.manage_gitlab import GitlabRepoManager
+
+
+@pytest.fixture
+def gitlab_repo_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    return GitlabRepoManager("token", Path("/fake/path"), "user_login", prompt_for_changes=False)
+
+
+def test_merge_request_assigns_user_and_reviewer(gitlab_repo_manager):
+    mgl = MagicMock()
+    user = MagicMock(id=1)
+    reviewer = MagicMock(id=2)
+    mgl.users.list.side_effect = lambda username, get_all: [user if username == "user_login" else reviewer]
+    mgl.users.get.return_value = user
+    project = mgl.projects.get.return_value
+    project.attributes = {"id": 42}
+    gitlab_repo_manager.client = lambda: mgl
+
+    gitlab_repo_manager.merge_request("feature", "main", "Title", "reviewer", 42, "repo")
+
+    mgl.projects.get.assert_called_once_with(42)
+    payload = project.mergerequests.create.call_args[0][0]
+    assert payload["assignee_ids"] == [1]
+    assert payload["reviewer_ids"] == [2]
+    assert payload["squash"] is True
+    project.mergerequests.create.return_value.merge.assert_called_once()
+
+
+def test_get_project_uses_disk_cache(gitlab_repo_manager):
+    mgl = MagicMock()
+    mgl.projects.get.return_value.attributes = {"id": 42, "path": "repo"}
+    gitlab_repo_manager.client = lambda: mgl
+
+    gitlab_repo_manager._get_project(42)
+    project = gitlab_repo_manager._get_project(42)
+
+    mgl.projects.get.assert_called_once_with(42)
+    assert project.path == "repo"
@@ -12,6 +12,12 @@ from git_mirror.manage_gitlab import GitlabRepoManager
 LOGGER = logging.getLogger(__name__)
 
 
+class ProjectPages(list):
+    """One page of projects, like the RESTObjectList python-gitlab returns with iterator=True."""
+
+    total_pages = 1
+
+
 @patch("git.Repo")
 @patch("git_mirror.manage_git.find_git_repos")
 def test_not_repo(mock_iterdir, mock_git_repo, tmp_path):
@@ -40,7 +46,7 @@ def test_not_repo(mock_iterdir, mock_git_repo, tmp_path):
             mock = MagicMock(spec=Repo)
             if path.name == "repo1":
                 remote = MagicMock(spec=Remote)
-                remote.config_reader.get.return_value = "https://gitlab.com/user_login/repo1.git"
+                remote.url = "https://gitlab.com/user_login/repo1.git"
                 remote.id = 1
                 remote.forked_from_project = False
                 mock.remotes = [remote]
@@ -48,7 +54,7 @@ def test_not_repo(mock_iterdir, mock_git_repo, tmp_path):
             elif path.name == "fork_repo":
                 remote = MagicMock(spec=Remote)
                 remote.id = 2
-                remote.config_reader.get.return_value = "https://gitlab.com/user_login/fork_repo.git"
+                remote.url = "https://gitlab.com/user_login/fork_repo.git"
                 remote.forked_from_project = True
                 mock.remotes = [remote]
 
@@ -79,7 +85,7 @@ def test_not_repo(mock_iterdir, mock_git_repo, tmp_path):
     mgl = MagicMock()
 
     mgl.projects.get = get
-    mgl.projects.list.return_value = [mock_user_repo, mock_fork_repo]
+    mgl.projects.list.return_value = ProjectPages([mock_user_repo, mock_fork_repo])
     manager.client = lambda: mgl
     no_remote, not_found, is_fork, not_repo = manager.not_repo()
 
@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -110,3 +110,30 @@ def list_list_repo_actions(gitlab_repo_manager):
     # Assert
     assert messages == expected_messages
     assert len(expected_messages) == 3
+
+
+def test_list_repo_builds_keeps_project_order(gitlab_repo_manager):
+    projects = []
+    for i in range(5):
+        project = MagicMock()
+        project.name = f"project{i}"
+        project.pipelines.list.return_value = [
+            MagicMock(updated_at="2021-01-01", id=str(i), status="success", web_url=f"http://example.com/{i}")
+        ]
+        projects.append(project)
+    gitlab_repo_manager._get_user_repos = lambda: projects
+
+    messages = gitlab_repo_manager.list_repo_builds()
+
+    assert [message.split(" - ")[1] for _, message in messages] == [f"Pipeline #{i}" for i in range(5)]
+
+
+def test_loop_pipelines_unknown_status_does_not_raise(gitlab_repo_manager):
+    pipeline = MagicMock(updated_at="2021-01-01", id="9", status="manual", web_url="http://example.com/9")
+
+    with patch("git_mirror.manage_gitlab.colored") as colored:
+        messages = gitlab_repo_manager._loop_pipelines([pipeline])
+
+    assert messages[0][0] == "manual"
+    # Shown uncolored, like unlisted conclusions on Github
+    colored.assert_not_called()
@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import git as g
+import pytest
+
+import git_mirror.disk_cache as disk_cache
+from git_mirror.manage_gitlab import GitlabRepoManager
+
+
+@pytest.fixture
+def gitlab_repo_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    return GitlabRepoManager("token", tmp_path, "user_login", prompt_for_changes=False)
+
+
+def test_prune_all_looks_up_remote_branches_once_per_repo(gitlab_repo_manager, tmp_path):
+    for name in ("one", "two", "three"):
+        g.Repo.init(tmp_path / name)
+    gitlab_repo_manager.__dict__["_local_repos"] = [tmp_path / name for name in ("one", "two", "three")]
+
+    def remote_branches(repo_path: Path, repo=None, lock=None):
+        return None if repo_path.name == "two" else frozenset({"main"})
+
+    with patch.object(gitlab_repo_manager, "_remote_branches", side_effect=remote_branches) as lookup, patch.object(
+        gitlab_repo_manager, "_delete_local_branches_if_not_on_host"
+    ) as delete:
+        gitlab_repo_manager.prune_all()
+
+    assert lookup.call_count == 3
+    assert [call.args[0].name for call in delete.call_args_list] == ["one", "three"]
+    assert all(call.args[2] == frozenset({"main"}) for call in delete.call_args_list)
+    # The repo opened for the lookup is handed on instead of being opened again
+    opened = {call.args[0].name: call.args[1] for call in lookup.call_args_list}
+    assert all(call.args[3] is opened[call.args[0].name] for call in delete.call_args_list)
+
+
+def test_all_projects_lists_once_for_concurrent_callers(gitlab_repo_manager):
+    calls = []
+
+    def slow_list_projects(**kwargs):
+        calls.append(kwargs)
+        time.sleep(0.05)
+        return [MagicMock(path="repo")]
+
+    gitlab_repo_manager._list_projects = slow_list_projects
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: gitlab_repo_manager._all_projects(), range(4)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_remote_branches_falls_back_to_api(gitlab_repo_manager, tmp_path):
+    project = MagicMock(path="repo")
+    project.branches.list.return_value = [MagicMock(name="main"), MagicMock(name="dev")]
+    project.branches.list.return_value[0].name = "main"
+    project.branches.list.return_value[1].name = "dev"
+    gitlab_repo_manager._all_projects = lambda: {"repo": project}
+
+    with patch("git_mirror.manage_gitlab.g.Repo"), patch(
+        "git_mirror.manage_gitlab.mg.remote_branch_names", return_value=None
+    ):
+        assert gitlab_repo_manager._remote_branches(tmp_path / "repo") == {"main", "dev"}
+
+    project.branches.list.assert_called_once_with(get_all=True, per_page=100)
+
+
+def test_delete_local_branches_prompts_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+
+    repo = g.Repo.init(tmp_path / "repo")
+    repo.index.commit("initial")
+    for name in ("stale-1", "stale-2", "keep"):
+        repo.create_head(name)
+    manager = GitlabRepoManager("token", tmp_path, "user_login", prompt_for_changes=True)
+    main = repo.active_branch.name
+
+    with patch("git_mirror.manage_gitlab.inquirer.prompt", return_value={"to_delete": ["stale-2"]}) as prompt:
+        manager._delete_local_branches_if_not_on_host(tmp_path / "repo", "user_login/repo", frozenset({main}))
+
+    prompt.assert_called_once()
+    assert prompt.call_args.args[0][0].choices == ["keep", "stale-1", "stale-2"]
+    assert {head.name for head in repo.heads} == {main, "keep", "stale-1"}
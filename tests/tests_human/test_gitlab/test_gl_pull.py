@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from git import GitCommandError
@@ -67,3 +67,60 @@ def test_pull_all(mock_pull_repo, gitlab_repo_manager, tmp_path):
     assert mock_pull_repo.call_count == len(repo_names)
     for name in repo_names:
         mock_pull_repo.assert_any_call((tmp_path / name, ANY))
+
+
+@patch("git_mirror.manage_gitlab.GitlabRepoManager.pull_repo")
+def test_pull_all_threaded_shares_one_lock(mock_pull_repo, gitlab_repo_manager, tmp_path):
+    repo_names = [f"repo{i}" for i in range(6)]
+    for name in repo_names:
+        create_fake_repo(tmp_path, name)
+
+    gitlab_repo_manager.pull_all()
+
+    assert mock_pull_repo.call_count == len(repo_names)
+    locks = {id(call.args[0][1]) for call in mock_pull_repo.call_args_list}
+    assert len(locks) == 1
+
+
+@patch("git_mirror.manage_gitlab.GitlabRepoManager.pull_repo")
+def test_local_repos_walked_once(mock_pull_repo, gitlab_repo_manager, tmp_path):
+    create_fake_repo(tmp_path, "repo1")
+
+    with patch("git_mirror.manage_git.find_git_repos", return_value=[tmp_path / "repo1"]) as find_git_repos:
+        gitlab_repo_manager.pull_all()
+        gitlab_repo_manager.pull_all()
+        assert find_git_repos.call_count == 1
+
+        gitlab_repo_manager.invalidate_local_repos()
+        gitlab_repo_manager.pull_all()
+        assert find_git_repos.call_count == 2
+
+
+@patch("git_mirror.manage_gitlab.GitlabRepoManager._update_local_branches")
+def test_update_all_branches_passes_default_branch(mock_update, gitlab_repo_manager, tmp_path):
+    create_fake_repo(tmp_path, "repo1")
+    create_fake_repo(tmp_path, "unknown")
+    project = MagicMock(default_branch="trunk")
+    gitlab_repo_manager._all_projects = lambda: {"repo1": project}
+
+    gitlab_repo_manager.update_all_branches()
+
+    default_branches = {call.args[0].repo_path.name: call.args[0].default_branch for call in mock_update.call_args_list}
+    assert default_branches == {"repo1": "trunk", "unknown": None}
+
+
+def test_pull_repo_fast_forwards(gitlab_repo_manager, tmp_path):
+    import git as g
+
+    origin = g.Repo.init(tmp_path / "origin")
+    (tmp_path / "origin" / "README.md").write_text("# Test Repository\n")
+    origin.index.add(["README.md"])
+    origin.index.commit("Initial commit")
+    clone = origin.clone(tmp_path / "clone")
+    (tmp_path / "origin" / "other.txt").write_text("more")
+    origin.index.add(["other.txt"])
+    origin.index.commit("Second commit")
+
+    gitlab_repo_manager.pull_repo((tmp_path / "clone", Dummy()))
+
+    assert clone.head.commit.hexsha == origin.head.commit.hexsha
@@ -1,3 +1,4 @@
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
@@ -49,3 +50,9 @@ def test_check_pypi_publish_status(gitlab_repo_manager, tmp_path, pypi_owner_nam
         # Further assertions can be made based on the `results` structure
     else:
         assert len(results) == 0  # Package should not be listed due to owner mismatch
+
+
+def test_get_latest_commit_date(gitlab_repo_manager, tmp_path):
+    repo = init_git_repo(tmp_path / "dated")
+
+    assert gitlab_repo_manager._get_latest_commit_date(repo) == datetime.fromtimestamp(repo.head.commit.committed_date)
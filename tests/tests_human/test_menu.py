@@ -0,0 +1,44 @@
+import argparse
+
+import pytest
+
+import git_mirror.menu as menu
+
+
+def fake_prompt(*picks):
+    answers_iter = iter(picks)
+    calls = []
+
+    def prompt(questions):
+        calls.append(questions)
+        category, command = next(answers_iter)
+        answers = {"category": category}
+        command_question = questions[1]
+        command_question.answers = answers
+        if command_question.ignore:
+            answers["command"] = None
+        else:
+            assert command in [choice.value for choice in command_question.choices]
+            answers["command"] = command
+        return answers
+
+    return prompt, calls
+
+
+def test_get_command_info_one_prompt_per_menu_trip(monkeypatch):
+    prompt, calls = fake_prompt(("PyPI Commands", "Main Menu"), ("Branch Commands", "prune-all"))
+    monkeypatch.setattr(menu.inquirer, "prompt", prompt)
+    args = argparse.Namespace()
+
+    assert menu.get_command_info(args) == "prune-all"
+    assert args.command == "prune-all"
+    assert len(calls) == 2
+
+
+def test_get_command_info_exit_skips_command_question(monkeypatch):
+    prompt, calls = fake_prompt(("Exit", None))
+    monkeypatch.setattr(menu.inquirer, "prompt", prompt)
+
+    with pytest.raises(SystemExit):
+        menu.get_command_info(argparse.Namespace())
+    assert len(calls) == 1
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import git_mirror.disk_cache as disk_cache
+import git_mirror.pat_common as pat_common
+import git_mirror.pat_init as pat_init
+import git_mirror.pat_init_gitlab as pat_init_gitlab
+
+
+@pytest.fixture(autouse=True)
+def cache_in_tmp(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+
+
+@pytest.mark.parametrize("module", [pat_init, pat_init_gitlab])
+def test_check_pat_validity_reuses_recent_answer(module):
+    with patch.object(pat_common._client(), "get", return_value=httpx.Response(200, json={"login": "me"})) as get:
+        assert module.check_pat_validity("token")
+        assert module.check_pat_validity("token")
+
+    get.assert_called_once()
+
+
+def test_check_pat_validity_does_not_cache_network_errors(monkeypatch):
+    monkeypatch.setattr(pat_common, "PAT_RETRY_DELAY", 0)
+    with patch.object(pat_common._client(), "get", side_effect=httpx.ConnectError("offline")) as get:
+        assert not pat_init.check_pat_validity("token")
+        assert not pat_init.check_pat_validity("token")
+
+    assert get.call_count == 2 * pat_common.PAT_ATTEMPTS
+
+
+def test_check_pat_validity_retries_network_error(monkeypatch):
+    monkeypatch.setattr(pat_common, "PAT_RETRY_DELAY", 0)
+    responses = [httpx.ConnectError("blip"), httpx.Response(200, json={"login": "me"})]
+    with patch.object(pat_common._client(), "get", side_effect=responses) as get:
+        assert pat_init.check_pat_validity("token")["login"] == "me"
+
+    assert get.call_count == 2
+
+
+def test_cached_answer_is_per_host():
+    with patch.object(pat_common._client(), "get", return_value=httpx.Response(200, json={"login": "me"})):
+        assert pat_init.check_pat_validity("token")
+    with patch.object(pat_common._client(), "get", return_value=httpx.Response(401)):
+        assert not pat_init_gitlab.check_pat_validity("token")
+
+
+def test_client_is_reused():
+    assert pat_common._client() is pat_common._client()
+
+
+@pytest.mark.parametrize(("choice", "where"), [("g", "home"), (" L ", "local")])
+def test_setup_pat_saves_where_chosen(tmp_path, monkeypatch, choice, where):
+    monkeypatch.setattr(pat_common.Path, "home", lambda: tmp_path / "home")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_ACCESS_TOKEN", raising=False)
+    (tmp_path / "home").mkdir()
+    monkeypatch.setattr(pat_common, "loaded_dotenv_path", lambda: tmp_path / ".env")
+    monkeypatch.setattr(pat_common.getpass, "getpass", lambda prompt: "new-token")
+    monkeypatch.setattr("builtins.input", lambda prompt: choice)
+
+    pat_common.setup_pat("GitHub", "GITHUB_ACCESS_TOKEN", "https://docs", lambda token: token == "new-token")
+
+    env_file = tmp_path / "home" / ".env" if where == "home" else tmp_path / ".env"
+    assert "GITHUB_ACCESS_TOKEN='new-token'" in env_file.read_text()
+
+
+def test_cached_user_comes_from_validity_check():
+    with patch.object(pat_common._client(), "get", return_value=httpx.Response(200, json={"login": "me"})):
+        assert pat_init.check_pat_validity("token")["login"] == "me"
+
+    assert pat_common.cached_user("github", "token")["login"] == "me"
+    assert pat_common.cached_user("gitlab", "token") is None
+
+
+def test_check_pat_validity_does_not_cache_server_errors():
+    with patch.object(pat_common._client(), "get", return_value=httpx.Response(503)) as get:
+        assert not pat_init.check_pat_validity("token")
+        assert not pat_init.check_pat_validity("token")
+
+    assert get.call_count == 2
+
+
+def test_check_pat_validity_caches_rejected_token():
+    with patch.object(pat_common._client(), "get", return_value=httpx.Response(401)) as get:
+        assert not pat_init.check_pat_validity("token")
+        assert not pat_init.check_pat_validity("token")
+
+    get.assert_called_once()
+
+
+def test_check_pat_validity_caches_only_profile_fields():
+    profile = {"id": 1, "login": "me", "email": "me@example.com", "plan": {"name": "free"}}
+    with patch.object(pat_common._client(), "get", return_value=httpx.Response(200, json=profile)):
+        pat_init.check_pat_validity("token")
+
+    cached = pat_common.cached_user("github", "token")
+    assert set(cached) == set(pat_common.PROFILE_FIELDS)
+    assert cached["login"] == "me"
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import stat
+import subprocess  # nosec
+from unittest.mock import MagicMock
+
+import git
+import pytest
+
+import git_mirror.manage_poetry as manage_poetry
+from git_mirror.manage_poetry import PoetryManager, clean_gone_branches, poetry_env
+
+
+@pytest.fixture
+def fake_poetry(tmp_path, monkeypatch):
+    """A poetry stand-in on PATH that records its arguments and working folder."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "poetry.log"
+    script = bin_dir / "poetry"
+    script.write_text(
+        f'#!/bin/sh\necho "$(pwd) $*" >> {log}\n'
+        '[ "$1" = "update" ] && [ -n "$LOCK_CHANGE" ] && echo "$LOCK_CHANGE" >> poetry.lock\n'
+        '[ "$1" = "lock" ] && echo "$(pwd)" > poetry.lock\n'
+        '[ "$1" != "fail" ]\n'
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return log
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stand-in")
+def test_install_runs_in_repo_folder(fake_poetry, tmp_path):
+    repo_folder = tmp_path / "repo"
+    repo_folder.mkdir()
+    cwd = os.getcwd()
+
+    PoetryManager(MagicMock()).install(str(repo_folder))
+
+    assert fake_poetry.read_text().splitlines() == [f"{repo_folder} lock", f"{repo_folder} install --with dev"]
+    assert os.getcwd() == cwd
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stand-in")
+def test_install_reuses_lock_for_same_pyproject(fake_poetry, tmp_path, monkeypatch):
+    monkeypatch.setattr(manage_poetry, "cache_dir", lambda: tmp_path)
+    first, second = tmp_path / "first", tmp_path / "second"
+    for repo_folder in (first, second):
+        repo_folder.mkdir()
+        (repo_folder / "pyproject.toml").write_text("[tool.poetry]\nname = 'same'\n")
+    manager = PoetryManager(MagicMock())
+
+    manager.install(str(first))
+    manager.install(str(second))
+
+    assert [line.split()[1] for line in fake_poetry.read_text().splitlines()] == ["lock", "install", "install"]
+    assert (second / "poetry.lock").read_text() == (first / "poetry.lock").read_text()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stand-in")
+def test_run_poetry_raises_on_failure(fake_poetry, tmp_path):
+
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(PoetryManager(MagicMock())._run_poetry(str(tmp_path), "fail"))
+
+
+def test_update_dependencies_many_reports_failures(tmp_path, monkeypatch):
+    manager = PoetryManager(MagicMock())
+    good, bad = tmp_path / "good", tmp_path / "bad"
+    updated = []
+
+    def update_dependencies(repo_folder, *args):
+        if repo_folder == str(bad):
+            raise subprocess.CalledProcessError(1, ["poetry", "update"])
+        updated.append(repo_folder)
+
+    monkeypatch.setattr(manager, "update_dependencies", update_dependencies)
+
+    failed = manager.update_dependencies_many([good, bad], "main", "poetry-update", 1, "user", "reviewer")
+
+    assert failed == [bad]
+    assert updated == [str(good)]
+
+
+def test_clean_gone_branches_deletes_in_one_call():
+    repo = MagicMock()
+    repo.git.for_each_ref.return_value = "one [gone]\nkept [ahead 1]\ntwo [gone]\nlocal "
+
+    clean_gone_branches(repo)
+
+    repo.git.branch.assert_called_once_with("-D", "one", "two")
+
+
+@pytest.fixture
+def cloned_repo(tmp_path):
+    """A clone with a committed poetry.lock, whose origin is a bare repository in tmp_path."""
+    origin = git.Repo.init(tmp_path / "origin.git", bare=True, initial_branch="main")
+    repo = git.Repo.clone_from(origin.git_dir, tmp_path / "clone")
+    (tmp_path / "clone" / "poetry.lock").write_text("locked\n")
+    repo.index.add(["poetry.lock"])
+    repo.index.commit("initial")
+    repo.git.push("origin", "HEAD:main")
+    repo.git.branch("--set-upstream-to=origin/main")
+    return repo
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stand-in")
+def test_update_dependencies_pushes_changed_lock_file(fake_poetry, cloned_repo, monkeypatch):
+    monkeypatch.setenv("LOCK_CHANGE", "updated")
+    host = MagicMock()
+
+    PoetryManager(host).update_dependencies(cloned_repo.working_dir, "main", "poetry-update", 1, "repo", "me", "you")
+
+    origin = git.Repo(cloned_repo.remotes.origin.url)
+    assert "updated" in origin.git.show("poetry-update:poetry.lock")
+    host.merge_request.assert_called_once_with("poetry-update", "main", "Update Poetry lock file", "you", 1, "repo")
+    assert cloned_repo.active_branch.name == "main"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stand-in")
+def test_update_dependencies_pushes_new_lock_file(fake_poetry, cloned_repo, monkeypatch):
+    cloned_repo.index.remove(["poetry.lock"], working_tree=True)
+    cloned_repo.index.commit("no lock file")
+    cloned_repo.git.push("origin", "HEAD:main")
+    monkeypatch.setenv("LOCK_CHANGE", "created")
+    host = MagicMock()
+
+    PoetryManager(host).update_dependencies(cloned_repo.working_dir, "main", "poetry-update", 1, "repo", "me", "you")
+
+    origin = git.Repo(cloned_repo.remotes.origin.url)
+    assert origin.git.show("poetry-update:poetry.lock") == "created"
+    host.merge_request.assert_called_once()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stand-in")
+def test_update_dependencies_without_changes_cleans_up(fake_poetry, cloned_repo):
+    host = MagicMock()
+
+    PoetryManager(host).update_dependencies(cloned_repo.working_dir, "main", "poetry-update", 1, "repo", "me", "you")
+
+    host.merge_request.assert_not_called()
+    assert [head.name for head in cloned_repo.heads] == ["main"]
+    assert not git.Repo(cloned_repo.remotes.origin.url).git.branch("--list", "poetry-update")
+
+
+@pytest.mark.parametrize(
+    ("cpus", "parallel", "max_workers"), [(1, "false", None), (4, "true", "4"), (64, "true", "10")]
+)
+def test_poetry_env_matches_installer_to_cpus(monkeypatch, cpus, parallel, max_workers):
+    monkeypatch.delenv("POETRY_INSTALLER_PARALLEL", raising=False)
+    monkeypatch.delenv("POETRY_INSTALLER_MAX_WORKERS", raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+
+    env = poetry_env()
+
+    assert env["POETRY_INSTALLER_PARALLEL"] == parallel
+    assert env.get("POETRY_INSTALLER_MAX_WORKERS") == max_workers
+
+
+def test_poetry_env_keeps_user_settings(monkeypatch):
+    monkeypatch.setenv("POETRY_INSTALLER_PARALLEL", "false")
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+
+    assert poetry_env()["POETRY_INSTALLER_PARALLEL"] == "false"
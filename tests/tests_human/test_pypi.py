@@ -0,0 +1,221 @@
+import asyncio
+
+import httpx
+
+import git_mirror.disk_cache as disk_cache
+import git_mirror.manage_pypi as manage_pypi
+from git_mirror.manage_pypi import PyPiManager
+
+
+def test_get_infos_bounds_concurrency(monkeypatch):
+    monkeypatch.setattr(manage_pypi, "MAX_CONCURRENT_REQUESTS", 2)
+    manager = PyPiManager()
+    in_flight = 0
+    most_in_flight = 0
+
+    async def fake_get_info(package_name, cache=None, missing_cache=None):
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"name": package_name}, 200
+
+    manager.get_info = fake_get_info
+
+    results = asyncio.run(manager.get_infos([f"package{i}" for i in range(6)]))
+
+    assert most_in_flight == 2
+    assert results["package3"] == ({"name": "package3"}, 200)
+
+
+def test_get_info_retries_throttled_requests(monkeypatch, tmp_path):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(manage_pypi, "RETRY_BACKOFF", 0)
+    statuses = iter([429, 503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={"info": {}})
+
+    manager = PyPiManager()
+    manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    _, status_code = asyncio.run(manager.get_info("package"))
+
+    assert status_code == 200
+
+
+def test_get_with_retries_returns_last_response(monkeypatch):
+    monkeypatch.setattr(manage_pypi, "RETRY_BACKOFF", 0)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    manager = PyPiManager()
+    manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    response = asyncio.run(manager._get_with_retries("https://pypi.org/pypi/package/json"))
+
+    assert response.status_code == 503
+    assert len(calls) == manage_pypi.MAX_RETRIES
+
+
+def test_get_info_revalidates_with_etag(monkeypatch, tmp_path):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(manage_pypi, "PYPI_FRESH_TTL", -1)
+    data = {
+        "info": {"author": "me", "version": "1.0"},
+        "releases": {"0.9": [{"upload_time": "2020-01-01T00:00:00"}], "1.0": [{"upload_time": "2021-01-01T00:00:00"}]},
+    }
+    seen_etags = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=data, headers={"ETag": '"v1"'})
+
+    manager = PyPiManager()
+    manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    first, _ = asyncio.run(manager.get_info("package"))
+    second, status_code = asyncio.run(manager.get_info("package"))
+
+    assert seen_etags == [None, '"v1"']
+    assert status_code == 200
+    assert PyPiManager._get_latest_pypi_release_date(second) == PyPiManager._get_latest_pypi_release_date(first)
+    assert second["info"]["author"] == "me"
+
+
+def test_get_info_skips_request_while_fresh(monkeypatch, tmp_path):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"info": {"author": "me", "version": "1.0"}}, headers={"ETag": '"v1"'})
+
+    manager = PyPiManager()
+    manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    asyncio.run(manager.get_info("package"))
+    data, status_code = asyncio.run(manager.get_info("package"))
+
+    assert len(requests) == 1
+    assert status_code == 200
+    assert data["info"]["author"] == "me"
+
+
+def test_get_info_remembers_missing_packages(monkeypatch, tmp_path):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    manager = PyPiManager()
+    manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    asyncio.run(manager.get_info("unpublished"))
+    data, status_code = asyncio.run(manager.get_info("unpublished"))
+
+    assert len(requests) == 1
+    assert status_code == 404
+    assert data == {}
+
+
+def test_get_infos_survives_html_404(monkeypatch, tmp_path):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "unpublished" in request.url.path:
+            return httpx.Response(404, text="<html>Not Found</html>")
+        return httpx.Response(200, json={"info": {"version": "1.0"}})
+
+    manager = PyPiManager()
+    manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    results = asyncio.run(manager.get_infos(["unpublished", "published"]))
+
+    assert {name: status_code for name, (_, status_code) in results.items()} == {"unpublished": 404, "published": 200}
+
+
+def test_get_info_returns_summary_on_every_path(monkeypatch, tmp_path):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    data = {
+        "info": {"author": "me", "version": "1.0", "description": "long"},
+        "releases": {"0.9": [{"upload_time": "2020-01-01T00:00:00"}], "1.0": [{"upload_time": "2021-01-01T00:00:00"}]},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=data, headers={"ETag": '"v1"'})
+
+    manager = PyPiManager()
+    manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    fetched, _ = asyncio.run(manager.get_info("package"))
+    cached, _ = asyncio.run(manager.get_info("package"))
+
+    assert fetched == cached == manage_pypi._summarize_pypi_data(data)
+
+
+def test_get_infos_saves_cache_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(disk_cache, "cache_dir", lambda: tmp_path)
+    saves = []
+    save = disk_cache._save
+    monkeypatch.setattr(disk_cache, "_save", lambda name, data: saves.append(name) or save(name, data))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"info": {"version": "1.0"}}, headers={"ETag": '"v1"'})
+
+    manager = PyPiManager()
+    manager.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    asyncio.run(manager.get_infos([f"package{i}" for i in range(5)]))
+
+    assert saves == ["pypi"]
+    assert disk_cache.read_cache("pypi", "package4", 60)["etag"] == '"v1"'
+
+
+def test_managers_share_client_per_event_loop():
+    async def clients():
+        return PyPiManager().client, PyPiManager().client
+
+    first, second = asyncio.run(clients())
+    other_loop, _ = asyncio.run(clients())
+
+    assert first is second
+    assert other_loop is not first
+
+
+def test_iter_infos_yields_in_completion_order():
+    manager = PyPiManager()
+
+    async def fake_get_info(package_name, cache=None, missing_cache=None):
+        await asyncio.sleep(0.05 if package_name == "slow" else 0)
+        return {"name": package_name}, 200
+
+    manager.get_info = fake_get_info
+
+    async def collect():
+        return [name async for name, _ in manager.iter_infos(["slow", "fast"])]
+
+    assert asyncio.run(collect()) == ["fast", "slow"]
+
+
+def test_get_infos_reports_progress(capsys):
+    manager = PyPiManager()
+
+    async def fake_get_info(package_name, cache=None, missing_cache=None):
+        return {"name": package_name}, 200
+
+    manager.get_info = fake_get_info
+    done = []
+
+    asyncio.run(manager.get_infos(["one", "two", "three"], lambda: done.append(1)))
+
+    assert len(done) == 3
+    assert capsys.readouterr().out == ""
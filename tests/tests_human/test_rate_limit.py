@@ -0,0 +1,25 @@
+import git_mirror.rate_limit as rate_limit
+from git_mirror.rate_limit import TokenBucket, bucket_for
+
+
+def test_burst_does_not_wait(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    bucket = TokenBucket(rate_per_second=1, capacity=3)
+
+    waited = sum(bucket.acquire() for _ in range(3))
+
+    assert waited == 0
+    assert sleeps == []
+
+
+def test_waits_when_empty():
+    bucket = TokenBucket(rate_per_second=100, capacity=1)
+    bucket.acquire()
+
+    assert bucket.acquire() > 0
+
+
+def test_bucket_shared_per_host():
+    assert bucket_for("https://gitlab.example.com") is bucket_for("https://gitlab.example.com")
+    assert bucket_for("https://gitlab.example.com") is not bucket_for("https://other.example.com")
@@ -0,0 +1,31 @@
+from git_mirror.cross_repo_sync import TemplateSync, require_template_dir
+
+
+class FakeManager:
+    def __init__(self):
+        self._syncer = None
+        self.calls = []
+
+    @require_template_dir
+    def report(self, template_dir):
+        self.calls.append(self._syncer)
+
+
+def test_missing_template_dir_skips_call(tmp_path):
+    manager = FakeManager()
+    manager.report(tmp_path / "missing")
+    manager.report(None)
+    assert manager.calls == []
+
+
+def test_syncer_reused_for_same_template_dir(tmp_path):
+    manager = FakeManager()
+    manager.report(tmp_path)
+    manager.report(tmp_path)
+    assert isinstance(manager.calls[0], TemplateSync)
+    assert manager.calls[0] is manager.calls[1]
+
+    other = tmp_path / "other"
+    other.mkdir()
+    manager.report(other)
+    assert manager.calls[2].templates_dir == other
@@ -58,3 +58,15 @@ def test_write_template_map_with_missing_dirs_use_default_true(template_sync, tm
     assert (
         template_sync.template_map_file.read_text(encoding="utf-8") == expected_content
     ), "Template map should be updated with default template for missing directories"
+
+
+def test_write_template_map_keeps_existing_entries(template_sync, tmp_path):
+    template_sync.use_default = True
+    template_sync.template_map_file = tmp_path / "template_map.txt"
+    template_sync.template_map_file.write_text("existing_dir:custom\n", encoding="utf-8")
+
+    template_sync.write_template_map([tmp_path / "existing_dir", tmp_path / "missing_dir"])
+
+    assert template_sync.template_map_file.read_text(encoding="utf-8") == "existing_dir:custom\nmissing_dir:default\n"
+    assert template_sync.get_template_dir("existing_dir") == template_sync.templates_dir / "custom"
+    assert template_sync.get_template_dir("missing_dir") == template_sync.templates_dir / "default"
@@ -1,4 +1,5 @@
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -40,3 +41,22 @@ def test_compare_files(tmp_path, template_sync, template_content, target_content
 
     # Assert
     assert result == expected_result, f"Expected {expected_result}, got {result}"
+
+
+def test_template_read_once_for_many_targets(tmp_path, template_sync):
+    template_dir = template_sync.templates_dir / "default"
+    template_dir.mkdir()
+    create_file(template_dir / "build.txt", "Build {{{PROJECT_NAME}}}")
+    targets = []
+    for name in ("one", "two", "three"):
+        (tmp_path / name).mkdir()
+        create_file(tmp_path / name / "build.txt", f"Build {name}")
+        targets.append(tmp_path / name)
+    template_sync.template_map = {target.name: "default" for target in targets}
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        results = [template_sync._compare_directories(target, target.name) for target in targets]
+
+    template_opens = [call for call in mock_open.call_args_list if call.args[0] == template_dir / "build.txt"]
+    assert len(template_opens) == 1
+    assert results == [[], [], []]
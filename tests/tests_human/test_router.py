@@ -0,0 +1,30 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from git_mirror import router
+
+
+@patch("git_mirror.manage_github.GithubRepoManager")
+def test_route_cross_repo_dispatches_by_name(manager_class, tmp_path):
+    router.route_cross_repo("cross-repo-sync", "user", tmp_path, "token", "github", False, False, template_dir=tmp_path)
+
+    manager_class.return_value.cross_repo_sync.assert_called_once_with(tmp_path)
+    manager_class.return_value.cross_repo_sync_report.assert_not_called()
+
+
+@patch.object(router.console, "print")
+@patch("git_mirror.manage_github.GithubRepoManager")
+def test_route_cross_repo_requires_template_dir(manager_class, console_print):
+    router.route_cross_repo("cross-repo-init", "user", Path("."), "token", "github", False, False)
+
+    manager_class.return_value.cross_repo_init.assert_not_called()
+    console_print.assert_called_once_with("Template directory is required for cross-repo-init")
+
+
+@patch.object(router.console, "print")
+@patch("git_mirror.manage_github.GithubRepoManager")
+def test_route_pypi_unknown_command(manager_class, console_print):
+    router.route_pypi("pypi-nope", "user", Path("."), "token", "github", False, False)
+
+    manager_class.return_value.check_pypi_publish_status.assert_not_called()
+    console_print.assert_called_once_with("Unknown command: pypi-nope")
@@ -0,0 +1,74 @@
+import os
+from unittest.mock import patch
+
+import git_mirror.safe_env as safe_env
+
+
+def test_loaded_dotenv_path_reloads_only_when_changed(tmp_path, monkeypatch):
+    dotenv_path = tmp_path / ".env"
+    dotenv_path.write_text("A=1\n")
+    monkeypatch.setattr(safe_env, "_find_dotenv", lambda: dotenv_path)
+
+    with patch.object(safe_env, "load_dotenv") as load_dotenv:
+        safe_env.loaded_dotenv_path()
+        safe_env.loaded_dotenv_path()
+        assert load_dotenv.call_count == 1
+
+        dotenv_path.write_text("A=2\n")
+        os.utime(dotenv_path, (1, 1))
+        assert safe_env.loaded_dotenv_path() == dotenv_path
+        assert load_dotenv.call_count == 2
+
+
+def test_loaded_dotenv_path_picks_up_edited_values(tmp_path, monkeypatch):
+    dotenv_path = tmp_path / ".env"
+    dotenv_path.write_text("GIT_MIRROR_TEST_VALUE=old\n")
+    monkeypatch.setattr(safe_env, "_find_dotenv", lambda: dotenv_path)
+    monkeypatch.setattr(safe_env, "_LOADED_MTIMES", {})
+
+    with patch.dict(os.environ, clear=True):
+        safe_env.loaded_dotenv_path()
+        assert os.environ["GIT_MIRROR_TEST_VALUE"] == "old"
+
+        dotenv_path.write_text("GIT_MIRROR_TEST_VALUE=new\n")
+        os.utime(dotenv_path, (1, 1))
+        safe_env.loaded_dotenv_path()
+        assert os.environ["GIT_MIRROR_TEST_VALUE"] == "new"
+
+
+def test_loaded_dotenv_path_without_dotenv(tmp_path, monkeypatch):
+    monkeypatch.setattr(safe_env, "_find_dotenv", lambda: tmp_path / "missing" / ".env")
+
+    with patch.object(safe_env, "load_dotenv") as load_dotenv:
+        safe_env.loaded_dotenv_path()
+
+    load_dotenv.assert_not_called()
+
+
+def test_load_env_uses_home_dotenv_with_tokens(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("GITHUB_ACCESS_TOKEN=from-file\nOTHER=x\nEXISTING=from-file\n")
+    monkeypatch.setattr(safe_env.Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(safe_env, "LOADED", False)
+
+    with (
+        patch.dict(os.environ, {"EXISTING": "already-set"}, clear=True),
+        patch.object(safe_env, "load_dotenv") as load_dotenv,
+    ):
+        safe_env.load_env()
+
+        load_dotenv.assert_not_called()
+        assert os.environ["GITHUB_ACCESS_TOKEN"] == "from-file"
+        assert os.environ["OTHER"] == "x"
+        assert os.environ["EXISTING"] == "already-set"
+
+
+def test_load_env_without_tokens_falls_back_to_cwd(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("UNRELATED=1\n")
+    monkeypatch.setattr(safe_env.Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(safe_env, "LOADED", False)
+
+    with patch.dict(os.environ, clear=True), patch.object(safe_env, "load_dotenv") as load_dotenv:
+        safe_env.load_env()
+
+        load_dotenv.assert_called_once_with()
+        assert "UNRELATED" not in os.environ